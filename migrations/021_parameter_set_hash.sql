@@ -0,0 +1,19 @@
+-- 021_parameter_set_hash.sql
+-- Deduplicate ParameterSets by content.
+--
+-- The bot used to INSERT a fresh ParameterSets row on every startup, even
+-- when the configuration was identical.  database.py now computes a
+-- content hash (blake2b over every ParameterSet field + sampling config)
+-- and upserts on it, so restarts reuse the existing parameter_set_id.
+--
+-- Pre-existing rows keep a NULL hash (NULLs never conflict in a UNIQUE index).
+
+BEGIN;
+
+ALTER TABLE ParameterSets
+    ADD COLUMN IF NOT EXISTS parameter_set_hash TEXT;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_parameter_sets_hash
+    ON ParameterSets(parameter_set_hash);
+
+COMMIT;
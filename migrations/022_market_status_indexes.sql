@@ -0,0 +1,30 @@
+-- 022_market_status_indexes.sql
+-- Composite indexes for per-market lookups.
+--
+-- Attempts(market_id, status): per-market attempt scans filtered by
+-- status (e.g. active attempts for a market) become index range scans.
+-- Snapshots(market_id, cycle_number): per-market snapshot reads come back
+-- already in cycle order.
+--
+-- Both strictly extend the single-column indexes from 001, which are
+-- dropped so inserts don't maintain redundant indexes.
+-- AttemptLifecycle(attempt_id) is already covered by idx_lifecycle_attempt.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_attempts_market_status
+    ON Attempts(market_id, status);
+
+DROP INDEX IF EXISTS idx_attempts_market;
+
+-- Snapshots was dropped by 010 on databases that went through the swap
+DO $$
+BEGIN
+  IF to_regclass('snapshots') IS NOT NULL THEN
+    CREATE INDEX IF NOT EXISTS idx_snapshots_market_cycle
+        ON Snapshots(market_id, cycle_number);
+    DROP INDEX IF EXISTS idx_snapshots_market;
+  END IF;
+END $$;
+
+COMMIT;
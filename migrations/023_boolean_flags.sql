@@ -0,0 +1,23 @@
+-- 023_boolean_flags.sql
+-- Store had_feed_gap / anomaly_flag as native BOOLEAN.
+--
+-- Both were INTEGER 0/1 and database.py coerced the Python bool with
+-- int(...) on every row.  asyncpg now binds the bool directly (1 byte on
+-- the wire instead of 4) and the columns shrink accordingly.
+--
+-- Note: ALTER COLUMN TYPE rewrites the table (all Attempts partitions).
+
+BEGIN;
+
+ALTER TABLE Attempts ALTER COLUMN had_feed_gap DROP DEFAULT;
+ALTER TABLE Attempts
+    ALTER COLUMN had_feed_gap TYPE BOOLEAN USING had_feed_gap <> 0;
+ALTER TABLE Attempts ALTER COLUMN had_feed_gap SET DEFAULT FALSE;
+
+-- Snapshots was dropped by 010 on databases that went through the swap
+ALTER TABLE IF EXISTS Snapshots ALTER COLUMN anomaly_flag DROP DEFAULT;
+ALTER TABLE IF EXISTS Snapshots
+    ALTER COLUMN anomaly_flag TYPE BOOLEAN USING anomaly_flag <> 0;
+ALTER TABLE IF EXISTS Snapshots ALTER COLUMN anomaly_flag SET DEFAULT FALSE;
+
+COMMIT;
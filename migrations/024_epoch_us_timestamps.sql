@@ -0,0 +1,24 @@
+-- 024_epoch_us_timestamps.sql
+-- Add INTEGER epoch-microsecond companions to the TEXT ISO-8601 timestamps.
+--
+-- Every write formatted each datetime with isoformat() and stored ~32
+-- bytes of TEXT; range filters then compared strings.  database.py now
+-- also binds int microseconds since 1970-01-01 UTC into *_ts_us.
+--
+-- The ISO columns are kept (and still written) for the dashboard and
+-- analytics queries; they will be dropped once readers move to *_ts_us.
+--
+-- Step 1 of 2: schema change only (fast, no row rewrite).
+-- Backfill the existing rows separately using:
+--   python scripts/backfill_ts_us.py
+
+BEGIN;
+
+ALTER TABLE Attempts ADD COLUMN IF NOT EXISTS t1_ts_us BIGINT;
+ALTER TABLE Attempts ADD COLUMN IF NOT EXISTS t2_ts_us BIGINT;
+-- Snapshots / AttemptLifecycle were dropped by 010 on databases that went
+-- through the swap; only touch them where they still exist.
+ALTER TABLE IF EXISTS Snapshots ADD COLUMN IF NOT EXISTS ts_us BIGINT;
+ALTER TABLE IF EXISTS AttemptLifecycle ADD COLUMN IF NOT EXISTS ts_us BIGINT;
+
+COMMIT;
@@ -0,0 +1,22 @@
+-- 025_lifecycle_attempt_cycle_index.sql
+-- Composite AttemptLifecycle(attempt_id, cycle_number) index.
+--
+-- Per-attempt lifecycle reads come back already in cycle order instead of
+-- sorting after the attempt_id lookup.  It strictly extends
+-- idx_lifecycle_attempt from 001, which is dropped.
+--
+-- AttemptLifecycle was dropped by 010 on databases that went through the
+-- swap; nothing to do there.
+
+BEGIN;
+
+DO $$
+BEGIN
+  IF to_regclass('attemptlifecycle') IS NOT NULL THEN
+    CREATE INDEX IF NOT EXISTS idx_lifecycle_attempt_cycle
+        ON AttemptLifecycle(attempt_id, cycle_number);
+    DROP INDEX IF EXISTS idx_lifecycle_attempt;
+  END IF;
+END $$;
+
+COMMIT;
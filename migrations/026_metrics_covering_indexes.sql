@@ -0,0 +1,29 @@
+-- 026_metrics_covering_indexes.sql
+-- Covering indexes for the src/metrics.py report aggregates.
+--
+-- Attempts(parameter_set_id, market_id) INCLUDE (status, time_to_pair_seconds):
+-- get_cross_market_consistency and get_stats_by_asset group by market
+-- (directly or through the Markets join) and only read status and
+-- time_to_pair_seconds, so both can run as index-only scans, optionally
+-- narrowed to one parameter set.
+--
+-- Attempts(parameter_set_id, max_adverse_excursion_points) INCLUDE (status):
+-- every get_mae_analysis query filters on a non-NULL MAE and reads only
+-- status besides it.
+--
+-- ANALYZE refreshes planner statistics so the new indexes are picked up
+-- without waiting for autovacuum.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_attempts_ps_market
+    ON Attempts(parameter_set_id, market_id)
+    INCLUDE (status, time_to_pair_seconds);
+
+CREATE INDEX IF NOT EXISTS idx_attempts_ps_mae
+    ON Attempts(parameter_set_id, max_adverse_excursion_points)
+    INCLUDE (status);
+
+ANALYZE Attempts;
+
+COMMIT;
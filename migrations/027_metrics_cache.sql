@@ -0,0 +1,25 @@
+-- 027_metrics_cache.sql
+-- Persistent per-bucket sums for the src/metrics.py histograms.
+--
+-- refresh_metrics_cache() folds settled attempts (attempt_id above the
+-- stored watermark, older than the settle window) into one row per
+-- (parameter_set_id, metric_name, bucket_key).  value_json holds additive
+-- counts and sums, so a report reads O(buckets) rows here and only scans
+-- Attempts past the watermark.
+--
+-- The watermark itself is the row with metric_name = '_watermark'.
+-- Deleting attempts invalidates the sums; clear the table afterwards and
+-- the next refresh rebuilds it.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS MetricsCache (
+    parameter_set_id    INT     NOT NULL,
+    metric_name         TEXT    NOT NULL,
+    bucket_key          INT     NOT NULL,
+    value_json          TEXT    NOT NULL,
+    last_attempt_id     BIGINT  NOT NULL,
+    PRIMARY KEY (parameter_set_id, metric_name, bucket_key)
+);
+
+COMMIT;
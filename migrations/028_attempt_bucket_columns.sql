@@ -0,0 +1,77 @@
+-- 028_attempt_bucket_columns.sql
+-- Report bucket indexes on Attempts, as expression indexes.
+--
+-- Each CASE yields the index into the matching label tuple in
+-- src/metrics.py (time-remaining minute, time to pair, MAE, pair cost,
+-- closest approach) and must match src.database.ATTEMPT_BUCKET_COLUMNS,
+-- which src.metrics inlines into PostgreSQL report SQL.  SQLite stores
+-- them as VIRTUAL generated columns instead.
+--
+-- Indexes rather than STORED generated columns: adding a stored column
+-- rewrites every Attempts partition, whereas an index only reads them.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_attempts_ps_time_remaining_bucket
+    ON Attempts(parameter_set_id, (
+        CASE
+            WHEN time_remaining_at_start >= 840 THEN 0
+            WHEN time_remaining_at_start >= 780 THEN 1
+            WHEN time_remaining_at_start >= 720 THEN 2
+            WHEN time_remaining_at_start >= 660 THEN 3
+            WHEN time_remaining_at_start >= 600 THEN 4
+            WHEN time_remaining_at_start >= 540 THEN 5
+            WHEN time_remaining_at_start >= 480 THEN 6
+            WHEN time_remaining_at_start >= 420 THEN 7
+            WHEN time_remaining_at_start >= 360 THEN 8
+            WHEN time_remaining_at_start >= 300 THEN 9
+            WHEN time_remaining_at_start >= 240 THEN 10
+            WHEN time_remaining_at_start >= 180 THEN 11
+            WHEN time_remaining_at_start >= 120 THEN 12
+            WHEN time_remaining_at_start >= 60 THEN 13
+            WHEN time_remaining_at_start >= 0 THEN 14
+            ELSE 15
+        END));
+
+CREATE INDEX IF NOT EXISTS idx_attempts_ps_ttp_bucket
+    ON Attempts(parameter_set_id, (
+        CASE
+            WHEN time_to_pair_seconds < 10 THEN 0
+            WHEN time_to_pair_seconds < 30 THEN 1
+            WHEN time_to_pair_seconds < 60 THEN 2
+            WHEN time_to_pair_seconds < 120 THEN 3
+            WHEN time_to_pair_seconds < 300 THEN 4
+            ELSE 5
+        END));
+
+CREATE INDEX IF NOT EXISTS idx_attempts_ps_mae_bucket
+    ON Attempts(parameter_set_id, (
+        CASE
+            WHEN max_adverse_excursion_points = 0 THEN 0
+            WHEN max_adverse_excursion_points <= 2 THEN 1
+            WHEN max_adverse_excursion_points <= 5 THEN 2
+            WHEN max_adverse_excursion_points <= 10 THEN 3
+            ELSE 4
+        END));
+
+CREATE INDEX IF NOT EXISTS idx_attempts_ps_cost_bucket
+    ON Attempts(parameter_set_id, (
+        CASE
+            WHEN pair_cost_points < 90 THEN 0
+            WHEN pair_cost_points <= 95 THEN 1
+            ELSE 2
+        END));
+
+CREATE INDEX IF NOT EXISTS idx_attempts_ps_proximity_bucket
+    ON Attempts(parameter_set_id, (
+        CASE
+            WHEN closest_approach_points <= 1 THEN 0
+            WHEN closest_approach_points <= 2 THEN 1
+            WHEN closest_approach_points <= 5 THEN 2
+            WHEN closest_approach_points <= 10 THEN 3
+            ELSE 4
+        END));
+
+ANALYZE Attempts;
+
+COMMIT;
@@ -0,0 +1,19 @@
+-- 029_overall_stats_index.sql
+-- Covering index for get_overall_stats in src/metrics.py.
+--
+-- Attempts(parameter_set_id, t1_timestamp) INCLUDE (...): the overall
+-- stats filter on parameter set and an optional date_after lower bound and
+-- read only the included columns, so a filtered report is an index-only
+-- range scan.  The crypto_asset filter already has idx_markets_asset
+-- (001_initial_schema.sql) to drive the Markets join.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_attempts_metrics
+    ON Attempts(parameter_set_id, t1_timestamp)
+    INCLUDE (status, time_to_pair_seconds, pair_cost_points, pair_profit_points,
+             stop_loss_threshold_points, P1_points);
+
+ANALYZE Attempts;
+
+COMMIT;
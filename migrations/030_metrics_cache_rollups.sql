@@ -0,0 +1,15 @@
+-- 030_metrics_cache_rollups.sql
+-- Reset MetricsCache for the rollups added to src/metrics.py _HISTOGRAMS.
+--
+-- get_near_miss_analysis ("proximity") and get_all_stats_single_pass
+-- ("breakdown": first leg x phase x regime x minute x window) now read
+-- settled per-bucket sums from MetricsCache and only scan Attempts past
+-- the watermark.  All metrics share one watermark, so rows cached before
+-- these metrics existed would leave them missing every settled attempt.
+-- Clear the table; the next refresh_metrics_cache() rebuilds it.
+
+BEGIN;
+
+DELETE FROM MetricsCache;
+
+COMMIT;
@@ -0,0 +1,20 @@
+-- 031_failed_attempts_index.sql
+-- Partial covering index for get_failure_analysis in src/metrics.py.
+--
+-- The failure report reads only failed attempts, filtered on parameter
+-- set and grouped on fail_reason, and averages the included columns.
+-- Restricting the index to status = 'completed_failed' keeps it a
+-- fraction of Attempts, and the report becomes an index-only scan.  The
+-- other report filters already have indexes: idx_attempts_metrics (029),
+-- idx_attempts_ps_market (026) and the bucket indexes (028).
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_attempts_failed
+    ON Attempts(parameter_set_id, fail_reason)
+    INCLUDE (closest_approach_points, pair_profit_points, time_to_pair_seconds)
+    WHERE status = 'completed_failed';
+
+ANALYZE Attempts;
+
+COMMIT;
@@ -7,6 +7,7 @@ Usage:
     python scripts/analyze_results.py --after 2026-02-06     # date filter
     python scripts/analyze_results.py --parameter-set 1      # by param set ID
     python scripts/analyze_results.py --db-url 'postgres://…'  # PostgreSQL
+    python scripts/analyze_results.py --refresh-cache        # update MetricsCache first
 
 The database source is resolved in order:
   1. --db-url flag
@@ -25,25 +26,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.config import load_env_file  # noqa: E402
-from src.metrics import (  # noqa: E402
-    get_cross_market_consistency,
-    get_failure_analysis,
-    get_mae_analysis,
-    get_near_miss_analysis,
-    get_overall_stats,
-    get_pair_cost_distribution,
-    get_parameter_comparison,
-    get_profitability_projection,
-    get_spread_analysis,
-    get_stats_by_asset,
-    get_stats_by_first_leg,
-    get_stats_by_market_minute,
-    get_stats_by_market_phase,
-    get_stats_by_reference_regime,
-    get_stats_by_time_bucket,
-    get_stop_loss_analysis,
-    get_time_to_pair_distribution,
-)
+from src.metrics import close_all, refresh_metrics_cache, run_all_metrics  # noqa: E402
 
 
 # ---------------------------------------------------------------------------
@@ -89,10 +72,13 @@ async def run_report(
         filters.append(f"after={date_after}")
     filter_str = f" (filters: {', '.join(filters)})" if filters else ""
 
+    # All sections are independent, so fetch them concurrently up front
+    metrics = await run_all_metrics(db_source, parameter_set_id, crypto_asset, date_after)
+
     print(section(f"POLYMARKET PAIR MEASUREMENT - ANALYSIS REPORT{filter_str}"))
 
     # --- Overall ---
-    stats = await get_overall_stats(db_source, parameter_set_id, crypto_asset, date_after)
+    stats = metrics["overall"]
     print(f"\n  Total attempts:  {stats.get('total_attempts', 0)}")
     print(f"  Total pairs:     {stats.get('total_pairs', 0)}")
     print(f"  Total failed:    {stats.get('total_failed', 0)}")
@@ -102,7 +88,7 @@ async def run_report(
     print(f"  Avg profit:      {num(stats.get('avg_profit'))} pts")
 
     # --- By Asset ---
-    by_asset = await get_stats_by_asset(db_source, parameter_set_id)
+    by_asset = metrics["by_asset"]
     if by_asset:
         print(section("BY CRYPTO ASSET"))
         print(f"  {'Asset':<8} {'Attempts':>9} {'Pairs':>7} {'Rate':>7} {'Avg TTP':>9}")
@@ -112,7 +98,7 @@ async def run_report(
                   f"{r['pairs']:>7} {pct(r['pair_rate']):>7} {num(r['avg_ttp']):>8}s")
 
     # --- TTP Distribution ---
-    ttp_dist = await get_time_to_pair_distribution(db_source, parameter_set_id)
+    ttp_dist = metrics["ttp_distribution"]
     if ttp_dist:
         print(section("TIME-TO-PAIR DISTRIBUTION"))
         print(f"  {'Bucket':<12} {'Count':>7} {'Avg Profit':>11}")
@@ -122,7 +108,7 @@ async def run_report(
                   f"{num(r['avg_profit']):>10} pts")
 
     # --- By First Leg ---
-    by_leg = await get_stats_by_first_leg(db_source, parameter_set_id)
+    by_leg = metrics["by_first_leg"]
     if by_leg:
         print(section("BY FIRST LEG SIDE"))
         print(f"  {'Side':<8} {'Attempts':>9} {'Pairs':>7} {'Rate':>7} "
@@ -134,7 +120,7 @@ async def run_report(
                   f"{num(r.get('avg_profit')):>7}p {num(r.get('avg_mae')):>7}p")
 
     # --- By Market Phase ---
-    by_phase = await get_stats_by_market_phase(db_source, parameter_set_id)
+    by_phase = metrics["by_phase"]
     if by_phase:
         print(section("BY MARKET PHASE"))
         print(f"  {'Phase':<20} {'Attempts':>9} {'Pairs':>7} {'Rate':>7}")
@@ -144,7 +130,7 @@ async def run_report(
                   f"{r['pairs']:>7} {pct(r['pair_rate']):>7}")
 
     # --- By Market Minute (5 x 3-min buckets) ---
-    by_minute = await get_stats_by_market_minute(db_source, parameter_set_id)
+    by_minute = metrics["by_market_minute"]
     if by_minute:
         print(section("PAIR RATE BY MARKET MINUTE (5 x 3-min buckets)"))
         print(f"  {'Bucket':<12} {'Attempts':>9} {'Pairs':>7} {'Rate':>7} {'Avg TTP':>9} {'Avg Profit':>11}")
@@ -155,7 +141,7 @@ async def run_report(
                   f"{num(r['avg_ttp']):>8}s {num(r['avg_profit']):>10} pts")
 
     # --- By Time Remaining Bucket ---
-    by_bucket = await get_stats_by_time_bucket(db_source, parameter_set_id)
+    by_bucket = metrics["by_time_bucket"]
     if by_bucket:
         print(section("BY TIME REMAINING AT ENTRY (by minute)"))
         print(f"  {'Minute':<8} {'Attempts':>9} {'Pairs':>7} {'Rate':>7} "
@@ -168,7 +154,7 @@ async def run_report(
                   f"{num(r.get('avg_mae')):>7}p")
 
     # --- MAE Analysis ---
-    mae = await get_mae_analysis(db_source, parameter_set_id)
+    mae = metrics["mae"]
     if mae.get("overall", {}).get("total"):
         print(section("MAX ADVERSE EXCURSION (MAE) ANALYSIS"))
         ov = mae["overall"]
@@ -188,7 +174,7 @@ async def run_report(
                 print(f"  {r['bucket']:<16} {r['count']:>7} {pct(r['pair_rate']):>10}")
 
     # --- Spread Analysis ---
-    spread = await get_spread_analysis(db_source, parameter_set_id)
+    spread = metrics["spread"]
     if spread.get("entry", {}).get("avg_yes_spread_entry") is not None:
         print(section("SPREAD AT ENTRY / EXIT"))
         ent = spread["entry"]
@@ -215,7 +201,7 @@ async def run_report(
                       f"{r['pairs']:>7} {pct(r['pair_rate']):>7} {num(r['avg_ttp']):>8}s")
 
     # --- By Reference Regime ---
-    by_regime = await get_stats_by_reference_regime(db_source, parameter_set_id)
+    by_regime = metrics["by_regime"]
     if by_regime:
         print(section("BY REFERENCE PRICE REGIME"))
         print(f"  {'Regime':<25} {'Attempts':>9} {'Pairs':>7} {'Rate':>7}")
@@ -225,7 +211,7 @@ async def run_report(
                   f"{r['pairs']:>7} {pct(r['pair_rate']):>7}")
 
     # --- Pair Cost ---
-    by_cost = await get_pair_cost_distribution(db_source, parameter_set_id)
+    by_cost = metrics["pair_cost"]
     if by_cost:
         print(section("PAIR COST DISTRIBUTION"))
         print(f"  {'Bucket':<18} {'Count':>7} {'Avg Profit':>11} {'Avg TTP':>9}")
@@ -235,7 +221,7 @@ async def run_report(
                   f"{num(r['avg_profit']):>10} pts {num(r['avg_ttp']):>8}s")
 
     # --- Failure Analysis ---
-    failures = await get_failure_analysis(db_source, parameter_set_id)
+    failures = metrics["failures"]
     if failures.get("total_failed"):
         print(section("FAILURE ANALYSIS"))
         print(f"  Total failed:       {failures.get('total_failed', 0)}")
@@ -253,7 +239,7 @@ async def run_report(
                       f"{loss_str:>8}p {time_str:>8}s")
 
     # --- Stop Loss Analysis ---
-    sl_data = await get_stop_loss_analysis(db_source, parameter_set_id)
+    sl_data = metrics["stop_loss"]
     if sl_data.get("overall", {}).get("total_stopped"):
         print(section("STOP LOSS ANALYSIS"))
         ov = sl_data["overall"]
@@ -278,7 +264,7 @@ async def run_report(
                       f"{r['total_pnl'] or 0:>8} pts")
 
     # --- Near Miss ---
-    near = await get_near_miss_analysis(db_source, parameter_set_id)
+    near = metrics["near_miss"]
     if near.get("total"):
         print(section("NEAR MISS ANALYSIS"))
         print(f"  Frustration rate (within 2pts): {pct(near.get('frustration_rate'))}")
@@ -290,27 +276,23 @@ async def run_report(
                 print(f"  {r['proximity']:<15} {r['count']:>7}")
 
     # --- Cross-Market Consistency ---
-    consistency = await get_cross_market_consistency(db_source, parameter_set_id)
-    if consistency:
-        rates = [r["pair_rate"] for r in consistency if r["pair_rate"] is not None]
-        if rates:
-            avg_rate = sum(rates) / len(rates)
-            print(section("CROSS-MARKET CONSISTENCY"))
-            print(f"  Markets with data: {len(consistency)}")
-            print(f"  Avg pair rate:     {pct(avg_rate)}")
-            if len(rates) > 1:
-                variance = sum((r - avg_rate) ** 2 for r in rates) / len(rates)
-                print(f"  Std deviation:     {pct(float(variance) ** 0.5)}")
-            print(f"\n  Top 5 markets:")
-            for r in consistency[:5]:
+    consistency = metrics["consistency"]
+    if consistency["markets"]:
+        print(section("CROSS-MARKET CONSISTENCY"))
+        print(f"  Markets with data: {consistency['markets']}")
+        print(f"  Avg pair rate:     {pct(consistency['avg_pair_rate'])}")
+        if consistency["markets"] > 1:
+            print(f"  Std deviation:     {pct(consistency['stddev_pair_rate'])}")
+        print(f"\n  Top 5 markets:")
+        for r in consistency["top"]:
+            print(f"    {r['market_id']}: {r['attempts']} att, {pct(r['pair_rate'])}")
+        if consistency["markets"] > 5:
+            print(f"  Bottom 5 markets:")
+            for r in consistency["bottom"]:
                 print(f"    {r['market_id']}: {r['attempts']} att, {pct(r['pair_rate'])}")
-            if len(consistency) > 5:
-                print(f"  Bottom 5 markets:")
-                for r in consistency[-5:]:
-                    print(f"    {r['market_id']}: {r['attempts']} att, {pct(r['pair_rate'])}")
 
     # --- Parameter Comparison ---
-    param_cmp = await get_parameter_comparison(db_source)
+    param_cmp = metrics["parameter_comparison"]
     if len(param_cmp) > 1:
         # Check if any parameter sets have stop loss configured
         has_sl = any(r.get('stop_loss_threshold_points') for r in param_cmp)
@@ -343,7 +325,7 @@ async def run_report(
                       f"{num(r['avg_ttp']):>6}s {num(r['avg_profit']):>6}p")
 
     # --- Profitability Projection ---
-    proj = await get_profitability_projection(db_source, parameter_set_id)
+    proj = metrics["projection"]
     if proj.get("pair_rate"):
         print(section("PROFITABILITY PROJECTION"))
         print(f"  Observed pair rate:     {pct(proj['pair_rate'])}")
@@ -410,6 +392,11 @@ def main():
         "--after", default=None,
         help="Filter attempts after date (YYYY-MM-DD)",
     )
+    parser.add_argument(
+        "--refresh-cache", action="store_true",
+        help="Fold settled attempts into MetricsCache before reporting "
+             "(writes to the database)",
+    )
     args = parser.parse_args()
 
     db_source = _resolve_db_source(args)
@@ -419,12 +406,25 @@ def main():
         print(f"Database not found: {db_source}")
         sys.exit(1)
 
-    asyncio.run(run_report(
-        db_source=db_source,
-        parameter_set_id=args.parameter_set,
-        crypto_asset=args.asset,
-        date_after=args.after,
-    ))
+    async def _run() -> None:
+        try:
+            # Fold settled attempts into MetricsCache so the histograms only
+            # scan the recent tail; the report still works without it.
+            if args.refresh_cache:
+                try:
+                    await refresh_metrics_cache(db_source)
+                except Exception as e:
+                    print(f"Metrics cache not refreshed: {e}", file=sys.stderr)
+            await run_report(
+                db_source=db_source,
+                parameter_set_id=args.parameter_set,
+                crypto_asset=args.asset,
+                date_after=args.after,
+            )
+        finally:
+            await close_all()
+
+    asyncio.run(_run())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Backfill the *_ts_us epoch-microsecond columns from the ISO timestamps.
+
+Run after migration 024_epoch_us_timestamps.sql has been applied.
+
+Usage:
+    python scripts/backfill_ts_us.py [--batch-size N] [--dry-run]
+
+Covers Attempts.t1_ts_us / t2_ts_us and, where the tables still exist
+(migration 010 drops them on swapped databases), Snapshots.ts_us and
+AttemptLifecycle.ts_us.  Each table is paged through by primary key in
+ascending order, updating each batch in its own transaction so no single
+transaction holds locks on millions of rows. Progress is printed after
+each batch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import load_env_file  # noqa: E402
+
+_EPOCH_US = "(EXTRACT(EPOCH FROM {col}::timestamptz) * 1000000)::BIGINT"
+
+# (table, primary key, [(ts_us column, ISO source column)])
+_TARGETS = [
+    ("Attempts", "attempt_id", [("t1_ts_us", "t1_timestamp"), ("t2_ts_us", "t2_timestamp")]),
+    ("Snapshots", "snapshot_id", [("ts_us", "timestamp")]),
+    ("AttemptLifecycle", "lifecycle_id", [("ts_us", "timestamp")]),
+]
+
+
+def _pending(cols: list[tuple[str, str]]) -> str:
+    """WHERE condition matching rows with at least one column still to fill."""
+    return " OR ".join(f"({us} IS NULL AND {iso} IS NOT NULL)" for us, iso in cols)
+
+
+async def _backfill_table(conn, table: str, pk: str, cols, batch_size: int, dry_run: bool) -> None:
+    if await conn.fetchval("SELECT to_regclass($1)", table.lower()) is None:
+        print(f"{table}: table not present — skipped")
+        return
+
+    pending = _pending(cols)
+    if dry_run:
+        total_rows = await conn.fetchval(f"SELECT COUNT(*) FROM {table} WHERE {pending}")
+        print(f"{table}: rows to backfill: {total_rows:,}")
+        return
+
+    # Use MIN/MAX on the PK (index scan, fast) instead of COUNT(*)
+    min_id = await conn.fetchval(f"SELECT MIN({pk}) FROM {table} WHERE {pending}")
+    if min_id is None:
+        print(f"{table}: nothing to backfill.")
+        return
+    max_id = await conn.fetchval(f"SELECT MAX({pk}) FROM {table} WHERE {pending}")
+    print(f"{table}: {pk} range {min_id:,} – {max_id:,}, batch size {batch_size:,}")
+
+    sets = ", ".join(
+        f"{us} = COALESCE({us}, {_EPOCH_US.format(col=iso)})" for us, iso in cols
+    )
+    updated_total = 0
+    cursor = min_id
+    t0 = time.monotonic()
+
+    while cursor <= max_id:
+        batch_end = cursor + batch_size - 1
+        updated = await conn.execute(
+            f"UPDATE {table} SET {sets}"
+            f" WHERE {pk} BETWEEN $1 AND $2 AND ({pending})",
+            cursor,
+            batch_end,
+        )
+        # asyncpg returns "UPDATE N" as a string
+        n = int(updated.split()[-1])
+        updated_total += n
+        elapsed = time.monotonic() - t0
+        rate = updated_total / elapsed if elapsed > 0 else 0
+        print(
+            f"  ids {cursor:>10,}–{batch_end:>10,} | "
+            f"updated {n:>6,} | "
+            f"total {updated_total:>8,} | "
+            f"{rate:,.0f} rows/s"
+        )
+        cursor = batch_end + 1
+
+    print(f"{table}: {updated_total:,} rows updated in {time.monotonic()-t0:.1f}s\n")
+
+
+async def run(batch_size: int, dry_run: bool) -> None:
+    import asyncpg
+
+    load_env_file()
+    db_url = os.environ.get("DATABASE_URL")
+    if not db_url:
+        print("ERROR: DATABASE_URL not set", file=sys.stderr)
+        sys.exit(1)
+
+    # asyncpg expects postgresql:// not postgres://
+    if db_url.startswith("postgres://"):
+        db_url = "postgresql://" + db_url[len("postgres://"):]
+
+    conn = await asyncpg.connect(db_url, statement_cache_size=0)
+
+    try:
+        await conn.execute("SET statement_timeout = '0'")
+        for table, pk, cols in _TARGETS:
+            await _backfill_table(conn, table, pk, cols, batch_size, dry_run)
+        if dry_run:
+            print("Dry run — exiting without changes.")
+    finally:
+        await conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=50_000,
+        help="Rows per UPDATE batch (default: 50,000)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Count rows to update without making changes",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.batch_size, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
@@ -64,6 +64,10 @@ WHERE attempt_id IN (
 DELETE FROM Attempts
 WHERE stop_loss_threshold_points IS NULL;
 
+-- Cached histogram sums still count the deleted attempts; the next
+-- refresh_metrics_cache() rebuilds them from scratch.
+DELETE FROM MetricsCache;
+
 DELETE FROM Markets
 WHERE market_id NOT IN (SELECT DISTINCT market_id FROM Attempts)
   AND market_id NOT IN (SELECT DISTINCT market_id FROM Snapshots);
@@ -25,7 +25,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.config import load_env_file  # noqa: E402
-from src.metrics import _connect  # noqa: E402
+from src.metrics import _connect, close_all  # noqa: E402
 
 
 TABLES = {
@@ -87,19 +87,28 @@ async def export_table(db_source: str, table_key: str, output_path: str) -> None
 
     async with _connect(db_source) as db:
         try:
-            rows = await db.fetch_all(sql)
-            if not rows:
+            # Stream batches straight into the CSV instead of loading the
+            # whole table; the file is only created once a row arrives.
+            count = 0
+            f = writer = headers = None
+            try:
+                async for batch in db.iter_rows(sql):
+                    if writer is None:
+                        headers = list(batch[0].keys())
+                        f = open(output_path, "w", newline="", encoding="utf-8")
+                        writer = csv.writer(f)
+                        writer.writerow(headers)
+                    writer.writerows([row[h] for h in headers] for row in batch)
+                    count += len(batch)
+            finally:
+                if f is not None:
+                    f.close()
+
+            if not count:
                 print(f"No data in '{table_key}'.")
                 return
 
-            headers = list(rows[0].keys())
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
-                for row in rows:
-                    writer.writerow([row[h] for h in headers])
-
-            print(f"Exported {len(rows)} rows from '{table_key}' -> {output_path}")
+            print(f"Exported {count} rows from '{table_key}' -> {output_path}")
         except Exception as e:
             print(f"Error exporting '{table_key}': {e}")
             sys.exit(1)
@@ -152,7 +161,13 @@ def main():
         sys.exit(1)
 
     output = args.output or f"{args.table}.csv"
-    asyncio.run(export_table(db_source, args.table, output))
+    async def _run() -> None:
+        try:
+            await export_table(db_source, args.table, output)
+        finally:
+            await close_all()
+
+    asyncio.run(_run())
 
 
 if __name__ == "__main__":
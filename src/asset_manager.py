@@ -28,6 +28,7 @@ logger = logging.getLogger(__name__)
 # Discovery retry settings
 MAX_DISCOVERY_RETRIES = 40       # 40 × ~5s = ~200s max wait
 DISCOVERY_RETRY_BASE_DELAY = 2   # seconds
+PREFETCH_LEAD_SECONDS = 20       # look up the next market this long before settlement
 
 
 class AssetManager:
@@ -44,6 +45,7 @@ class AssetManager:
         config: AppConfig,
         database: Database,
         rest_client: CLOBRestClient,
+        market_discovery: MarketDiscovery,
         shutdown_event: asyncio.Event,
         event_log: Optional[deque] = None,
     ):
@@ -55,7 +57,7 @@ class AssetManager:
         self._shutdown = shutdown_event
         self._event_log = event_log
 
-        self._discovery = MarketDiscovery()
+        self._discovery = market_discovery
 
         # Tick store (shared across all markets for this asset)
         self._tick_store: Optional[TickStore] = None
@@ -158,7 +160,21 @@ class AssetManager:
                 )
                 self._current_monitor = monitor
 
-                summary = await monitor.run()
+                # Fetch the next window's market ahead of settlement so the
+                # rotation below is served from the discovery cache
+                remaining = (
+                    market_info.settlement_time - datetime.now(timezone.utc)
+                ).total_seconds()
+                prefetch = asyncio.get_running_loop().call_later(
+                    max(0.0, remaining - PREFETCH_LEAD_SECONDS),
+                    self._discovery.prefetch_next_window,
+                    self.crypto_asset,
+                    self.config.markets.market_type,
+                )
+                try:
+                    summary = await monitor.run()
+                finally:
+                    prefetch.cancel()
 
                 self._current_monitor = None
                 self._current_market = None
@@ -181,7 +197,6 @@ class AssetManager:
         finally:
             if self._tick_store is not None:
                 await self._tick_store.stop()
-            await self._discovery.close()
             self._status = "stopped"
             logger.info(
                 "Asset manager stopped for %s — %d markets, %d attempts, %d pairs",
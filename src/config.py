@@ -5,6 +5,8 @@ Priority: environment variables > config.yaml > hardcoded defaults.
 Environment variables (all optional — fall back to config.yaml then defaults):
     DATABASE_URL              PostgreSQL connection string (transaction pooler, port 6543)
     DATABASE_URL_SESSION      Session pooler fallback (port 5432); used by migrations, bot fallback
+    POLYMARKET_PGBOUNCER      "true" when a report DSN goes through a transaction pooler on a
+                              port other than 6543; turns off the asyncpg statement cache
     DELTA_POINTS              Comma-separated deltas, e.g. "3,4,5,6,7,8,9,10"
     STOP_LOSS_THRESHOLD       Comma-separated stop loss thresholds in points, e.g. "1,2,3"
                               Creates cartesian product with DELTA_POINTS. Omit for no stop loss.
@@ -20,6 +22,7 @@ Environment variables (all optional — fall back to config.yaml then defaults):
     CONSOLE_DASHBOARD         "true" or "false"
     ENABLE_SNAPSHOTS          "true" or "false"
     ENABLE_LIFECYCLE_TRACKING "true" or "false"
+    DB_FLUSH_INTERVAL         Seconds between background flushes of cycle writes, e.g. "5"
 """
 
 import logging
@@ -116,6 +119,7 @@ class DataConfig:
     database_url_session: Optional[str]  # Session pooler fallback (port 5432)
     enable_snapshots: bool
     enable_lifecycle_tracking: bool
+    db_flush_interval_seconds: float = 5.0
     enable_tick_sampling: bool = False
     tick_sample_interval_seconds: float = 2.0
     tick_flush_interval_seconds: float = 60.0
@@ -357,6 +361,9 @@ def load_config(config_path: str = "config.yaml") -> AppConfig:
         enable_lifecycle_tracking=_env_bool(
             "ENABLE_LIFECYCLE_TRACKING", d.get("enable_lifecycle_tracking", False)
         ),
+        db_flush_interval_seconds=float(
+            _env("DB_FLUSH_INTERVAL", d.get("db_flush_interval_seconds", 5.0))
+        ),
         enable_tick_sampling=_env_bool(
             "ENABLE_TICK_SAMPLING", d.get("enable_tick_sampling", False)
         ),
@@ -3,20 +3,33 @@
 PostgreSQL schema is managed by SQL migration files in ``migrations/``.
 SQLite uses an inline schema for local-dev convenience.
 
-An ``asyncio.Lock`` serialises SQLite writes; PostgreSQL uses a connection
-pool and needs no external lock.
+SQLite writes are funnelled through a single writer thread that owns the
+``sqlite3`` connection and group-commits everything queued within a short
+window in one transaction (one fsync per batch instead of per row).  PostgreSQL uses a connection pool and writes
+directly.
 """
 
 import asyncio
+import dataclasses
+import hashlib
 import logging
 import math
+import operator
+import queue
+import sqlite3
+import threading
+import time
 from collections import defaultdict
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Optional
+from urllib.parse import quote
 
 from .models import (
-    Attempt, AttemptStatus, LifecycleRecord, MarketInfo, ParameterSet,
+    Attempt, AttemptStatus, LifecycleBatch, MarketInfo, ParameterSet,
     Side, Snapshot,
 )
 
@@ -27,25 +40,10 @@ logger = logging.getLogger(__name__)
 # Schema — SQLite (local dev only — PG uses migrations/)
 # ---------------------------------------------------------------------------
 
-SQLITE_SCHEMA = """
-CREATE TABLE IF NOT EXISTS ParameterSets (
-    parameter_set_id        INTEGER PRIMARY KEY AUTOINCREMENT,
-    name                    TEXT    NOT NULL,
-    S0_points               INTEGER NOT NULL,
-    delta_points            INTEGER NOT NULL,
-    PairCap_points          INTEGER NOT NULL,
-    trigger_rule            TEXT    NOT NULL,
-    reference_price_source  TEXT    NOT NULL,
-    tie_break_rule          TEXT    DEFAULT 'distance_then_yes',
-    sampling_mode           TEXT,
-    cycle_interval_seconds  REAL,
-    cycles_per_market       INTEGER,
-    feed_gap_threshold_seconds REAL,
-    stop_loss_threshold_points INTEGER,
-    created_at              TEXT    NOT NULL
-);
-
-CREATE TABLE IF NOT EXISTS Markets (
+# Markets is keyed by its TEXT market_id, so a rowid would only add a second
+# B-tree lookup; STRICT keeps every column at its declared storage class.
+# Templated on the table name for the STRICT rebuild in _SQLITE_MIGRATIONS.
+_SQLITE_MARKETS_DDL = """CREATE TABLE IF NOT EXISTS {table} (
     market_id               TEXT PRIMARY KEY,
     crypto_asset            TEXT    NOT NULL,
     condition_id            TEXT    NOT NULL,
@@ -69,21 +67,140 @@ CREATE TABLE IF NOT EXISTS Markets (
     time_remaining_at_start REAL,
     anomaly_count           INTEGER DEFAULT 0,
     notes                   TEXT,
+    winning_outcome         TEXT,
     volume24hr              REAL,
     liquidity               REAL,
     open_interest           REAL
+) WITHOUT ROWID, STRICT;
+"""
+_SQLITE_MARKETS_COLUMN_LIST = ", ".join(
+    line.split()[0] for line in _SQLITE_MARKETS_DDL.splitlines()
+    if line.startswith("    ")
+)
+
+# Report bucket indexes derived from Attempts columns, as (column, CASE
+# yielding the index into the matching label tuple in src.metrics).  On
+# SQLite they are VIRTUAL generated columns (ALTER TABLE cannot add STORED
+# ones) and each is indexed with parameter_set_id, so the report GROUP BYs
+# read the bucket straight from an index instead of evaluating the CASE per
+# row.  The indexes depend on migrated columns, so they are created by the
+# migrations rather than SQLITE_SCHEMA.  PostgreSQL has no such columns:
+# migrations/028 indexes these same CASE expressions, and src.metrics
+# spells them out in PG report SQL.
+ATTEMPT_BUCKET_COLUMNS = [
+    ("time_remaining_bucket",
+     "CASE WHEN time_remaining_at_start >= 840 THEN 0"
+     " WHEN time_remaining_at_start >= 780 THEN 1"
+     " WHEN time_remaining_at_start >= 720 THEN 2"
+     " WHEN time_remaining_at_start >= 660 THEN 3"
+     " WHEN time_remaining_at_start >= 600 THEN 4"
+     " WHEN time_remaining_at_start >= 540 THEN 5"
+     " WHEN time_remaining_at_start >= 480 THEN 6"
+     " WHEN time_remaining_at_start >= 420 THEN 7"
+     " WHEN time_remaining_at_start >= 360 THEN 8"
+     " WHEN time_remaining_at_start >= 300 THEN 9"
+     " WHEN time_remaining_at_start >= 240 THEN 10"
+     " WHEN time_remaining_at_start >= 180 THEN 11"
+     " WHEN time_remaining_at_start >= 120 THEN 12"
+     " WHEN time_remaining_at_start >= 60 THEN 13"
+     " WHEN time_remaining_at_start >= 0 THEN 14"
+     " ELSE 15 END"),
+    ("ttp_bucket",
+     "CASE WHEN time_to_pair_seconds < 10 THEN 0"
+     " WHEN time_to_pair_seconds < 30 THEN 1"
+     " WHEN time_to_pair_seconds < 60 THEN 2"
+     " WHEN time_to_pair_seconds < 120 THEN 3"
+     " WHEN time_to_pair_seconds < 300 THEN 4"
+     " ELSE 5 END"),
+    ("mae_bucket",
+     "CASE WHEN max_adverse_excursion_points = 0 THEN 0"
+     " WHEN max_adverse_excursion_points <= 2 THEN 1"
+     " WHEN max_adverse_excursion_points <= 5 THEN 2"
+     " WHEN max_adverse_excursion_points <= 10 THEN 3"
+     " ELSE 4 END"),
+    ("cost_bucket",
+     "CASE WHEN pair_cost_points < 90 THEN 0"
+     " WHEN pair_cost_points <= 95 THEN 1"
+     " ELSE 2 END"),
+    ("proximity_bucket",
+     "CASE WHEN closest_approach_points <= 1 THEN 0"
+     " WHEN closest_approach_points <= 2 THEN 1"
+     " WHEN closest_approach_points <= 5 THEN 2"
+     " WHEN closest_approach_points <= 10 THEN 3"
+     " ELSE 4 END"),
+]
+_SQLITE_BUCKET_COLUMN_DEFS = [
+    f"{col} INTEGER GENERATED ALWAYS AS ({expr}) VIRTUAL"
+    for col, expr in ATTEMPT_BUCKET_COLUMNS
+]
+_SQLITE_BUCKET_INDEXES = [
+    f"CREATE INDEX IF NOT EXISTS idx_attempts_ps_{col}"
+    f" ON Attempts(parameter_set_id, {col})"
+    for col, _ in ATTEMPT_BUCKET_COLUMNS
+]
+
+# Report indexes.  The first two are named in src.metrics.get_overall_stats
+# INDEXED BY hints: the Attempts one covers every column the overall stats
+# read, with t1_timestamp second for the date_after range.
+# stop_loss_threshold_points and closest_approach_points are migrated
+# columns, so all of these are created by the migrations.
+_SQLITE_REPORT_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_attempts_metrics"
+    " ON Attempts(parameter_set_id, t1_timestamp, status, time_to_pair_seconds,"
+    " pair_cost_points, pair_profit_points, stop_loss_threshold_points, P1_points)",
+    "CREATE INDEX IF NOT EXISTS idx_markets_asset ON Markets(crypto_asset)",
+    # Failure analysis: failed attempts only, grouped on fail_reason.
+    # SQLite only treats a partial index as covering when it also stores
+    # the predicate's column, hence the trailing status.
+    "CREATE INDEX IF NOT EXISTS idx_attempts_failed"
+    " ON Attempts(parameter_set_id, fail_reason, closest_approach_points,"
+    " pair_profit_points, time_to_pair_seconds, status)"
+    " WHERE status = 'completed_failed'",
+]
+
+# Additive per-bucket sums maintained by src.metrics.refresh_metrics_cache
+_SQLITE_METRICS_CACHE_DDL = """CREATE TABLE IF NOT EXISTS MetricsCache (
+    parameter_set_id        INTEGER NOT NULL,
+    metric_name             TEXT    NOT NULL,
+    bucket_key              INTEGER NOT NULL,
+    value_json              TEXT    NOT NULL,
+    last_attempt_id         INTEGER NOT NULL,
+    PRIMARY KEY (parameter_set_id, metric_name, bucket_key)
+) WITHOUT ROWID, STRICT;
+"""
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ParameterSets (
+    parameter_set_id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    name                    TEXT    NOT NULL,
+    S0_points               INTEGER NOT NULL,
+    delta_points            INTEGER NOT NULL,
+    PairCap_points          INTEGER NOT NULL,
+    trigger_rule            TEXT    NOT NULL,
+    reference_price_source  TEXT    NOT NULL,
+    tie_break_rule          TEXT    DEFAULT 'distance_then_yes',
+    sampling_mode           TEXT,
+    cycle_interval_seconds  REAL,
+    cycles_per_market       INTEGER,
+    feed_gap_threshold_seconds REAL,
+    stop_loss_threshold_points INTEGER,
+    parameter_set_hash      TEXT,
+    created_at              TEXT    NOT NULL
 );
 
+""" + _SQLITE_MARKETS_DDL.format(table="Markets") + """
 CREATE TABLE IF NOT EXISTS Attempts (
     attempt_id              INTEGER PRIMARY KEY AUTOINCREMENT,
     market_id               TEXT    NOT NULL REFERENCES Markets(market_id),
     parameter_set_id        INTEGER NOT NULL REFERENCES ParameterSets(parameter_set_id),
     t1_timestamp            TEXT    NOT NULL,
+    t1_ts_us                INTEGER,
     first_leg_side          TEXT    NOT NULL,
     P1_points               INTEGER NOT NULL,
     reference_yes_points    INTEGER NOT NULL,
     status                  TEXT    NOT NULL DEFAULT 'active',
     t2_timestamp            TEXT,
+    t2_ts_us                INTEGER,
     time_to_pair_seconds    REAL,
     time_remaining_at_start REAL,
     time_remaining_at_completion REAL,
@@ -106,7 +223,9 @@ CREATE TABLE IF NOT EXISTS Attempts (
     no_best_bid_size        REAL,
     no_best_ask_size        REAL,
     yes_ask_depth_2tick     REAL,
-    no_ask_depth_2tick      REAL
+    no_ask_depth_2tick      REAL,
+    crypto_asset            TEXT,
+""" + ",\n".join(f"    {d}" for d in _SQLITE_BUCKET_COLUMN_DEFS) + """
 );
 
 CREATE TABLE IF NOT EXISTS Snapshots (
@@ -114,6 +233,7 @@ CREATE TABLE IF NOT EXISTS Snapshots (
     market_id               TEXT    NOT NULL REFERENCES Markets(market_id),
     cycle_number            INTEGER NOT NULL,
     timestamp               TEXT    NOT NULL,
+    ts_us                   INTEGER,
     yes_bid_points          INTEGER,
     yes_ask_points          INTEGER,
     no_bid_points           INTEGER,
@@ -132,10 +252,19 @@ CREATE TABLE IF NOT EXISTS AttemptLifecycle (
     attempt_id              INTEGER NOT NULL REFERENCES Attempts(attempt_id),
     cycle_number            INTEGER NOT NULL,
     timestamp               TEXT    NOT NULL,
+    ts_us                   INTEGER,
     opposite_ask_points     INTEGER,
     distance_to_trigger     INTEGER,
     closest_approach_so_far INTEGER
 );
+
+""" + _SQLITE_METRICS_CACHE_DDL + """
+CREATE INDEX IF NOT EXISTS idx_attempts_market_status
+    ON Attempts(market_id, status);
+CREATE INDEX IF NOT EXISTS idx_snapshots_market_cycle
+    ON Snapshots(market_id, cycle_number);
+CREATE INDEX IF NOT EXISTS idx_lifecycle_attempt_cycle
+    ON AttemptLifecycle(attempt_id, cycle_number);
 """
 
 # Columns that may be missing in older SQLite databases
@@ -183,6 +312,86 @@ _SQLITE_DROP_COLUMNS = [
 # Columns that may be missing on ParameterSets in older SQLite databases
 _SQLITE_PS_MIGRATION_COLUMNS = [
     "stop_loss_threshold_points INTEGER",
+    "parameter_set_hash TEXT",
+]
+
+# Epoch-microsecond columns added alongside the ISO-8601 TEXT timestamps:
+# (table, new INTEGER column, ISO column it is backfilled from)
+_SQLITE_TS_US_COLUMNS = [
+    ("Attempts", "t1_ts_us", "t1_timestamp"),
+    ("Attempts", "t2_ts_us", "t2_timestamp"),
+    ("Snapshots", "ts_us", "timestamp"),
+    ("AttemptLifecycle", "ts_us", "timestamp"),
+]
+
+# Indexes that depend on migrated columns — created after the ALTERs run
+_SQLITE_MIGRATION_INDEXES = [
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_parameter_sets_hash"
+    " ON ParameterSets(parameter_set_hash)",
+]
+
+# Covering indexes for the per-market / MAE metrics aggregates.  The MAE
+# one reads a migrated column, so these are created by the migrations.
+_SQLITE_METRICS_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_attempts_ps_market"
+    " ON Attempts(parameter_set_id, market_id, status, time_to_pair_seconds)",
+    "CREATE INDEX IF NOT EXISTS idx_attempts_ps_mae"
+    " ON Attempts(parameter_set_id, max_adverse_excursion_points, status)",
+]
+
+
+def _ts_us_backfill_sql(table: str, us_col: str, iso_col: str) -> str:
+    """UPDATE filling *us_col* from ISO text *iso_col* (ms precision via %f)."""
+    return (
+        f"UPDATE {table} SET {us_col} ="
+        f" CAST(strftime('%s', {iso_col}) AS INTEGER) * 1000000"
+        f" + CAST(substr(strftime('%f', {iso_col}), 4) AS INTEGER) * 1000"
+        f" WHERE {us_col} IS NULL AND {iso_col} IS NOT NULL"
+    )
+
+
+# Versioned SQLite migrations: (target PRAGMA user_version, statements).
+# A brand-new file is created from SQLITE_SCHEMA, which is already current,
+# and jumps straight to the last version.  Version 1 catches up files from
+# before versioning existed, which may hold any subset of these columns.
+_SQLITE_MIGRATIONS: list[tuple[int, list[str]]] = [
+    (1, [
+        *(f"ALTER TABLE Attempts ADD COLUMN {c}" for c in _SQLITE_MIGRATION_COLUMNS),
+        *(f"ALTER TABLE Attempts DROP COLUMN {c}" for c in _SQLITE_DROP_COLUMNS),
+        *(f"ALTER TABLE ParameterSets ADD COLUMN {c}" for c in _SQLITE_PS_MIGRATION_COLUMNS),
+        *(f"ALTER TABLE Markets ADD COLUMN {c}" for c in _SQLITE_MARKETS_MIGRATION_COLUMNS),
+        *(f"ALTER TABLE {t} ADD COLUMN {us} INTEGER" for t, us, _ in _SQLITE_TS_US_COLUMNS),
+        *(_ts_us_backfill_sql(t, us, iso) for t, us, iso in _SQLITE_TS_US_COLUMNS),
+        *_SQLITE_MIGRATION_INDEXES,
+    ]),
+    (2, [
+        "ALTER TABLE Attempts ADD COLUMN crypto_asset TEXT",
+        "ALTER TABLE Markets ADD COLUMN winning_outcome TEXT",
+    ]),
+    (3, [
+        _SQLITE_MARKETS_DDL.format(table="Markets_strict"),
+        f"INSERT INTO Markets_strict ({_SQLITE_MARKETS_COLUMN_LIST})"
+        f" SELECT {_SQLITE_MARKETS_COLUMN_LIST} FROM Markets",
+        "DROP TABLE Markets",
+        "ALTER TABLE Markets_strict RENAME TO Markets",
+        "DROP INDEX IF EXISTS idx_lifecycle_attempt",
+        "CREATE INDEX IF NOT EXISTS idx_lifecycle_attempt_cycle"
+        " ON AttemptLifecycle(attempt_id, cycle_number)",
+    ]),
+    # Covering indexes for the per-market / MAE metrics aggregates; ANALYZE
+    # so the planner prefers them over a table scan straight away.
+    (4, [*_SQLITE_METRICS_INDEXES, "ANALYZE Attempts"]),
+    (5, [_SQLITE_METRICS_CACHE_DDL]),
+    (6, [
+        *(f"ALTER TABLE Attempts ADD COLUMN {d}" for d in _SQLITE_BUCKET_COLUMN_DEFS),
+        *_SQLITE_BUCKET_INDEXES,
+        "ANALYZE Attempts",
+    ]),
+    (7, [*_SQLITE_REPORT_INDEXES, "ANALYZE Attempts", "ANALYZE Markets"]),
+    # New MetricsCache rollups (near-miss proximity, breakdown key) share the
+    # one watermark, so clear the table; the next refresh rebuilds it.
+    (8, ["DELETE FROM MetricsCache"]),
+    (9, [*_SQLITE_REPORT_INDEXES, "ANALYZE Attempts"]),
 ]
 
 
@@ -201,15 +410,284 @@ def _q(sql: str) -> str:
     return result
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_us(dt: datetime) -> int:
+    """Return an aware datetime as integer microseconds since the Unix epoch."""
+    return (dt - _EPOCH) // _ONE_MICROSECOND
+
+
+# ---------------------------------------------------------------------------
+# SQL statements — built once at import; ``_PG_*`` are the ``$n`` variants
+# ---------------------------------------------------------------------------
+
+_SQL_UPSERT_PARAMETER_SET = """INSERT INTO ParameterSets
+    (name, S0_points, delta_points, PairCap_points, trigger_rule,
+     reference_price_source, sampling_mode, cycle_interval_seconds,
+     cycles_per_market, feed_gap_threshold_seconds,
+     stop_loss_threshold_points, parameter_set_hash, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (parameter_set_hash) DO UPDATE SET
+       parameter_set_hash = EXCLUDED.parameter_set_hash
+    RETURNING parameter_set_id"""
+_PG_SQL_UPSERT_PARAMETER_SET = _q(_SQL_UPSERT_PARAMETER_SET)
+
+# ON CONFLICT … DO UPDATE (SQLite ≥ 3.24) updates the row in place on
+# both backends — INSERT OR REPLACE would delete + reinsert it.
+_SQL_UPSERT_MARKET = """INSERT INTO Markets
+    (market_id, crypto_asset, condition_id, yes_token_id,
+     no_token_id, start_time, settlement_time,
+     tick_size_points, parameter_set_id,
+     time_remaining_at_start, cycle_interval_seconds,
+     volume24hr, liquidity, open_interest)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (market_id) DO UPDATE SET
+       crypto_asset = EXCLUDED.crypto_asset,
+       condition_id = EXCLUDED.condition_id,
+       yes_token_id = EXCLUDED.yes_token_id,
+       no_token_id  = EXCLUDED.no_token_id,
+       start_time   = EXCLUDED.start_time,
+       settlement_time = EXCLUDED.settlement_time,
+       tick_size_points = EXCLUDED.tick_size_points,
+       parameter_set_id = EXCLUDED.parameter_set_id,
+       time_remaining_at_start = EXCLUDED.time_remaining_at_start,
+       cycle_interval_seconds  = EXCLUDED.cycle_interval_seconds,
+       volume24hr = EXCLUDED.volume24hr,
+       liquidity  = EXCLUDED.liquidity,
+       open_interest = EXCLUDED.open_interest"""
+_PG_SQL_UPSERT_MARKET = _q(_SQL_UPSERT_MARKET)
+
+_SQL_INSERT_ATTEMPT = """INSERT INTO Attempts
+    (market_id, parameter_set_id, t1_timestamp, t1_ts_us,
+     first_leg_side, P1_points, reference_yes_points,
+     status, time_remaining_at_start,
+     yes_spread_entry_points, no_spread_entry_points,
+     delta_points, S0_points, stop_loss_threshold_points,
+     yes_best_bid_size, yes_best_ask_size,
+     no_best_bid_size, no_best_ask_size,
+     yes_ask_depth_2tick, no_ask_depth_2tick,
+     crypto_asset)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING attempt_id"""
+# Partitioned Attempts requires ts (partition key); supply it explicitly
+_PG_SQL_INSERT_ATTEMPT = _q("""INSERT INTO Attempts
+    (market_id, parameter_set_id, t1_timestamp, t1_ts_us,
+     first_leg_side, P1_points, reference_yes_points,
+     status, time_remaining_at_start,
+     yes_spread_entry_points, no_spread_entry_points,
+     delta_points, S0_points, stop_loss_threshold_points,
+     yes_best_bid_size, yes_best_ask_size,
+     no_best_bid_size, no_best_ask_size,
+     yes_ask_depth_2tick, no_ask_depth_2tick,
+     crypto_asset, ts)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    RETURNING attempt_id""")
+
+# Completion UPDATEs are built per set of changed columns — see
+# _attempt_update_sql() below.
+
+# PostgreSQL only — attempt_stats lives in migrations/017
+_PG_SQL_UPSERT_ATTEMPT_STATS = """
+    INSERT INTO attempt_stats (
+        delta_points, stop_loss_threshold_points, P1_points, time_minute,
+        crypto_asset, attempt_date, status, fail_reason,
+        first_leg_side, hour_of_day,
+        attempts, pairs, total_pnl, sum_time_to_pair, sum_pair_profit
+    ) VALUES ($1,$2,$3,$4,$5,$6::date,$7,$8,$9,$10,$11,$12,$13,$14,$15)
+    ON CONFLICT (
+        delta_points,
+        COALESCE(stop_loss_threshold_points, -1),
+        P1_points,
+        time_minute,
+        crypto_asset,
+        attempt_date,
+        status,
+        COALESCE(fail_reason, ''),
+        first_leg_side,
+        hour_of_day
+    ) DO UPDATE SET
+        attempts         = attempt_stats.attempts         + EXCLUDED.attempts,
+        pairs            = attempt_stats.pairs            + EXCLUDED.pairs,
+        total_pnl        = attempt_stats.total_pnl        + EXCLUDED.total_pnl,
+        sum_time_to_pair = attempt_stats.sum_time_to_pair + EXCLUDED.sum_time_to_pair,
+        sum_pair_profit  = attempt_stats.sum_pair_profit  + EXCLUDED.sum_pair_profit
+"""
+
+_SQL_UPDATE_MARKET_SUMMARY = """UPDATE Markets SET
+    total_attempts = ?, total_pairs = ?, total_failed = ?,
+    settlement_failures = ?, pair_rate = ?,
+    avg_time_to_pair = ?, median_time_to_pair = ?,
+    max_concurrent_attempts = ?, total_cycles_run = ?,
+    anomaly_count = ?, actual_settlement_time = ?, notes = ?,
+    winning_outcome = ?
+    WHERE market_id = ?"""
+_PG_SQL_UPDATE_MARKET_SUMMARY = _q(_SQL_UPDATE_MARKET_SUMMARY)
+
+_SQL_INSERT_SNAPSHOT = """INSERT INTO Snapshots
+    (market_id, cycle_number, timestamp, ts_us, yes_bid_points,
+     yes_ask_points, no_bid_points, no_ask_points,
+     yes_last_trade_points, no_last_trade_points,
+     time_remaining, active_attempts_count, anomaly_flag,
+     yes_period_low_ask_points, no_period_low_ask_points)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_PG_SQL_INSERT_SNAPSHOT = _q(_SQL_INSERT_SNAPSHOT)
+
+_SQL_INSERT_LIFECYCLE = """INSERT INTO AttemptLifecycle
+    (attempt_id, cycle_number, timestamp, ts_us,
+     opposite_ask_points, distance_to_trigger,
+     closest_approach_so_far)
+    VALUES (?, ?, ?, ?, ?, ?, ?)"""
+_PG_SQL_INSERT_LIFECYCLE = _q(_SQL_INSERT_LIFECYCLE)
+
+
+# ---------------------------------------------------------------------------
+# Attempt parameter getters (one C-level call per row instead of ~20 lookups)
+# ---------------------------------------------------------------------------
+
+_ATTEMPT_INSERT_GETTER = operator.attrgetter(
+    "market_id", "parameter_set_id", "t1_timestamp",
+    "first_leg_side_value",
+    "P1_points", "reference_yes_points",
+    "status.value", "time_remaining_at_start",
+    "yes_spread_entry_points", "no_spread_entry_points",
+    "delta_points", "S0_points", "stop_loss_threshold_points",
+    "yes_best_bid_size", "yes_best_ask_size",
+    "no_best_bid_size", "no_best_ask_size",
+    "yes_ask_depth_2tick", "no_ask_depth_2tick",
+    "crypto_asset",
+)
+
+# Columns each completion path may set, in SET-clause order.
+_ATTEMPT_PAIRED_COLUMNS = (
+    "status", "t2_timestamp",
+    "time_to_pair_seconds", "time_remaining_at_completion",
+    "actual_opposite_price", "pair_cost_points",
+    "pair_profit_points", "had_feed_gap",
+    "closest_approach_points", "max_adverse_excursion_points",
+    "yes_spread_exit_points", "no_spread_exit_points",
+)
+
+_ATTEMPT_FAILED_COLUMNS = (
+    "status", "time_remaining_at_completion",
+    "fail_reason", "had_feed_gap",
+    "closest_approach_points", "max_adverse_excursion_points",
+)
+
+# Stop-loss exits mix the paired path (t2_timestamp, pair_profit_points,
+# exit spreads) and the failed path (fail_reason).
+_ATTEMPT_STOPPED_COLUMNS = (
+    "status", "t2_timestamp",
+    "time_to_pair_seconds", "time_remaining_at_completion",
+    "fail_reason", "pair_cost_points",
+    "pair_profit_points", "had_feed_gap",
+    "closest_approach_points", "max_adverse_excursion_points",
+    "yes_spread_exit_points", "no_spread_exit_points",
+)
+
+
+def _attempt_getter(columns: tuple[str, ...]) -> operator.attrgetter:
+    return operator.attrgetter(
+        *("status.value" if c == "status" else c for c in columns)
+    )
+
+
+_ATTEMPT_PAIRED_GETTER = _attempt_getter(_ATTEMPT_PAIRED_COLUMNS)
+_ATTEMPT_FAILED_GETTER = _attempt_getter(_ATTEMPT_FAILED_COLUMNS)
+_ATTEMPT_STOPPED_GETTER = _attempt_getter(_ATTEMPT_STOPPED_COLUMNS)
+
+# (changed columns, is_postgres) → UPDATE text; a handful of shapes occur,
+# and reusing the exact string keeps the prepared-statement caches warm.
+_ATTEMPT_UPDATE_SQL: dict[tuple[tuple[str, ...], bool], str] = {}
+
+
+def _attempt_update_sql(columns: tuple[str, ...], postgres: bool) -> str:
+    """Return the ``UPDATE Attempts`` statement setting exactly *columns*."""
+    key = (columns, postgres)
+    sql = _ATTEMPT_UPDATE_SQL.get(key)
+    if sql is None:
+        sql = (
+            "UPDATE Attempts SET "
+            + ", ".join(f"{c} = ?" for c in columns)
+            + " WHERE attempt_id = ?"
+        )
+        if postgres:
+            sql = _q(sql)
+        _ATTEMPT_UPDATE_SQL[key] = sql
+    return sql
+
+
+# ---------------------------------------------------------------------------
+# SQLite connection tuning
+# ---------------------------------------------------------------------------
+
+# Applied on every connect; override per-instance via ``sqlite_pragmas``.
+# journal_mode is set first on its own because it cannot run inside a
+# transaction and returns a row.
+SQLITE_PRAGMAS: dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -65536,          # 64 MB page cache (negative = KiB)
+    "mmap_size": 268435456,        # 256 MB
+    "busy_timeout": 5000,          # ms
+    "wal_autocheckpoint": 1000,    # pages
+}
+
+# RETURNING and DROP COLUMN need 3.35; STRICT tables need 3.37
+_SQLITE_MIN_VERSION = (3, 37, 0)
+
+# sqlite3's per-connection prepared-statement LRU (default 128). Sized so
+# every fixed _SQL_* template plus the ad-hoc SELECTs stay resident.
+_SQLITE_CACHED_STATEMENTS = 256
+
+
+# ---------------------------------------------------------------------------
+# SQLite group commit
+# ---------------------------------------------------------------------------
+
+# How long the writer keeps collecting queued writes before committing
+_COMMIT_WINDOW_SECONDS = 0.05
+
+# Upper bound on writes folded into one transaction
+_COMMIT_MAX_BATCH = 500
+
+# Rows bound per executemany() call for large batches
+_EXECUTEMANY_CHUNK_ROWS = 1000
+
+# A queued write: run on the writer thread against its sqlite3 connection
+_WriteOp = Callable[[sqlite3.Connection], Any]
+
+
+def _resolve_future(
+    fut: asyncio.Future, result: Any, exc: Optional[BaseException],
+) -> None:
+    """Complete *fut* on its own loop unless the caller already gave up."""
+    if fut.done():
+        return
+    if exc is not None:
+        fut.set_exception(exc)
+    else:
+        fut.set_result(result)
+
+
 # ---------------------------------------------------------------------------
 # Database class
 # ---------------------------------------------------------------------------
 
 class Database:
-    """Async database manager — PostgreSQL (asyncpg) or SQLite (aiosqlite).
+    """Async database manager — PostgreSQL (asyncpg) or SQLite (sqlite3).
 
     PostgreSQL schema is managed by migration files in ``migrations/``.
     SQLite uses an inline schema (for local dev).
+
+    SQLite opens two private-cache connections by URI: the writer
+    (``mode=rwc``) and a read-only reader (``mode=ro``).  Shared-cache mode
+    is deliberately not used — it swaps WAL's reader/writer isolation for
+    table-level locks that fail fast with ``SQLITE_LOCKED`` (busy_timeout
+    does not apply), and the cache would still be lost on process exit.
+    Warm pages survive restarts through ``mmap_size`` and the OS page cache.
     """
 
     def __init__(
@@ -217,10 +695,12 @@ class Database:
         database_url: Optional[str] = None,
         database_url_session: Optional[str] = None,
         db_path: str = "data/measurements.db",
+        sqlite_pragmas: Optional[dict[str, Any]] = None,
     ):
         self._database_url = database_url
         self._database_url_session = database_url_session
         self._db_path = db_path
+        self._sqlite_pragmas = {**SQLITE_PRAGMAS, **(sqlite_pragmas or {})}
         self._is_postgres: bool = bool(
             (database_url or database_url_session)
             and (
@@ -230,12 +710,19 @@ class Database:
         )
 
         # SQLite state
-        self._db = None                    # aiosqlite.Connection
-        self._write_lock = asyncio.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._write_queue: Optional[queue.SimpleQueue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        # Read-only WAL reader for summary / analytics queries
+        self._ro_conn: Optional[sqlite3.Connection] = None
+        self._ro_executor: Optional[ThreadPoolExecutor] = None
 
         # PostgreSQL state
         self._pool = None                  # asyncpg.Pool
 
+        # parameter_set_hash → parameter_set_id (avoids repeat upserts)
+        self._ps_cache: dict[str, int] = {}
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
@@ -276,14 +763,37 @@ class Database:
                 )
             logger.info("PostgreSQL database initialized")
         else:
-            import aiosqlite                   # lazy import
-
+            if sqlite3.sqlite_version_info < _SQLITE_MIN_VERSION:
+                raise RuntimeError(
+                    f"SQLite {sqlite3.sqlite_version} is too old; "
+                    f"need >= {'.'.join(map(str, _SQLITE_MIN_VERSION))}"
+                )
             Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
-            self._db = await aiosqlite.connect(self._db_path)
-            self._db.row_factory = aiosqlite.Row
-            await self._db.executescript(SQLITE_SCHEMA)
-            await self._db.commit()
-            await self._run_sqlite_migrations()
+            # Autocommit mode: the writer issues BEGIN / COMMIT itself
+            self._conn = sqlite3.connect(
+                self._sqlite_uri("rwc"),
+                uri=True,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=_SQLITE_CACHED_STATEMENTS,
+            )
+            await asyncio.to_thread(self._bootstrap_sqlite)
+            self._write_queue = queue.SimpleQueue()
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, name="sqlite-writer", daemon=True,
+            )
+            self._writer_thread.start()
+            self._ro_conn = sqlite3.connect(
+                self._sqlite_uri("ro"),
+                uri=True,
+                check_same_thread=False,
+                cached_statements=_SQLITE_CACHED_STATEMENTS,
+            )
+            self._ro_conn.row_factory = sqlite3.Row
+            self._ro_conn.execute("PRAGMA query_only=1")
+            self._ro_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="sqlite-reader",
+            )
             logger.info("SQLite database initialized at %s", self._db_path)
 
     async def close(self) -> None:
@@ -292,102 +802,299 @@ class Database:
             await self._pool.close()
             self._pool = None
             logger.info("PostgreSQL connection pool closed")
-        elif self._db:
-            await self._db.close()
-            self._db = None
+        elif self._conn:
+            if self._ro_conn is not None:
+                self._ro_executor.shutdown(wait=True)
+                self._ro_executor = None
+                self._ro_conn.close()
+                self._ro_conn = None
+            if self._writer_thread is not None:
+                self._write_queue.put(None)          # drain, then stop
+                await asyncio.to_thread(self._writer_thread.join)
+                self._writer_thread = None
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                logger.warning("WAL checkpoint on close failed: %s", e)
+            self._conn.close()
+            self._conn = None
             logger.info("SQLite connection closed")
 
+    def _sqlite_uri(self, mode: str) -> str:
+        """``file:`` URI for the database file opened with *mode*."""
+        path = Path(self._db_path).resolve().as_posix()
+        return f"file:{quote(path)}?mode={mode}"
+
+    def _bootstrap_sqlite(self) -> None:
+        """Apply PRAGMAs, then create + migrate the schema (runs off-loop).
+
+        Schema creation and all pending migrations share one transaction —
+        a single fsync on startup — with foreign-key enforcement suspended so
+        table rebuilds can drop and rename referenced tables.
+        """
+        conn = self._conn
+        self._apply_sqlite_pragmas()
+        (foreign_keys,) = conn.execute("PRAGMA foreign_keys").fetchone()
+        conn.execute("PRAGMA foreign_keys=OFF")    # no-op inside a transaction
+        try:
+            (table_count,) = conn.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table'"
+            ).fetchone()
+            # executescript() commits any open transaction, so BEGIN goes in
+            conn.executescript("BEGIN IMMEDIATE;\n" + SQLITE_SCHEMA)
+            try:
+                self._run_sqlite_migrations(fresh=table_count == 0)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.execute(f"PRAGMA foreign_keys={foreign_keys}")
+
+    def _apply_sqlite_pragmas(self) -> None:
+        """Apply ``self._sqlite_pragmas`` to the freshly opened connection."""
+        assert self._conn is not None
+        pragmas = dict(self._sqlite_pragmas)
+        journal_mode = pragmas.pop("journal_mode", None)
+        if journal_mode is not None:
+            self._conn.execute(f"PRAGMA journal_mode={journal_mode}")
+        if pragmas:
+            self._conn.executescript(
+                "".join(f"PRAGMA {k}={v};\n" for k, v in pragmas.items())
+            )
+
     # ------------------------------------------------------------------
     # SQLite migrations (add missing columns to older databases)
     # ------------------------------------------------------------------
 
-    async def _run_sqlite_migrations(self) -> None:
-        """Bring an existing SQLite file up to the current schema.
+    def _run_sqlite_migrations(self, fresh: bool) -> None:
+        """Bring the SQLite file up to the latest ``_SQLITE_MIGRATIONS`` version.
 
-        Adds any missing columns, removes columns that were dropped in
-        migration 007, and adds any missing ParameterSets columns.
-        Requires SQLite ≥ 3.35.0 for DROP COLUMN (ships with Python ≥ 3.12
-        on all major platforms).
+        Progress is tracked in ``PRAGMA user_version`` so an up-to-date file
+        costs a single PRAGMA read.  Runs inside the caller's bootstrap
+        transaction.  ALTERs that were already applied by hand (or by the
+        pre-versioning startup code) are skipped.  DROP COLUMN needs
+        SQLite ≥ 3.35.0.
         """
-        assert self._db is not None
-        for col_def in _SQLITE_MIGRATION_COLUMNS:
-            try:
-                await self._db.execute(
-                    f"ALTER TABLE Attempts ADD COLUMN {col_def}"
-                )
-                await self._db.commit()
-            except Exception:
-                pass  # column already exists
-        for col_name in _SQLITE_DROP_COLUMNS:
-            try:
-                await self._db.execute(
-                    f"ALTER TABLE Attempts DROP COLUMN {col_name}"
-                )
-                await self._db.commit()
-            except Exception:
-                pass  # column already removed or SQLite version < 3.35
-        for col_def in _SQLITE_PS_MIGRATION_COLUMNS:
-            try:
-                await self._db.execute(
-                    f"ALTER TABLE ParameterSets ADD COLUMN {col_def}"
-                )
-                await self._db.commit()
-            except Exception:
-                pass  # column already exists
-        for col_def in _SQLITE_MARKETS_MIGRATION_COLUMNS:
+        conn = self._conn
+        assert conn is not None
+        latest = _SQLITE_MIGRATIONS[-1][0]
+        if fresh:
+            # SQLITE_SCHEMA is current; only add indexes on migrated columns
+            for index_sql in (
+                *_SQLITE_MIGRATION_INDEXES,
+                *_SQLITE_METRICS_INDEXES,
+                *_SQLITE_BUCKET_INDEXES,
+                *_SQLITE_REPORT_INDEXES,
+            ):
+                conn.execute(index_sql)
+            conn.execute(f"PRAGMA user_version={latest}")
+            return
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version >= latest:
+            return
+
+        for target, statements in _SQLITE_MIGRATIONS:
+            if version >= target:
+                continue
+            for sql in statements:
+                try:
+                    conn.execute(sql)
+                except sqlite3.OperationalError as e:
+                    if not sql.startswith("ALTER TABLE"):
+                        raise
+                    logger.debug("SQLite migration %d: skipped %r (%s)", target, sql, e)
+            conn.execute(f"PRAGMA user_version={target}")
+        logger.info("SQLite schema migrated from version %d to %d", version, latest)
+
+    # ------------------------------------------------------------------
+    # SQLite writer (group commit)
+    # ------------------------------------------------------------------
+
+    async def _submit(self, op: _WriteOp) -> Any:
+        """Queue *op* for the writer thread and wait for its result."""
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._write_queue.put((op, fut, loop))
+        return await fut
+
+    def _writer_loop(self) -> None:
+        """Drain the write queue, committing each window as one transaction.
+
+        Runs on the dedicated writer thread.  After the first queued write
+        arrives, keeps collecting for up to ``_COMMIT_WINDOW_SECONDS`` (or
+        ``_COMMIT_MAX_BATCH`` items), then runs them all inside a single
+        ``BEGIN IMMEDIATE … COMMIT``.  A ``None`` item flushes what is
+        pending and stops the loop.
+        """
+        write_queue = self._write_queue
+        stopping = False
+        while not stopping:
+            item = write_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + _COMMIT_WINDOW_SECONDS
+            while len(batch) < _COMMIT_MAX_BATCH:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = write_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._commit_batch(batch)
+
+    def _commit_batch(
+        self,
+        batch: list[tuple[_WriteOp, asyncio.Future, asyncio.AbstractEventLoop]],
+    ) -> None:
+        """Run *batch* in one transaction and resolve each caller's future.
+
+        Each op runs under its own SAVEPOINT so a failing write is rolled
+        back and reported to its caller without discarding the others.
+        """
+        conn = self._conn
+        outcomes: list[tuple[Any, Optional[BaseException]]] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for op, _, _ in batch:
+                conn.execute("SAVEPOINT write_op")
+                try:
+                    result = op(conn)
+                except Exception as exc:
+                    conn.execute("ROLLBACK TO write_op")
+                    conn.execute("RELEASE write_op")
+                    outcomes.append((None, exc))
+                else:
+                    conn.execute("RELEASE write_op")
+                    outcomes.append((result, None))
+            conn.execute("COMMIT")
+        except Exception as exc:
+            logger.error("SQLite batch commit failed (%d writes): %s", len(batch), exc)
+            if conn.in_transaction:
+                try:
+                    conn.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass
+            outcomes = [(None, exc)] * len(batch)
+
+        for (_, fut, loop), (result, exc) in zip(batch, outcomes):
             try:
-                await self._db.execute(
-                    f"ALTER TABLE Markets ADD COLUMN {col_def}"
-                )
-                await self._db.commit()
-            except Exception:
-                pass  # column already exists
+                loop.call_soon_threadsafe(_resolve_future, fut, result, exc)
+            except RuntimeError:
+                # The caller's loop has closed; nobody is left waiting on
+                # this future, but the writer must keep serving the others.
+                logger.debug("SQLite write finished after its event loop closed")
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    async def fetchall(self, sql: str, params: tuple = ()) -> list[dict]:
+        """Run a read query (``?`` placeholders) and return rows as dicts.
+
+        On SQLite this uses a separate read-only connection on its own
+        thread, so under WAL it never waits on (or blocks) the writer.
+        """
+        if self._is_postgres:
+            async with self._pool.acquire() as conn:
+                rows = await conn.fetch(_q(sql), *params)
+            return [dict(r) for r in rows]
+
+        def run() -> list[dict]:
+            return [dict(r) for r in self._ro_conn.execute(sql, params).fetchall()]
+        return await asyncio.get_running_loop().run_in_executor(self._ro_executor, run)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     async def _execute(self, sql: str, params: tuple = ()) -> None:
-        """Execute a statement with no return value."""
+        """Execute a backend-specific statement with no return value."""
         if self._is_postgres:
             async with self._pool.acquire() as conn:
-                await conn.execute(_q(sql), *params)
+                await conn.execute(sql, *params)
         else:
-            async with self._write_lock:
-                await self._db.execute(sql, params)
-                await self._db.commit()
+            await self._submit(lambda conn: conn.execute(sql, params))
 
-    async def _insert_returning_id(
-        self, sql: str, params: tuple, id_column: str,
-    ) -> int:
-        """INSERT … and return the auto-generated ID."""
+    async def _insert_returning_id(self, sql: str, params: tuple) -> int:
+        """INSERT … and return the auto-generated ID.
+
+        *sql* must end in a single-column ``RETURNING`` on both backends.
+        """
         if self._is_postgres:
-            pg_sql = _q(sql) + f" RETURNING {id_column}"
             async with self._pool.acquire() as conn:
-                row = await conn.fetchrow(pg_sql, *params)
-                return row[id_column]
-        else:
-            async with self._write_lock:
-                cursor = await self._db.execute(sql, params)
-                await self._db.commit()
-                return cursor.lastrowid
+                row = await conn.fetchrow(sql, *params)
+                return row[0]              # single RETURNING column
+
+        return await self._submit(
+            lambda conn: conn.execute(sql, params).fetchone()[0]
+        )
 
     async def _executemany(self, sql: str, params_list: list[tuple]) -> None:
-        """Execute a statement for many parameter tuples."""
-        if not params_list:
+        """Execute a backend-specific statement for many parameter tuples."""
+        await self._executemany_all([(sql, params_list)])
+
+    async def _executemany_all(self, statements: list[tuple[str, list[tuple]]]) -> None:
+        """Run several ``(sql, params_list)`` executemany()s in one transaction.
+
+        On SQLite they form a single queued write op; on PostgreSQL they share
+        one connection and transaction.  Large batches are bound in chunks of
+        ``_EXECUTEMANY_CHUNK_ROWS``.
+        """
+        work = [
+            (sql, params_list[i:i + _EXECUTEMANY_CHUNK_ROWS])
+            for sql, params_list in statements
+            for i in range(0, len(params_list), _EXECUTEMANY_CHUNK_ROWS)
+        ]
+        if not work:
             return
         if self._is_postgres:
             async with self._pool.acquire() as conn:
-                await conn.executemany(_q(sql), params_list)
+                if len(work) == 1:
+                    await conn.executemany(*work[0])
+                    return
+                async with conn.transaction():
+                    for sql, chunk in work:
+                        await conn.executemany(sql, chunk)
         else:
-            async with self._write_lock:
-                await self._db.executemany(sql, params_list)
-                await self._db.commit()
+            def op(conn: sqlite3.Connection) -> None:
+                for sql, chunk in work:
+                    conn.executemany(sql, chunk)
+            await self._submit(op)
 
     # ------------------------------------------------------------------
     # ParameterSets
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _parameter_set_hash(
+        ps: ParameterSet,
+        sampling_mode: str,
+        cycle_interval: float,
+        cycles_per_market: int,
+        feed_gap_threshold: float,
+    ) -> str:
+        """Content hash identifying a parameter set + sampling config.
+
+        Covers every ``ParameterSet`` field (not just the persisted ones) so
+        two configs that differ only in runtime-only options never share an ID.
+        """
+        values = [
+            getattr(ps, f.name) for f in dataclasses.fields(ps)
+            if f.name != "parameter_set_id"
+        ]
+        values += [sampling_mode, cycle_interval, cycles_per_market, feed_gap_threshold]
+        key = "|".join(
+            v.value if isinstance(v, Enum) else repr(v) for v in values
+        )
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
     async def insert_parameter_set(
         self,
         ps: ParameterSet,
@@ -396,26 +1103,40 @@ class Database:
         cycles_per_market: int,
         feed_gap_threshold: float,
     ) -> int:
-        """Insert a parameter set and return its auto-generated ID."""
-        sql = """INSERT INTO ParameterSets
-                 (name, S0_points, delta_points, PairCap_points, trigger_rule,
-                  reference_price_source, sampling_mode, cycle_interval_seconds,
-                  cycles_per_market, feed_gap_threshold_seconds,
-                  stop_loss_threshold_points, created_at)
-                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+        """Insert (or reuse) a parameter set and return its ID.
+
+        Rows are keyed by a content hash, so an identical configuration maps
+        to the same ``parameter_set_id`` across restarts.  Hashes already seen
+        by this process are served from memory without a round-trip.
+        """
+        ps_hash = self._parameter_set_hash(
+            ps, sampling_mode, cycle_interval, cycles_per_market, feed_gap_threshold,
+        )
+        cached = self._ps_cache.get(ps_hash)
+        if cached is not None:
+            ps.parameter_set_id = cached
+            return cached
+
         params = (
             ps.name, ps.S0_points, ps.delta_points, ps.pair_cap_points,
             ps.trigger_rule.value, ps.reference_price_source.value,
             sampling_mode, cycle_interval, cycles_per_market,
             feed_gap_threshold,
             ps.stop_loss_threshold_points,
+            ps_hash,
             datetime.now(timezone.utc).isoformat(),
         )
-        ps.parameter_set_id = await self._insert_returning_id(
-            sql, params, "parameter_set_id",
-        )
+        if self._is_postgres:
+            async with self._pool.acquire() as conn:
+                row = await conn.fetchrow(_PG_SQL_UPSERT_PARAMETER_SET, *params)
+        else:
+            row = await self._submit(
+                lambda conn: conn.execute(_SQL_UPSERT_PARAMETER_SET, params).fetchone()
+            )
+        ps.parameter_set_id = row[0]
+        self._ps_cache[ps_hash] = ps.parameter_set_id
         logger.info(
-            "Inserted parameter set '%s' with id=%d",
+            "Registered parameter set '%s' with id=%d",
             ps.name, ps.parameter_set_id,
         )
         return ps.parameter_set_id
@@ -442,43 +1163,10 @@ class Database:
             time_remaining, cycle_interval,
             market_info.volume24hr, market_info.liquidity, market_info.open_interest,
         )
-
-        if self._is_postgres:
-            sql = """INSERT INTO Markets
-                     (market_id, crypto_asset, condition_id, yes_token_id,
-                      no_token_id, start_time, settlement_time,
-                      tick_size_points, parameter_set_id,
-                      time_remaining_at_start, cycle_interval_seconds,
-                      volume24hr, liquidity, open_interest)
-                     VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,$13,$14)
-                     ON CONFLICT (market_id) DO UPDATE SET
-                        crypto_asset = EXCLUDED.crypto_asset,
-                        condition_id = EXCLUDED.condition_id,
-                        yes_token_id = EXCLUDED.yes_token_id,
-                        no_token_id  = EXCLUDED.no_token_id,
-                        start_time   = EXCLUDED.start_time,
-                        settlement_time = EXCLUDED.settlement_time,
-                        tick_size_points = EXCLUDED.tick_size_points,
-                        parameter_set_id = EXCLUDED.parameter_set_id,
-                        time_remaining_at_start = EXCLUDED.time_remaining_at_start,
-                        cycle_interval_seconds  = EXCLUDED.cycle_interval_seconds,
-                        volume24hr = EXCLUDED.volume24hr,
-                        liquidity  = EXCLUDED.liquidity,
-                        open_interest = EXCLUDED.open_interest"""
-            async with self._pool.acquire() as conn:
-                await conn.execute(sql, *params)
-        else:
-            sql = """INSERT OR REPLACE INTO Markets
-                     (market_id, crypto_asset, condition_id, yes_token_id,
-                      no_token_id, start_time, settlement_time,
-                      tick_size_points, parameter_set_id,
-                      time_remaining_at_start, cycle_interval_seconds,
-                      volume24hr, liquidity, open_interest)
-                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
-            async with self._write_lock:
-                await self._db.execute(sql, params)
-                await self._db.commit()
-
+        await self._execute(
+            _PG_SQL_UPSERT_MARKET if self._is_postgres else _SQL_UPSERT_MARKET,
+            params,
+        )
         logger.debug("Inserted market %s", market_info.market_slug)
 
     # ------------------------------------------------------------------
@@ -488,35 +1176,12 @@ class Database:
     async def insert_attempt(self, attempt: Attempt) -> int:
         """Insert a new attempt and return its auto-generated ID."""
         if self._is_postgres:
-            # Partitioned Attempts requires ts (partition key); supply it explicitly
-            sql = """INSERT INTO Attempts
-                     (market_id, parameter_set_id, t1_timestamp,
-                      first_leg_side, P1_points, reference_yes_points,
-                      status, time_remaining_at_start,
-                      yes_spread_entry_points, no_spread_entry_points,
-                      delta_points, S0_points, stop_loss_threshold_points,
-                      yes_best_bid_size, yes_best_ask_size,
-                      no_best_bid_size, no_best_ask_size,
-                      yes_ask_depth_2tick, no_ask_depth_2tick,
-                      crypto_asset, ts)
-                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+            sql = _PG_SQL_INSERT_ATTEMPT
             params = self._attempt_insert_params(attempt, include_ts=True)
         else:
-            sql = """INSERT INTO Attempts
-                     (market_id, parameter_set_id, t1_timestamp,
-                      first_leg_side, P1_points, reference_yes_points,
-                      status, time_remaining_at_start,
-                      yes_spread_entry_points, no_spread_entry_points,
-                      delta_points, S0_points, stop_loss_threshold_points,
-                      yes_best_bid_size, yes_best_ask_size,
-                      no_best_bid_size, no_best_ask_size,
-                      yes_ask_depth_2tick, no_ask_depth_2tick,
-                      crypto_asset)
-                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+            sql = _SQL_INSERT_ATTEMPT
             params = self._attempt_insert_params(attempt)
-        attempt.attempt_id = await self._insert_returning_id(
-            sql, params, "attempt_id",
-        )
+        attempt.attempt_id = await self._insert_returning_id(sql, params)
         return attempt.attempt_id
 
     async def update_attempt_paired(self, attempt: Attempt) -> None:
@@ -538,25 +1203,9 @@ class Database:
         For PostgreSQL with partitioned Attempts, include_ts=True adds the
         partition key (ts) derived from t1_timestamp.
         """
-        base = (
-            attempt.market_id, attempt.parameter_set_id,
-            attempt.t1_timestamp.isoformat(),
-            attempt.first_leg_side.value,
-            attempt.P1_points, attempt.reference_yes_points,
-            attempt.status.value, attempt.time_remaining_at_start,
-            attempt.yes_spread_entry_points,
-            attempt.no_spread_entry_points,
-            attempt.delta_points,
-            attempt.S0_points,
-            attempt.stop_loss_threshold_points,
-            attempt.yes_best_bid_size,
-            attempt.yes_best_ask_size,
-            attempt.no_best_bid_size,
-            attempt.no_best_ask_size,
-            attempt.yes_ask_depth_2tick,
-            attempt.no_ask_depth_2tick,
-            attempt.crypto_asset,
-        )
+        v = _ATTEMPT_INSERT_GETTER(attempt)
+        t1 = v[2]
+        base = v[:2] + (t1.isoformat(), _to_us(t1)) + v[3:]
         if include_ts:
             # asyncpg + TIMESTAMP (no tz): pass naive UTC datetime
             dt = attempt.t1_timestamp
@@ -565,36 +1214,30 @@ class Database:
         return base
 
     @staticmethod
-    def _attempt_paired_params(attempt: Attempt) -> tuple:
-        """Build the parameter tuple for a paired UPDATE."""
-        return (
-            attempt.status.value,
-            attempt.t2_timestamp.isoformat() if attempt.t2_timestamp else None,
-            attempt.time_to_pair_seconds,
-            attempt.time_remaining_at_completion,
-            attempt.actual_opposite_price,
-            attempt.pair_cost_points,
-            attempt.pair_profit_points,
-            int(attempt.had_feed_gap),
-            attempt.closest_approach_points,
-            attempt.max_adverse_excursion_points,
-            attempt.yes_spread_exit_points,
-            attempt.no_spread_exit_points,
-            attempt.attempt_id,
-        )
-
-    @staticmethod
-    def _attempt_failed_params(attempt: Attempt) -> tuple:
-        """Build the parameter tuple for a failed UPDATE."""
-        return (
-            attempt.status.value,
-            attempt.time_remaining_at_completion,
-            attempt.fail_reason,
-            int(attempt.had_feed_gap),
-            attempt.closest_approach_points,
-            attempt.max_adverse_excursion_points,
-            attempt.attempt_id,
-        )
+    def _attempt_update_params(
+        attempt: Attempt,
+        columns: tuple[str, ...],
+        getter: operator.attrgetter,
+    ) -> tuple[tuple[str, ...], tuple]:
+        """Return ``(changed columns, params)`` for a completion UPDATE.
+
+        An attempt is inserted once with every completion column at its
+        default (NULL, or FALSE for ``had_feed_gap``) and completed once, so
+        any column still at that default is unchanged and left out of the SET.
+        """
+        changed: list[str] = []
+        params: list = []
+        for col, value in zip(columns, getter(attempt)):
+            if value is None or value is False:
+                continue
+            if col == "t2_timestamp":
+                changed += ("t2_timestamp", "t2_ts_us")
+                params += (value.isoformat(), _to_us(value))
+            else:
+                changed.append(col)
+                params.append(value)
+        params.append(attempt.attempt_id)
+        return tuple(changed), tuple(params)
 
     async def insert_attempts_batch(self, attempts: list[Attempt]) -> None:
         """Insert multiple attempts in a single transaction.
@@ -606,125 +1249,105 @@ class Database:
             return
 
         if self._is_postgres:
-            insert_sql = """INSERT INTO Attempts
-                     (market_id, parameter_set_id, t1_timestamp,
-                      first_leg_side, P1_points, reference_yes_points,
-                      status, time_remaining_at_start,
-                      yes_spread_entry_points, no_spread_entry_points,
-                      delta_points, S0_points, stop_loss_threshold_points,
-                      yes_best_bid_size, yes_best_ask_size,
-                      no_best_bid_size, no_best_ask_size,
-                      yes_ask_depth_2tick, no_ask_depth_2tick,
-                      crypto_asset, ts)
-                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
-            pg_sql = _q(insert_sql) + " RETURNING attempt_id"
-            try:
-                async with self._pool.acquire() as conn:
-                    async with conn.transaction():
-                        for attempt in attempts:
-                            row = await conn.fetchrow(
-                                pg_sql, *self._attempt_insert_params(attempt, include_ts=True),
-                            )
-                            attempt.attempt_id = row["attempt_id"]
-            except Exception:
-                raise
+            async with self._pool.acquire() as conn:
+                async with conn.transaction():
+                    for attempt in attempts:
+                        row = await conn.fetchrow(
+                            _PG_SQL_INSERT_ATTEMPT,
+                            *self._attempt_insert_params(attempt, include_ts=True),
+                        )
+                        attempt.attempt_id = row[0]
         else:
-            insert_sql = """INSERT INTO Attempts
-                 (market_id, parameter_set_id, t1_timestamp,
-                  first_leg_side, P1_points, reference_yes_points,
-                  status, time_remaining_at_start,
-                  yes_spread_entry_points, no_spread_entry_points,
-                  delta_points, S0_points, stop_loss_threshold_points,
-                  yes_best_bid_size, yes_best_ask_size,
-                  no_best_bid_size, no_best_ask_size,
-                  yes_ask_depth_2tick, no_ask_depth_2tick,
-                  crypto_asset)
-                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
-            async with self._write_lock:
-                for attempt in attempts:
-                    cursor = await self._db.execute(
-                        insert_sql, self._attempt_insert_params(attempt),
-                    )
-                    attempt.attempt_id = cursor.lastrowid
-                await self._db.commit()       # single commit for all
+            params_list = [self._attempt_insert_params(a) for a in attempts]
 
-    async def update_attempts_paired_batch(self, attempts: list[Attempt]) -> None:
-        """Update multiple paired attempts in a single transaction."""
-        if not attempts:
-            return
+            def op(conn: sqlite3.Connection) -> list[int]:
+                return [
+                    conn.execute(_SQL_INSERT_ATTEMPT, params).fetchone()[0]
+                    for params in params_list
+                ]
+            for attempt, attempt_id in zip(attempts, await self._submit(op)):
+                attempt.attempt_id = attempt_id
 
-        sql = """UPDATE Attempts SET
-                 status = ?, t2_timestamp = ?,
-                 time_to_pair_seconds = ?, time_remaining_at_completion = ?,
-                 actual_opposite_price = ?, pair_cost_points = ?,
-                 pair_profit_points = ?, had_feed_gap = ?,
-                 closest_approach_points = ?,
-                 max_adverse_excursion_points = ?,
-                 yes_spread_exit_points = ?, no_spread_exit_points = ?
-                 WHERE attempt_id = ?"""
-        params_list = [self._attempt_paired_params(a) for a in attempts]
-        await self._executemany(sql, params_list)
-        await self._upsert_attempt_stats(attempts)
+    def _attempt_update_statements(
+        self,
+        attempts: list[Attempt],
+        columns: tuple[str, ...],
+        getter: operator.attrgetter,
+    ) -> list[tuple[str, list[tuple]]]:
+        """Group completion UPDATEs into one ``(sql, params_list)`` per shape."""
+        by_shape: dict[tuple[str, ...], list[tuple]] = defaultdict(list)
+        for attempt in attempts:
+            changed, params = self._attempt_update_params(attempt, columns, getter)
+            by_shape[changed].append(params)
+        return [
+            (_attempt_update_sql(changed, self._is_postgres), params_list)
+            for changed, params_list in by_shape.items()
+        ]
 
-    async def update_attempts_failed_batch(self, attempts: list[Attempt]) -> None:
-        """Update multiple failed attempts in a single transaction."""
+    async def _update_attempts_batch(
+        self,
+        attempts: list[Attempt],
+        columns: tuple[str, ...],
+        getter: operator.attrgetter,
+    ) -> None:
+        """Write completion fields, one executemany per changed-column shape."""
         if not attempts:
             return
 
-        sql = """UPDATE Attempts SET
-                 status = ?, time_remaining_at_completion = ?,
-                 fail_reason = ?, had_feed_gap = ?,
-                 closest_approach_points = ?,
-                 max_adverse_excursion_points = ?
-                 WHERE attempt_id = ?"""
-        params_list = [self._attempt_failed_params(a) for a in attempts]
-        await self._executemany(sql, params_list)
+        await self._executemany_all(
+            self._attempt_update_statements(attempts, columns, getter)
+        )
         await self._upsert_attempt_stats(attempts)
 
-    # ------------------------------------------------------------------
-    # Attempts — stop loss (hybrid of paired + failed fields)
-    # ------------------------------------------------------------------
-
-    @staticmethod
-    def _attempt_stopped_params(attempt: Attempt) -> tuple:
-        """Build the parameter tuple for a stop-loss UPDATE.
+    async def update_attempts_paired_batch(self, attempts: list[Attempt]) -> None:
+        """Update multiple paired attempts."""
+        await self._update_attempts_batch(
+            attempts, _ATTEMPT_PAIRED_COLUMNS, _ATTEMPT_PAIRED_GETTER,
+        )
 
-        Stop-loss exits have fields from both the paired path (t2_timestamp,
-        pair_profit_points, exit spreads) and the failed path (fail_reason).
-        """
-        return (
-            attempt.status.value,
-            attempt.t2_timestamp.isoformat() if attempt.t2_timestamp else None,
-            attempt.time_to_pair_seconds,
-            attempt.time_remaining_at_completion,
-            attempt.fail_reason,
-            attempt.pair_cost_points,
-            attempt.pair_profit_points,
-            int(attempt.had_feed_gap),
-            attempt.closest_approach_points,
-            attempt.max_adverse_excursion_points,
-            attempt.yes_spread_exit_points,
-            attempt.no_spread_exit_points,
-            attempt.attempt_id,
+    async def update_attempts_failed_batch(self, attempts: list[Attempt]) -> None:
+        """Update multiple failed attempts."""
+        await self._update_attempts_batch(
+            attempts, _ATTEMPT_FAILED_COLUMNS, _ATTEMPT_FAILED_GETTER,
         )
 
     async def update_attempts_stopped_batch(self, attempts: list[Attempt]) -> None:
-        """Update multiple stop-loss attempts in a single transaction."""
-        if not attempts:
-            return
+        """Update multiple stop-loss attempts."""
+        await self._update_attempts_batch(
+            attempts, _ATTEMPT_STOPPED_COLUMNS, _ATTEMPT_STOPPED_GETTER,
+        )
 
-        sql = """UPDATE Attempts SET
-                 status = ?, t2_timestamp = ?,
-                 time_to_pair_seconds = ?, time_remaining_at_completion = ?,
-                 fail_reason = ?, pair_cost_points = ?,
-                 pair_profit_points = ?, had_feed_gap = ?,
-                 closest_approach_points = ?,
-                 max_adverse_excursion_points = ?,
-                 yes_spread_exit_points = ?, no_spread_exit_points = ?
-                 WHERE attempt_id = ?"""
-        params_list = [self._attempt_stopped_params(a) for a in attempts]
-        await self._executemany(sql, params_list)
-        await self._upsert_attempt_stats(attempts)
+    async def finalise_attempts(
+        self,
+        paired: list[Attempt],
+        stopped: list[Attempt],
+        lifecycle: Iterable[LifecycleBatch] = (),
+    ) -> None:
+        """Persist completions and lifecycle rows atomically.
+
+        The paired / stop-loss UPDATEs and the lifecycle INSERTs are bound
+        as a single write (one queued op on SQLite, one transaction on
+        PostgreSQL) instead of one per call.  *lifecycle* may hold the
+        batches of several cycles; they go out as one INSERT.
+        """
+        statements = [
+            *self._attempt_update_statements(
+                paired, _ATTEMPT_PAIRED_COLUMNS, _ATTEMPT_PAIRED_GETTER,
+            ),
+            *self._attempt_update_statements(
+                stopped, _ATTEMPT_STOPPED_COLUMNS, _ATTEMPT_STOPPED_GETTER,
+            ),
+        ]
+        lifecycle_params = [
+            row for batch in lifecycle for row in self._lifecycle_params(batch)
+        ]
+        if lifecycle_params:
+            statements.append((
+                _PG_SQL_INSERT_LIFECYCLE if self._is_postgres else _SQL_INSERT_LIFECYCLE,
+                lifecycle_params,
+            ))
+        await self._executemany_all(statements)
+        await self._upsert_attempt_stats(paired + stopped)
 
     # ------------------------------------------------------------------
     # attempt_stats — live aggregate upsert (PG only)
@@ -774,7 +1397,7 @@ class Database:
                 dt.date(),
                 attempt.status.value,
                 attempt.fail_reason,
-                attempt.first_leg_side.value,
+                attempt.first_leg_side_value,
                 dt.hour,
             )
             g = groups[key]
@@ -788,32 +1411,6 @@ class Database:
         if not groups:
             return
 
-        upsert_sql = """
-            INSERT INTO attempt_stats (
-                delta_points, stop_loss_threshold_points, P1_points, time_minute,
-                crypto_asset, attempt_date, status, fail_reason,
-                first_leg_side, hour_of_day,
-                attempts, pairs, total_pnl, sum_time_to_pair, sum_pair_profit
-            ) VALUES ($1,$2,$3,$4,$5,$6::date,$7,$8,$9,$10,$11,$12,$13,$14,$15)
-            ON CONFLICT (
-                delta_points,
-                COALESCE(stop_loss_threshold_points, -1),
-                P1_points,
-                time_minute,
-                crypto_asset,
-                attempt_date,
-                status,
-                COALESCE(fail_reason, ''),
-                first_leg_side,
-                hour_of_day
-            ) DO UPDATE SET
-                attempts         = attempt_stats.attempts         + EXCLUDED.attempts,
-                pairs            = attempt_stats.pairs            + EXCLUDED.pairs,
-                total_pnl        = attempt_stats.total_pnl        + EXCLUDED.total_pnl,
-                sum_time_to_pair = attempt_stats.sum_time_to_pair + EXCLUDED.sum_time_to_pair,
-                sum_pair_profit  = attempt_stats.sum_pair_profit  + EXCLUDED.sum_pair_profit
-        """
-
         params_list = []
         for key, vals in groups.items():
             (delta, sl, p1, time_min, asset, date_str, status,
@@ -827,7 +1424,7 @@ class Database:
 
         try:
             async with self._pool.acquire() as conn:
-                await conn.executemany(upsert_sql, params_list)
+                await conn.executemany(_PG_SQL_UPSERT_ATTEMPT_STATS, params_list)
         except Exception as exc:
             logger.warning("attempt_stats upsert failed (non-fatal): %s", exc)
 
@@ -852,14 +1449,6 @@ class Database:
         winning_outcome: Optional[str] = None,
     ) -> None:
         """Write final summary statistics to the Markets row."""
-        sql = """UPDATE Markets SET
-                 total_attempts = ?, total_pairs = ?, total_failed = ?,
-                 settlement_failures = ?, pair_rate = ?,
-                 avg_time_to_pair = ?, median_time_to_pair = ?,
-                 max_concurrent_attempts = ?, total_cycles_run = ?,
-                 anomaly_count = ?, actual_settlement_time = ?, notes = ?,
-                 winning_outcome = ?
-                 WHERE market_id = ?"""
         params = (
             total_attempts, total_pairs, total_failed,
             settlement_failures, pair_rate,
@@ -869,52 +1458,76 @@ class Database:
             winning_outcome,
             market_id,
         )
-        await self._execute(sql, params)
+        await self._execute(
+            _PG_SQL_UPDATE_MARKET_SUMMARY if self._is_postgres
+            else _SQL_UPDATE_MARKET_SUMMARY,
+            params,
+        )
         logger.debug("Updated market summary for %s", market_id)
 
     # ------------------------------------------------------------------
     # Snapshots (optional)
     # ------------------------------------------------------------------
 
-    async def insert_snapshot(self, snapshot: Snapshot) -> None:
-        """Insert a cycle snapshot (used when enable_snapshots is True)."""
-        sql = """INSERT INTO Snapshots
-                 (market_id, cycle_number, timestamp, yes_bid_points,
-                  yes_ask_points, no_bid_points, no_ask_points,
-                  yes_last_trade_points, no_last_trade_points,
-                  time_remaining, active_attempts_count, anomaly_flag,
-                  yes_period_low_ask_points, no_period_low_ask_points)
-                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
-        params = (
+    @staticmethod
+    def _snapshot_params(snapshot: Snapshot) -> tuple:
+        ts = snapshot.timestamp
+        return (
             snapshot.market_id, snapshot.cycle_number,
-            snapshot.timestamp.isoformat(),
+            ts.isoformat(), _to_us(ts),
             snapshot.yes_bid_points, snapshot.yes_ask_points,
             snapshot.no_bid_points, snapshot.no_ask_points,
             snapshot.yes_last_trade_points, snapshot.no_last_trade_points,
             snapshot.time_remaining_seconds,
-            snapshot.active_attempts_count, int(snapshot.anomaly_flag),
+            snapshot.active_attempts_count, snapshot.anomaly_flag,
             snapshot.yes_period_low_ask_points,
             snapshot.no_period_low_ask_points,
         )
-        await self._execute(sql, params)
+
+    async def insert_snapshot(self, snapshot: Snapshot) -> None:
+        """Insert a cycle snapshot (used when enable_snapshots is True)."""
+        await self._execute(
+            _PG_SQL_INSERT_SNAPSHOT if self._is_postgres else _SQL_INSERT_SNAPSHOT,
+            self._snapshot_params(snapshot),
+        )
+
+    async def insert_snapshots_batch(self, snapshots: list[Snapshot]) -> None:
+        """Batch-insert snapshots buffered over several cycles."""
+        if not snapshots:
+            return
+        await self._executemany(
+            _PG_SQL_INSERT_SNAPSHOT if self._is_postgres else _SQL_INSERT_SNAPSHOT,
+            [self._snapshot_params(snapshot) for snapshot in snapshots],
+        )
 
     # ------------------------------------------------------------------
     # AttemptLifecycle (optional, high-volume)
     # ------------------------------------------------------------------
 
-    async def insert_lifecycle_batch(self, records: list[LifecycleRecord]) -> None:
-        """Batch-insert lifecycle tracking records."""
-        sql = """INSERT INTO AttemptLifecycle
-                 (attempt_id, cycle_number, timestamp,
-                  opposite_ask_points, distance_to_trigger,
-                  closest_approach_so_far)
-                 VALUES (?, ?, ?, ?, ?, ?)"""
-        params_list = [
-            (
-                r.attempt_id, r.cycle_number, r.timestamp.isoformat(),
-                r.opposite_ask_points, r.distance_to_trigger,
-                r.closest_approach_so_far,
-            )
-            for r in records
-        ]
-        await self._executemany(sql, params_list)
+    @staticmethod
+    def _lifecycle_params(batch: LifecycleBatch) -> list[tuple]:
+        """Zip a column-wise batch into AttemptLifecycle parameter tuples.
+
+        The batch has a single cycle/timestamp, so the timestamp is
+        formatted once for all rows.
+        """
+        n = len(batch)
+        ts = batch.timestamp
+        return list(zip(
+            batch.attempt_ids,
+            repeat(batch.cycle_number, n),
+            repeat(ts.isoformat(), n),
+            repeat(_to_us(ts), n),
+            batch.opposite_ask_points,
+            batch.distances_to_trigger,
+            batch.closest_approaches,
+        ))
+
+    async def insert_lifecycle_batch(self, batch: LifecycleBatch) -> None:
+        """Batch-insert one cycle's lifecycle tracking rows."""
+        if not batch:
+            return
+        await self._executemany(
+            _PG_SQL_INSERT_LIFECYCLE if self._is_postgres else _SQL_INSERT_LIFECYCLE,
+            self._lifecycle_params(batch),
+        )
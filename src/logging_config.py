@@ -3,11 +3,20 @@
 When the Rich dashboard is active, console output is suppressed so that
 ``rich.live.Live`` can own stdout.  All log output still goes to the
 log file.
+
+Records are handed to a ``QueueHandler`` on the calling thread and written
+by a ``QueueListener`` thread, so console/file I/O never blocks the event
+loop.  Call :func:`stop_logging` on shutdown to flush the queue.
 """
 
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
+
+# Background thread draining the log queue (set by setup_logging)
+_listener: Optional[QueueListener] = None
 
 
 def setup_logging(
@@ -23,11 +32,15 @@ def setup_logging(
         enable_console: If ``False``, suppress the console handler
             (used when the rich dashboard takes over stdout).
     """
+    global _listener
+
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper(), logging.INFO))
 
     # Clear existing handlers to avoid duplicates on re-init
+    stop_logging()
     root_logger.handlers.clear()
+    handlers: list[logging.Handler] = []
 
     # --- Console handler (optional) ---
     if enable_console:
@@ -37,7 +50,7 @@ def setup_logging(
         )
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(console_fmt)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # --- File handler (if specified) ---
     if log_file:
@@ -52,7 +65,14 @@ def setup_logging(
             log_file, encoding="utf-8", maxBytes=50 * 1024 * 1024, backupCount=3
         )
         file_handler.setFormatter(file_fmt)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # --- Queue: the event loop only enqueues; the listener thread writes ---
+    if handlers:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
 
     # Suppress noisy third-party loggers
     logging.getLogger("websockets").setLevel(logging.WARNING)
@@ -62,3 +82,11 @@ def setup_logging(
         "Logging initialized — level=%s, file=%s, console=%s",
         level, log_file or "none", enable_console,
     )
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread (idempotent)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
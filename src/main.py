@@ -15,7 +15,8 @@ import logging
 from .asset_manager import AssetManager
 from .config import load_config
 from .database import Database
-from .logging_config import setup_logging
+from .logging_config import setup_logging, stop_logging
+from .market_discovery import MarketDiscovery
 from .models import ParameterSet, ReferencePriceSource, TriggerRule
 from .rest_client import CLOBRestClient
 
@@ -106,6 +107,9 @@ async def main() -> None:
     else:
         logger.warning("CLOB API health check failed — continuing with WebSocket only")
 
+    # --- Market discovery (shared: one Gamma connection pool and cache) ---
+    discovery = MarketDiscovery()
+
     # --- Shutdown event + event log ---
     shutdown_event = asyncio.Event()
 
@@ -123,6 +127,7 @@ async def main() -> None:
             config=config,
             database=db,
             rest_client=rest_client,
+            market_discovery=discovery,
             shutdown_event=shutdown_event,
             event_log=event_log,
         )
@@ -169,8 +174,10 @@ async def main() -> None:
 
         # Cleanup
         await rest_client.close()
+        await discovery.close()
         await db.close()
         logger.info("Shutdown complete")
+        stop_logging()
 
 
 # ---------------------------------------------------------------------------
@@ -181,19 +188,18 @@ async def _periodic_status(
     managers: list[AssetManager], shutdown_event: asyncio.Event
 ) -> None:
     """Log a status line for each asset every STATUS_INTERVAL seconds."""
-    while not shutdown_event.is_set():
-        sleep_task = asyncio.ensure_future(asyncio.sleep(STATUS_INTERVAL))
-        event_task = asyncio.ensure_future(shutdown_event.wait())
-        _, pending = await asyncio.wait(
-            [sleep_task, event_task], return_when=asyncio.FIRST_COMPLETED
-        )
-        for t in pending:
-            t.cancel()
-        if shutdown_event.is_set():
-            break
-
-        lines = ["--- STATUS ---"]
-        for m in managers:
-            lines.append(f"  [STATUS] {m.status_line}")
-        logger.info("\n".join(lines))
-
+    # One long-lived waiter; asyncio.wait(timeout=…) leaves it pending
+    shutdown_wait = asyncio.ensure_future(shutdown_event.wait())
+    try:
+        while True:
+            await asyncio.wait((shutdown_wait,), timeout=STATUS_INTERVAL)
+            if shutdown_wait.done():
+                break
+
+            if not logger.isEnabledFor(logging.INFO):
+                continue
+            logger.info("--- STATUS ---")
+            for m in managers:
+                logger.info("  [STATUS] %s", m.status_line)
+    finally:
+        shutdown_wait.cancel()
@@ -11,13 +11,15 @@ Discovery approach:
   4. Fall back to broader search if the direct slug query misses
 """
 
-import json
+import asyncio
 import logging
+import re
 import time as _time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 import aiohttp
+import orjson
 
 from .models import MarketInfo
 from .price_utils import price_to_points
@@ -29,20 +31,120 @@ GAMMA_API_BASE = "https://gamma-api.polymarket.com"
 # 15-minute windows are on 900-second boundaries
 WINDOW_SECONDS = 900
 
+# Every request goes to the same Gamma host: keep a few warm sockets so
+# discovery calls reuse a connection instead of paying TCP + TLS each time.
+_CONNECTOR_LIMIT = 32
+_CONNECTOR_LIMIT_PER_HOST = 8
+_KEEPALIVE_SECONDS = 75
+_DNS_CACHE_SECONDS = 300
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3)
+# Gamma compresses its JSON well; aiohttp decompresses transparently.
+_SESSION_HEADERS = {
+    "User-Agent": "polymarket-pair-bot/1.0",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# The broad search only asks for events ending within this horizon, so
+# Gamma returns the handful of short-dated markets instead of every open
+# event sorted by start date.
+_BROAD_SEARCH_HORIZON_SECONDS = 4 * WINDOW_SECONDS
+_BROAD_SEARCH_LIMIT = 50
+
+# Trailing unix timestamp of a slug; the 15-minute family's is a window start
+_SLUG_TS_RE = re.compile(r"-(\d+)$")
+_WINDOW_SLUG_RE = re.compile(r"-updown-15m-(\d+)$")
+
+# Outcome labels for the YES (Up) and NO (Down) tokens
+_YES_OUTCOMES = frozenset(("up", "yes"))
+_NO_OUTCOMES = frozenset(("down", "no"))
+
+# Slug lookups are cached briefly: an event barely changes within its
+# window, and misses get a shorter life so a new market shows up quickly.
+_SLUG_CACHE_TTL_SECONDS = 10.0
+_SLUG_CACHE_MISS_TTL_SECONDS = 2.0
+_SLUG_CACHE_MAX_ENTRIES = 256
+
+# After this many consecutive Gamma failures, stop calling it for a while
+# and answer from whatever is cached instead of waiting on more timeouts
+_CIRCUIT_FAILURE_THRESHOLD = 5
+_CIRCUIT_OPEN_SECONDS = 10.0
+
+# A prefetched next-window market stays cached until the rotation uses it
+_PREFETCH_CACHE_TTL_SECONDS = 120.0
+
+
+def _slug_window_start(slug: str) -> Optional[int]:
+    """Return the window start encoded in a 15-minute slug, else None."""
+    m = _WINDOW_SLUG_RE.search(slug)
+    return int(m.group(1)) if m else None
+
+
+def _decode_json_list(raw):
+    """Decode a JSON-array string field; other values pass through unchanged.
+
+    Strings that are not an array literal become ``[]`` without going
+    through the decoder and its exception path.
+    """
+    if not isinstance(raw, str):
+        return raw
+    if not raw.startswith("["):
+        return []
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return []
+
 
 class MarketDiscovery:
-    """Discovers active Polymarket 15-minute crypto markets via the Gamma API."""
+    """Discovers active Polymarket 15-minute crypto markets via the Gamma API.
+
+    One instance is meant to be shared by every caller so they share its
+    connection pool, slug cache and circuit breaker.  Use it as
+    ``async with MarketDiscovery() as discovery: ...`` or call ``close()``
+    when done.
+    """
 
     def __init__(self):
         self._session: Optional[aiohttp.ClientSession] = None
+        # slug -> (monotonic expiry, result)
+        self._cache: dict[str, tuple[float, Optional[MarketInfo]]] = {}
+        # slug -> lookup in progress, shared by concurrent callers
+        self._inflight: dict[str, asyncio.Task[Optional[MarketInfo]]] = {}
+        # Strong references to fire-and-forget prefetches
+        self._prefetch_tasks: set[asyncio.Task[None]] = set()
+        # Circuit breaker state for Gamma outages
+        self._consecutive_failures = 0
+        self._circuit_open_until = 0.0
+        # (asset, market_type) -> (window_start, candidate slugs)
+        self._candidate_slugs: dict[tuple[str, str], tuple[int, tuple[str, ...]]] = {}
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit=_CONNECTOR_LIMIT,
+                limit_per_host=_CONNECTOR_LIMIT_PER_HOST,
+                keepalive_timeout=_KEEPALIVE_SECONDS,
+                ttl_dns_cache=_DNS_CACHE_SECONDS,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=_REQUEST_TIMEOUT,
+                headers=_SESSION_HEADERS,
+            )
         return self._session
 
+    async def __aenter__(self) -> "MarketDiscovery":
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
     async def close(self) -> None:
         """Close the HTTP session."""
+        for task in self._prefetch_tasks:
+            task.cancel()
         if self._session and not self._session.closed:
             await self._session.close()
 
@@ -60,18 +162,41 @@ class MarketDiscovery:
           2. Query the Gamma ``/events`` endpoint by exact slug
           3. If not found, try adjacent windows (next, previous)
           4. If still not found, fall back to a broader search
+
+        The three slug queries are issued concurrently so a miss on the
+        current window costs one round-trip, not three; results are still
+        taken in priority order.
         """
         now_ts = int(_time.time())
         window_start = now_ts - (now_ts % WINDOW_SECONDS)
 
-        # Try current window, then next, then previous
-        candidates = [window_start, window_start + WINDOW_SECONDS, window_start - WINDOW_SECONDS]
+        # Try current window, then next, then previous; the slugs only
+        # change at a window boundary so they are built once per window
+        key = (crypto_asset, market_type)
+        cached = self._candidate_slugs.get(key)
+        if cached is None or cached[0] != window_start:
+            prefix = f"{crypto_asset}-updown-{market_type}-"
+            slugs = (
+                prefix + str(window_start),
+                prefix + str(window_start + WINDOW_SECONDS),
+                prefix + str(window_start - WINDOW_SECONDS),
+            )
+            self._candidate_slugs[key] = cached = (window_start, slugs)
 
-        for ts in candidates:
-            slug = f"{crypto_asset}-updown-{market_type}-{ts}"
-            result = await self._query_event_by_slug(slug, crypto_asset)
-            if result is not None:
-                return result
+        tasks = [
+            asyncio.create_task(self._query_event_by_slug(slug, crypto_asset))
+            for slug in cached[1]
+        ]
+        try:
+            for task in tasks:
+                result = await task
+                if result is not None:
+                    return result
+        finally:
+            # Stop waiting on lookups we no longer need; they finish in the
+            # background and warm the cache
+            for task in tasks:
+                task.cancel()
 
         # Fallback: broader search
         logger.info(
@@ -80,6 +205,19 @@ class MarketDiscovery:
         )
         return await self._search_events_broadly(crypto_asset, market_type)
 
+    async def find_active_markets_batch(
+        self, crypto_assets: list[str], market_type: str = "15m"
+    ) -> dict[str, Optional[MarketInfo]]:
+        """Find the active market for several assets concurrently.
+
+        Returns a mapping of asset -> market (None where nothing was found),
+        costing roughly one round-trip instead of one per asset.
+        """
+        results = await asyncio.gather(
+            *(self.find_active_market(asset, market_type) for asset in crypto_assets)
+        )
+        return dict(zip(crypto_assets, results))
+
     async def find_market_by_slug(
         self, slug: str, crypto_asset: str
     ) -> Optional[MarketInfo]:
@@ -90,12 +228,77 @@ class MarketDiscovery:
         """
         return await self._query_event_by_slug(slug, crypto_asset)
 
+    def prefetch_next_window(
+        self, crypto_asset: str, market_type: str = "15m"
+    ) -> asyncio.Task[None]:
+        """Warm the cache with the market for the window after the current one.
+
+        Fire-and-forget: meant to be scheduled shortly before settlement so
+        the post-settlement ``find_market_by_slug`` is served from cache.
+        """
+        now_ts = int(_time.time())
+        next_start = now_ts - (now_ts % WINDOW_SECONDS) + WINDOW_SECONDS
+        slug = f"{crypto_asset}-updown-{market_type}-{next_start}"
+
+        task = asyncio.create_task(self._prefetch_slug(slug, crypto_asset))
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+        return task
+
+    async def _prefetch_slug(self, slug: str, crypto_asset: str) -> None:
+        result = await self._query_event_by_slug(slug, crypto_asset)
+        if result is not None:
+            # Outlive the normal TTL: the rotation may come a while later
+            self._cache[slug] = (_time.monotonic() + _PREFETCH_CACHE_TTL_SECONDS, result)
+            logger.debug("Prefetched next market %s", slug)
+
     # ------------------------------------------------------------------
     # Strategy 1: Direct slug lookup (fast path)
     # ------------------------------------------------------------------
 
     async def _query_event_by_slug(
         self, slug: str, crypto_asset: str
+    ) -> Optional[MarketInfo]:
+        """Return the market for *slug*, served from the short-TTL cache.
+
+        Concurrent callers for the same slug share one request.  The lookup
+        runs in its own task and is awaited through ``asyncio.shield`` so a
+        cancelled caller does not abort it for the others.  While the circuit
+        breaker is open the last cached value (possibly stale) is returned
+        without touching the network.
+        """
+        now = _time.monotonic()
+        cached = self._cache.get(slug)
+        if cached is not None and (now < cached[0] or self._circuit_open()):
+            result = cached[1]
+            if result is None or result.settlement_time > datetime.now(timezone.utc):
+                return result
+        if self._circuit_open():
+            return None
+
+        task = self._inflight.get(slug)
+        if task is None:
+            task = asyncio.create_task(self._load_event_by_slug(slug, crypto_asset))
+            self._inflight[slug] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(slug, None))
+        return await asyncio.shield(task)
+
+    async def _load_event_by_slug(
+        self, slug: str, crypto_asset: str
+    ) -> Optional[MarketInfo]:
+        """Fetch *slug* and record the outcome in the cache."""
+        result = await self._fetch_event_by_slug(slug, crypto_asset)
+
+        ttl = _SLUG_CACHE_TTL_SECONDS if result is not None else _SLUG_CACHE_MISS_TTL_SECONDS
+        self._cache.pop(slug, None)
+        self._cache[slug] = (_time.monotonic() + ttl, result)
+        if len(self._cache) > _SLUG_CACHE_MAX_ENTRIES:
+            # dicts keep insertion order: drop the oldest entry
+            del self._cache[next(iter(self._cache))]
+        return result
+
+    async def _fetch_event_by_slug(
+        self, slug: str, crypto_asset: str
     ) -> Optional[MarketInfo]:
         """Query ``GET /events?slug={slug}`` and parse the result."""
         session = await self._ensure_session()
@@ -105,7 +308,8 @@ class MarketDiscovery:
                 f"{GAMMA_API_BASE}/events", params={"slug": slug}
             ) as resp:
                 resp.raise_for_status()
-                events = await resp.json()
+                events = orjson.loads(await resp.read())
+            self._consecutive_failures = 0
 
             if not events or not isinstance(events, list):
                 return None
@@ -119,13 +323,32 @@ class MarketDiscovery:
 
             return self._parse_event(event, crypto_asset)
 
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.warning("Gamma API request failed for slug %s: %s", slug, e)
+            self._record_failure()
             return None
         except Exception as e:
             logger.error("Unexpected error querying slug %s: %s", slug, e)
             return None
 
+    def _circuit_open(self) -> bool:
+        return _time.monotonic() < self._circuit_open_until
+
+    def _record_failure(self) -> None:
+        """Count a failed Gamma request; open the circuit past the threshold.
+
+        The counter only resets on success, so once the open period lapses
+        a single further failure re-opens the circuit straight away.
+        """
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= _CIRCUIT_FAILURE_THRESHOLD and not self._circuit_open():
+            self._circuit_open_until = _time.monotonic() + _CIRCUIT_OPEN_SECONDS
+            logger.warning(
+                "Gamma API failing (%d consecutive errors) — pausing requests for %.0fs",
+                self._consecutive_failures,
+                _CIRCUIT_OPEN_SECONDS,
+            )
+
     # ------------------------------------------------------------------
     # Strategy 2: Broader search (fallback)
     # ------------------------------------------------------------------
@@ -134,13 +357,21 @@ class MarketDiscovery:
         self, crypto_asset: str, market_type: str
     ) -> Optional[MarketInfo]:
         """Search for open events matching the slug pattern."""
+        if self._circuit_open():
+            return None
         session = await self._ensure_session()
         slug_pattern = f"{crypto_asset}-updown-{market_type}"
 
+        now = datetime.now(timezone.utc)
+        horizon = now + timedelta(seconds=_BROAD_SEARCH_HORIZON_SECONDS)
+
         try:
             params = {
+                "active": "true",
                 "closed": "false",
-                "limit": "100",
+                "end_date_min": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "end_date_max": horizon.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "limit": str(_BROAD_SEARCH_LIMIT),
                 "order": "startDate",
                 "ascending": "true",
             }
@@ -148,37 +379,57 @@ class MarketDiscovery:
                 f"{GAMMA_API_BASE}/events", params=params
             ) as resp:
                 resp.raise_for_status()
-                events = await resp.json()
+                events = orjson.loads(await resp.read())
+            self._consecutive_failures = 0
 
             if not isinstance(events, list):
                 return None
 
-            now = datetime.now(timezone.utc)
-            best: Optional[MarketInfo] = None
+            now_ts = int(now.timestamp())
+            # (settlement ts, event, parsed result or None if not parsed yet)
+            upcoming: list[tuple[float, dict, Optional[MarketInfo]]] = []
 
+            # Cheap filters first: only the live event and the eventual pick
+            # of the upcoming ones go through the full _parse_event
             for event in events:
+                if event.get("closed", False):
+                    continue
                 event_slug = (event.get("slug", "") or "").lower()
                 if slug_pattern not in event_slug:
                     continue
-                if event.get("closed", False):
+
+                start_ts = _slug_window_start(event_slug)
+                if start_ts is not None:
+                    settle_ts = start_ts + WINDOW_SECONDS
+                    if settle_ts <= now_ts:
+                        continue  # already settled
+                    if start_ts <= now_ts:
+                        result = self._parse_event(event, crypto_asset)
+                        if result is not None:
+                            return result  # Currently live — use immediately
+                        continue
+                    upcoming.append((settle_ts, event, None))
                     continue
 
+                # Other slug families: the window comes from the event itself
                 result = self._parse_event(event, crypto_asset)
                 if result is None:
                     continue
-
-                # Prefer the market whose window contains "now"
-                start_str = event.get("startTime", "")
-                if start_str:
+                if event.get("startTime"):
                     start_dt = datetime.fromisoformat(
-                        start_str.replace("Z", "+00:00")
+                        event["startTime"].replace("Z", "+00:00")
                     )
                     if start_dt <= now < result.settlement_time:
                         return result  # Currently live — use immediately
+                upcoming.append((result.settlement_time.timestamp(), event, result))
 
-                # Otherwise keep the soonest upcoming
-                if best is None or result.settlement_time < best.settlement_time:
-                    best = result
+            # Otherwise take the soonest upcoming that parses
+            best: Optional[MarketInfo] = None
+            upcoming.sort(key=lambda item: item[0])
+            for _, event, result in upcoming:
+                best = result or self._parse_event(event, crypto_asset)
+                if best is not None:
+                    break
 
             if best:
                 logger.info("Broad search found upcoming market: %s", best.market_slug)
@@ -189,8 +440,9 @@ class MarketDiscovery:
                 )
             return best
 
-        except aiohttp.ClientError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error("Gamma API broad search failed: %s", e)
+            self._record_failure()
             return None
         except Exception as e:
             logger.error("Unexpected error in broad search: %s", e)
@@ -281,16 +533,17 @@ class MarketDiscovery:
                 open_interest=open_interest,
             )
 
-            logger.info(
-                "Discovered market: %s | settlement=%s | tick=%dpt | accepting=%s "
-                "| YES=%s… | NO=%s…",
-                event_slug,
-                settlement_time.strftime("%H:%M:%S UTC"),
-                tick_size_points,
-                accepting,
-                yes_token_id[:16],
-                no_token_id[:16],
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Discovered market: %s | settlement=%s | tick=%dpt | accepting=%s "
+                    "| YES=%s… | NO=%s…",
+                    event_slug,
+                    settlement_time.strftime("%H:%M:%S UTC"),
+                    tick_size_points,
+                    accepting,
+                    yes_token_id[:16],
+                    no_token_id[:16],
+                )
             return market_info
 
         except (KeyError, ValueError, TypeError) as e:
@@ -305,10 +558,15 @@ class MarketDiscovery:
         """Extract the settlement (end) time from event or market fields.
 
         Priority:
-          1. Event ``endDate`` (full ISO with time)
-          2. Market ``endDateIso`` (sometimes date-only)
-          3. Derive from slug timestamp + 900s
+          1. 15-minute slug timestamp + 900s (no string parsing needed)
+          2. Event ``endDate`` (full ISO with time)
+          3. Market ``endDateIso`` (sometimes date-only)
+          4. Any other trailing slug timestamp + 900s
         """
+        window_start = _slug_window_start(slug)
+        if window_start is not None:
+            return datetime.fromtimestamp(window_start + WINDOW_SECONDS, tz=timezone.utc)
+
         # Try event endDate (usually has full datetime)
         end_str = event.get("endDate", "")
         if end_str and "T" in str(end_str):
@@ -320,14 +578,10 @@ class MarketDiscovery:
             return datetime.fromisoformat(str(end_iso).replace("Z", "+00:00"))
 
         # Derive from slug timestamp (slug ts = window start, settlement = start + 900)
-        try:
-            parts = slug.rsplit("-", 1)
-            if len(parts) == 2:
-                slug_ts = int(parts[1])
-                settlement_ts = slug_ts + WINDOW_SECONDS
-                return datetime.fromtimestamp(settlement_ts, tz=timezone.utc)
-        except (ValueError, IndexError):
-            pass
+        m = _SLUG_TS_RE.search(slug)
+        if m:
+            settlement_ts = int(m.group(1)) + WINDOW_SECONDS
+            return datetime.fromtimestamp(settlement_ts, tz=timezone.utc)
 
         logger.warning("Could not determine settlement time for %s", slug)
         return None
@@ -348,16 +602,8 @@ class MarketDiscovery:
         raw_outcomes = market.get("outcomes", "")
 
         # Parse JSON strings if needed
-        if isinstance(raw_ids, str):
-            try:
-                raw_ids = json.loads(raw_ids)
-            except (json.JSONDecodeError, TypeError):
-                raw_ids = []
-        if isinstance(raw_outcomes, str):
-            try:
-                raw_outcomes = json.loads(raw_outcomes)
-            except (json.JSONDecodeError, TypeError):
-                raw_outcomes = []
+        raw_ids = _decode_json_list(raw_ids)
+        raw_outcomes = _decode_json_list(raw_outcomes)
 
         if (
             isinstance(raw_ids, list)
@@ -367,9 +613,9 @@ class MarketDiscovery:
         ):
             for token_id, outcome in zip(raw_ids, raw_outcomes):
                 outcome_lower = str(outcome).lower()
-                if outcome_lower in ("up", "yes"):
+                if outcome_lower in _YES_OUTCOMES:
                     yes_token_id = str(token_id)
-                elif outcome_lower in ("down", "no"):
+                elif outcome_lower in _NO_OUTCOMES:
                     no_token_id = str(token_id)
 
         if not yes_token_id or not no_token_id:
@@ -405,7 +651,7 @@ class MarketDiscovery:
                 params={"slug": slug},
             ) as resp:
                 resp.raise_for_status()
-                events = await resp.json()
+                events = orjson.loads(await resp.read())
         except aiohttp.ClientError as exc:
             logger.warning("Gamma API error fetching outcome for %s: %s", slug, exc)
             return None
@@ -429,16 +675,8 @@ class MarketDiscovery:
         raw_prices = market.get("outcomePrices", "")
         raw_outcomes = market.get("outcomes", "")
 
-        if isinstance(raw_prices, str):
-            try:
-                raw_prices = json.loads(raw_prices)
-            except (json.JSONDecodeError, TypeError):
-                raw_prices = []
-        if isinstance(raw_outcomes, str):
-            try:
-                raw_outcomes = json.loads(raw_outcomes)
-            except (json.JSONDecodeError, TypeError):
-                raw_outcomes = []
+        raw_prices = _decode_json_list(raw_prices)
+        raw_outcomes = _decode_json_list(raw_outcomes)
 
         if (
             not isinstance(raw_prices, list)
@@ -455,10 +693,10 @@ class MarketDiscovery:
                 continue
             if price >= 0.99:
                 label_lower = str(outcome_label).lower()
-                if label_lower in ("up", "yes"):
+                if label_lower in _YES_OUTCOMES:
                     logger.info("Market %s resolved: YES (Up) won", slug)
                     return "yes"
-                if label_lower in ("down", "no"):
+                if label_lower in _NO_OUTCOMES:
                     logger.info("Market %s resolved: NO (Down) won", slug)
                     return "no"
 
@@ -10,23 +10,26 @@ Manages the full lifecycle of ONE Polymarket 15-minute crypto market:
 
 from __future__ import annotations
 
+import array
 import asyncio
 import logging
 import statistics
-import time as _time
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import chain
 from typing import Optional
 
 from .config import AppConfig
 from .database import Database
 from .market_discovery import MarketDiscovery
 from .models import (
+    LifecycleBatch,
     MarketInfo,
     ParameterSet,
     SamplingMode,
     Snapshot,
+    TokenOrderbook,
 )
 from .rest_client import CLOBRestClient
 from .tick_sampler import TickSampler
@@ -98,10 +101,14 @@ class MarketMonitor:
         tick_store: Optional[TickStore] = None,
     ):
         self.market_info = market_info
+        self._asset_upper = market_info.crypto_asset.upper()
+        self._yes_token = market_info.yes_token_id
+        self._no_token = market_info.no_token_id
         self.params_list = params_list
         self.config = config
         self.db = database
         self.ws = ws_client
+        self._get_orderbook = ws_client.get_orderbook
         self.rest = rest_client
         self._shutdown_event = shutdown_event
         self._event_log = event_log
@@ -109,19 +116,25 @@ class MarketMonitor:
         self._tick_store = tick_store
         self._tick_sampler: Optional[TickSampler] = None
 
-        # One evaluator per parameter set
-        self._evaluators: dict[int, TriggerEvaluator] = {}
-        for ps in params_list:
-            ps_id = ps.parameter_set_id or 0
-            self._evaluators[ps_id] = TriggerEvaluator(
-                params=ps,
-                market_info=market_info,
-                max_ref_sum_deviation=config.quality.max_reference_sum_deviation,
-                enable_lifecycle=config.data.enable_lifecycle_tracking,
+        # One evaluator per parameter set, as (ps_id, evaluator) pairs — only
+        # ever iterated, so a list rather than a dict
+        self._evaluators: list[tuple[int, TriggerEvaluator]] = [
+            (
+                ps.parameter_set_id or 0,
+                TriggerEvaluator(
+                    params=ps,
+                    market_info=market_info,
+                    max_ref_sum_deviation=config.quality.max_reference_sum_deviation,
+                    enable_lifecycle=config.data.enable_lifecycle_tracking,
+                ),
             )
-        self._primary_ps_id = (params_list[0].parameter_set_id or 0)
-        self._pair_times: dict[int, list[float]] = {
-            (ps.parameter_set_id or 0): [] for ps in params_list
+            for ps in params_list
+        ]
+        # Primary evaluator (first param set) — used for status display
+        self._primary_ps_id, self.evaluator = self._evaluators[0]
+        # Packed doubles: 8 bytes per sample instead of a float object each
+        self._pair_times: dict[int, array.array] = {
+            (ps.parameter_set_id or 0): array.array("d") for ps in params_list
         }
 
         # Cycle scheduling
@@ -132,25 +145,62 @@ class MarketMonitor:
         # State
         self.start_time: Optional[datetime] = None
         self.time_remaining_at_start: float = 0.0
+        # Settlement on the event loop's monotonic clock, set in run()
+        self._settlement_deadline: float = 0.0
         self.anomaly_count: int = 0
         self._was_shutdown: bool = False
-
-    @property
-    def evaluator(self) -> TriggerEvaluator:
-        """Primary evaluator (first param set) — used for status display."""
-        return self._evaluators[self._primary_ps_id]
+        # Long-lived shutdown waiter reused by every _interruptible_sleep
+        self._shutdown_wait: Optional[asyncio.Future] = None
+
+        # Write-behind buffers: completions, lifecycle rows and snapshots are
+        # flushed by a background task instead of awaited every cycle.
+        # Attempt INSERTs stay inline — they assign the IDs that later
+        # updates, lifecycle rows and events refer to.
+        self._pending_paired: list = []
+        self._pending_stopped: list = []
+        self._pending_lifecycle: list[LifecycleBatch] = []
+        self._pending_snapshots: list[Snapshot] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_stop = asyncio.Event()
 
     # ------------------------------------------------------------------
     # Events
     # ------------------------------------------------------------------
 
-    def _push_event(self, msg: str) -> None:
-        if self._event_log is not None:
-            self._event_log.append((
-                datetime.now(timezone.utc),
-                self.market_info.crypto_asset.upper(),
-                msg,
-            ))
+    def _push_cycle_events(
+        self, now: datetime, new: list, paired: list, stopped: list
+    ) -> None:
+        """Append one cycle's dashboard events with a single ``extend``.
+
+        Uses the cycle's timestamp; nothing is formatted when there is no
+        event log (dashboard off).
+        """
+        if self._event_log is None:
+            return
+        tag = self._asset_upper
+        events = [
+            (now, tag,
+             f"Attempt #{attempt.attempt_id} started "
+             f"({attempt.first_leg_side.value} first "
+             f"@ {attempt.P1_points}pts)")
+            for attempt in new
+        ]
+        events.extend(
+            (now, tag,
+             f"Attempt #{attempt.attempt_id} PAIRED in "
+             f"{attempt.time_to_pair_seconds:.1f}s "
+             f"(cost: {attempt.pair_cost_points}, "
+             f"profit: {attempt.pair_profit_points})")
+            for attempt in paired
+        )
+        events.extend(
+            (now, tag,
+             f"Attempt #{attempt.attempt_id} STOP LOSS "
+             f"(loss: {attempt.pair_profit_points}pts, "
+             f"active {attempt.time_to_pair_seconds:.1f}s)")
+            for attempt in stopped
+        )
+        self._event_log.extend(events)
 
     # ------------------------------------------------------------------
     # Main entry point
@@ -161,6 +211,9 @@ class MarketMonitor:
         now = datetime.now(timezone.utc)
         settlement = self.market_info.settlement_time
         self.time_remaining_at_start = (settlement - now).total_seconds()
+        self._settlement_deadline = (
+            asyncio.get_running_loop().time() + self.time_remaining_at_start
+        )
 
         if self.time_remaining_at_start <= 0:
             logger.warning("Market %s already settled!", self.market_info.market_slug)
@@ -211,6 +264,8 @@ class MarketMonitor:
                 self.cycle_interval,
             )
 
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
             # Run measurement cycles until settlement or shutdown
             try:
                 await self._run_cycles()
@@ -229,11 +284,11 @@ class MarketMonitor:
             await self._write_summary(summary)
 
             # Log summaries for non-primary param sets
-            for ps_id, ev in self._evaluators.items():
-                if ps_id != self._primary_ps_id and ev.total_attempts > 0:
+            for _, ev in self._evaluators[1:]:
+                if ev.total_attempts > 0:
                     logger.info(
                         "[%s] Param '%s': %d attempts, %d pairs (%.0f%%)",
-                        self.market_info.crypto_asset.upper(),
+                        self._asset_upper,
                         ev.params.name,
                         ev.total_attempts,
                         ev.total_pairs,
@@ -242,6 +297,9 @@ class MarketMonitor:
 
             return summary
         finally:
+            await self._stop_flusher()
+            if self._shutdown_wait is not None:
+                self._shutdown_wait.cancel()
             if self._tick_sampler is not None:
                 self._tick_sampler.stop()
             if self._tick_store is not None:
@@ -288,13 +346,11 @@ class MarketMonitor:
             return False
         if self._shutdown_event.is_set():
             return True
-        sleep_task = asyncio.ensure_future(asyncio.sleep(duration))
-        event_task = asyncio.ensure_future(self._shutdown_event.wait())
-        _, pending = await asyncio.wait(
-            [sleep_task, event_task], return_when=asyncio.FIRST_COMPLETED
-        )
-        for t in pending:
-            t.cancel()
+        # asyncio.wait(timeout=…) leaves the waiter pending, so the same
+        # task serves every cycle and no sleep task is created
+        if self._shutdown_wait is None:
+            self._shutdown_wait = asyncio.ensure_future(self._shutdown_event.wait())
+        await asyncio.wait((self._shutdown_wait,), timeout=duration)
         return self._shutdown_event.is_set()
 
     # ------------------------------------------------------------------
@@ -303,29 +359,30 @@ class MarketMonitor:
 
     async def _wait_for_initial_data(self, timeout: float = 15.0) -> None:
         """Block until both YES and NO orderbooks have bid+ask data."""
-        start = asyncio.get_event_loop().time()
-
-        while (asyncio.get_event_loop().time() - start) < timeout:
-            yes_ob = self.ws.get_orderbook(self.market_info.yes_token_id)
-            no_ob = self.ws.get_orderbook(self.market_info.no_token_id)
-
-            if (
-                yes_ob and yes_ob.best_bid is not None and yes_ob.best_ask is not None
-                and no_ob and no_ob.best_bid is not None and no_ob.best_ask is not None
-            ):
-                logger.info(
-                    "Initial orderbook for %s — YES: bid=%d ask=%d, NO: bid=%d ask=%d",
-                    self.market_info.market_slug,
-                    yes_ob.best_bid, yes_ob.best_ask,
-                    no_ob.best_bid, no_ob.best_ask,
-                )
-                return
-
-            await asyncio.sleep(0.5)
+        yes_id = self.market_info.yes_token_id
+        no_id = self.market_info.no_token_id
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    self.ws.book_ready_event(yes_id).wait(),
+                    self.ws.book_ready_event(no_id).wait(),
+                ),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Timeout (%.0fs) waiting for orderbook data for %s",
+                timeout, self.market_info.market_slug,
+            )
+            return
 
-        logger.warning(
-            "Timeout (%.0fs) waiting for orderbook data for %s",
-            timeout, self.market_info.market_slug,
+        yes_ob = self.ws.get_orderbook(yes_id)
+        no_ob = self.ws.get_orderbook(no_id)
+        logger.info(
+            "Initial orderbook for %s — YES: bid=%s ask=%s, NO: bid=%s ask=%s",
+            self.market_info.market_slug,
+            yes_ob.best_bid, yes_ob.best_ask,
+            no_ob.best_bid, no_ob.best_ask,
         )
 
     # ------------------------------------------------------------------
@@ -334,10 +391,10 @@ class MarketMonitor:
 
     async def _run_cycles(self) -> None:
         """Execute measurement cycles on schedule until settlement or shutdown."""
-        settlement = self.market_info.settlement_time
+        loop = asyncio.get_running_loop()
 
         # Run the first cycle immediately
-        await self._execute_cycle()
+        await self._execute_cycle(loop.time())
 
         while True:
             if await self._interruptible_sleep(self.cycle_interval):
@@ -346,54 +403,61 @@ class MarketMonitor:
                             self.market_info.market_slug)
                 return
 
-            now = datetime.now(timezone.utc)
-            time_remaining = (settlement - now).total_seconds()
+            # One monotonic clock read drives this iteration's checks
+            now_monotonic = loop.time()
+            time_remaining = self._settlement_deadline - now_monotonic
 
             if time_remaining <= 0:
                 logger.info("Settlement time reached for %s",
                             self.market_info.market_slug)
                 break
 
-            if self._detect_feed_gap():
+            if self._detect_feed_gap(now_monotonic):
                 logger.warning(
                     "Feed gap detected — skipping cycle %d for %s",
                     self.cycles_run + 1, self.market_info.market_slug,
                 )
-                for ev in self._evaluators.values():
+                for _, ev in self._evaluators:
                     ev.mark_feed_gap()
                 continue
 
-            await self._execute_cycle()
+            await self._execute_cycle(now_monotonic)
 
-    async def _execute_cycle(self) -> None:
+    async def _execute_cycle(self, now_monotonic: float) -> None:
         """Run one measurement cycle across all parameter sets.
 
         Collects all DB writes across evaluators and flushes them in
         batches — one round-trip per operation type instead of one per row.
         """
         self.cycles_run += 1
+        # One wall-clock read per cycle (persisted); the countdown uses the
+        # loop's monotonic clock
         now = datetime.now(timezone.utc)
-        time_remaining = (self.market_info.settlement_time - now).total_seconds()
+        time_remaining = self._settlement_deadline - now_monotonic
+
+        # One orderbook lookup per token, shared by the snapshot and sizes
+        yes_ob = self._get_orderbook(self._yes_token)
+        no_ob = self._get_orderbook(self._no_token)
 
         # Capture a single snapshot (shared by all evaluators)
-        snapshot = self._capture_snapshot(self.cycles_run, now, time_remaining)
+        snapshot = self._capture_snapshot(
+            yes_ob, no_ob, self.cycles_run, now, time_remaining
+        )
 
         # Log prices every 10th cycle or first cycle for debugging
         if self.cycles_run <= 3 or self.cycles_run % 10 == 0:
             logger.info(
                 "[%s] Cycle %d prices — YES: bid=%s ask=%s, NO: bid=%s ask=%s",
-                self.market_info.crypto_asset.upper(), self.cycles_run,
+                self._asset_upper, self.cycles_run,
                 snapshot.yes_bid_points, snapshot.yes_ask_points,
                 snapshot.no_bid_points, snapshot.no_ask_points,
             )
 
         # --- Orderbook sizes from WebSocket (sync — already in memory) ---
-        _yes_ob = self.ws.get_orderbook(self.market_info.yes_token_id)
-        _no_ob = self.ws.get_orderbook(self.market_info.no_token_id)
-        yes_bid_size = _parse_size(_yes_ob.best_bid_size if _yes_ob else None)
-        yes_ask_size = _parse_size(_yes_ob.best_ask_size if _yes_ob else None)
-        no_bid_size = _parse_size(_no_ob.best_bid_size if _no_ob else None)
-        no_ask_size = _parse_size(_no_ob.best_ask_size if _no_ob else None)
+        yes_bid_size = _parse_size(yes_ob.best_bid_size if yes_ob else None)
+        yes_ask_size = _parse_size(yes_ob.best_ask_size if yes_ob else None)
+        no_bid_size = _parse_size(no_ob.best_bid_size if no_ob else None)
+        no_ask_size = _parse_size(no_ob.best_ask_size if no_ob else None)
 
         # --- Orderbook depth via REST (one batched call for YES+NO per cycle) ---
         yes_depth, no_depth = await self.rest.get_orderbook_depths(
@@ -403,15 +467,17 @@ class MarketMonitor:
         )
 
         # --- Evaluate all param sets (pure compute, no I/O) ---
-        all_new_attempts: list = []
-        all_paired_attempts: list = []
-        all_stopped_attempts: list = []
-        all_lifecycle_records: list = []
-        has_activity = False
+        # Completions and lifecycle batches go straight into the flusher's
+        # buffers; only new attempts are gathered for the inline INSERT.
+        new_lists: list[list] = []
+        # Primary param set's own results, kept aside for event pushing
+        primary_new: list = []
+        primary_paired: list = []
+        primary_stopped: list = []
         primary_active_count = 0
         primary_anomaly = False
 
-        for ps_id, evaluator in self._evaluators.items():
+        for ps_id, evaluator in self._evaluators:
             result = evaluator.evaluate_cycle(
                 snapshot=snapshot,
                 cycle_number=self.cycles_run,
@@ -429,7 +495,8 @@ class MarketMonitor:
                 self.anomaly_count += 1
 
             # Collect new attempts
-            all_new_attempts.extend(result.new_attempts)
+            if result.new_attempts:
+                new_lists.append(result.new_attempts)
 
             # Collect paired attempts + bookkeeping
             for attempt in result.paired_attempts:
@@ -437,65 +504,40 @@ class MarketMonitor:
                     times = self._pair_times[ps_id]
                     if len(times) < MAX_PAIR_TIMES:
                         times.append(attempt.time_to_pair_seconds)
-            all_paired_attempts.extend(result.paired_attempts)
+            self._pending_paired.extend(result.paired_attempts)
 
             # Collect stopped-out attempts
-            all_stopped_attempts.extend(result.stopped_out_attempts)
+            self._pending_stopped.extend(result.stopped_out_attempts)
 
-            # Collect lifecycle records
-            all_lifecycle_records.extend(result.lifecycle_records)
+            # Collect lifecycle rows (one batch per evaluator, no merging)
+            if result.lifecycle:
+                self._pending_lifecycle.append(result.lifecycle)
 
             # Track primary param set state for snapshot/events
             if ps_id == self._primary_ps_id:
                 primary_active_count = result.active_count
                 primary_anomaly = result.anomaly
-                if (result.new_attempts or result.paired_attempts
-                        or result.stopped_out_attempts):
-                    has_activity = True
+                primary_new = result.new_attempts
+                primary_paired = result.paired_attempts
+                primary_stopped = result.stopped_out_attempts
 
         # --- Batch DB writes (minimal round-trips) ---
-        if all_new_attempts:
-            await self.db.insert_attempts_batch(all_new_attempts)
-            # Push events for primary param set (IDs now assigned)
-            for attempt in all_new_attempts:
-                if attempt.parameter_set_id == self._primary_ps_id:
-                    self._push_event(
-                        f"Attempt #{attempt.attempt_id} started "
-                        f"({attempt.first_leg_side.value} first "
-                        f"@ {attempt.P1_points}pts)"
-                    )
-
-        if all_paired_attempts:
-            await self.db.update_attempts_paired_batch(all_paired_attempts)
-            for attempt in all_paired_attempts:
-                if attempt.parameter_set_id == self._primary_ps_id:
-                    self._push_event(
-                        f"Attempt #{attempt.attempt_id} PAIRED in "
-                        f"{attempt.time_to_pair_seconds:.1f}s "
-                        f"(cost: {attempt.pair_cost_points}, "
-                        f"profit: {attempt.pair_profit_points})"
-                    )
-
-        if all_stopped_attempts:
-            await self.db.update_attempts_stopped_batch(all_stopped_attempts)
-            for attempt in all_stopped_attempts:
-                if attempt.parameter_set_id == self._primary_ps_id:
-                    self._push_event(
-                        f"Attempt #{attempt.attempt_id} STOP LOSS "
-                        f"(loss: {attempt.pair_profit_points}pts, "
-                        f"active {attempt.time_to_pair_seconds:.1f}s)"
-                    )
+        # Paired / stop-loss updates + lifecycle rows are written by the flusher
+        if new_lists:
+            await self.db.insert_attempts_batch(
+                list(chain.from_iterable(new_lists))
+            )
 
-        if all_lifecycle_records:
-            await self.db.insert_lifecycle_batch(all_lifecycle_records)
+        # Dashboard events for the primary param set (IDs now assigned)
+        self._push_cycle_events(now, primary_new, primary_paired, primary_stopped)
 
         if self.config.data.enable_snapshots:
             snapshot.active_attempts_count = primary_active_count
             snapshot.anomaly_flag = primary_anomaly
-            await self.db.insert_snapshot(snapshot)
+            self._pending_snapshots.append(snapshot)
 
         # Log cycle summary (primary evaluator)
-        if has_activity:
+        if primary_new or primary_paired or primary_stopped:
             ev = self.evaluator
             total_att = ev.total_attempts
             total_pair = ev.total_pairs
@@ -503,23 +545,92 @@ class MarketMonitor:
             logger.info(
                 "[%s] Cycle %d/%d: %d active | "
                 "%d attempts, %d pairs (%.0f%%) | %.0fs left",
-                self.market_info.crypto_asset.upper(),
+                self._asset_upper,
                 self.cycles_run, self.total_planned_cycles,
                 len(ev.active_attempts),
                 total_att, total_pair, pct,
                 time_remaining,
             )
 
+    # ------------------------------------------------------------------
+    # Background DB flush
+    # ------------------------------------------------------------------
+
+    async def _flush_loop(self) -> None:
+        """Flush buffered writes every ``db_flush_interval_seconds``.
+
+        Stopped via ``_flush_stop`` rather than cancellation so a write is
+        never cut off half-way; the last pass drains whatever is left and
+        raises if it cannot, since nothing would retry it afterwards.
+        """
+        interval = self.config.data.db_flush_interval_seconds
+        stop_wait = asyncio.ensure_future(self._flush_stop.wait())
+        try:
+            while not stop_wait.done():
+                await asyncio.wait((stop_wait,), timeout=interval)
+                await self._flush_pending(final=stop_wait.done())
+        finally:
+            stop_wait.cancel()
+
+    async def _flush_pending(self, final: bool = False) -> None:
+        """Write every buffered row, re-queueing whatever failed.
+
+        Rows that fail to land go back to the front of their buffers so the
+        next pass retries them in their original order.  Periodic passes
+        only log the failure; the ``final`` drain re-raises it.
+        """
+        paired, self._pending_paired = self._pending_paired, []
+        stopped, self._pending_stopped = self._pending_stopped, []
+        lifecycle, self._pending_lifecycle = self._pending_lifecycle, []
+        snapshots, self._pending_snapshots = self._pending_snapshots, []
+
+        try:
+            if paired or stopped or lifecycle:
+                try:
+                    await self.db.finalise_attempts(paired, stopped, lifecycle)
+                except BaseException:
+                    self._pending_paired[:0] = paired
+                    self._pending_stopped[:0] = stopped
+                    self._pending_lifecycle[:0] = lifecycle
+                    self._pending_snapshots[:0] = snapshots
+                    raise
+            if snapshots:
+                try:
+                    await self.db.insert_snapshots_batch(snapshots)
+                except BaseException:
+                    self._pending_snapshots[:0] = snapshots
+                    raise
+        except Exception as e:
+            logger.error("DB flush failed for %s: %s",
+                         self.market_info.market_slug, e, exc_info=True)
+            if final:
+                raise
+
+    async def _stop_flusher(self) -> None:
+        """Stop the flush loop after a final drain (idempotent).
+
+        Raises if the final drain could not write the remaining rows.
+        """
+        if self._flush_task is None:
+            return
+        self._flush_stop.set()
+        try:
+            await self._flush_task
+        finally:
+            self._flush_task = None
+
     # ------------------------------------------------------------------
     # Snapshot capture
     # ------------------------------------------------------------------
 
     def _capture_snapshot(
-        self, cycle_number: int, timestamp: datetime, time_remaining: float
+        self,
+        yes_ob: Optional[TokenOrderbook],
+        no_ob: Optional[TokenOrderbook],
+        cycle_number: int,
+        timestamp: datetime,
+        time_remaining: float,
     ) -> Snapshot:
-        yes_ob = self.ws.get_orderbook(self.market_info.yes_token_id)
-        no_ob = self.ws.get_orderbook(self.market_info.no_token_id)
-
         snapshot = Snapshot(
             market_id=self.market_info.market_slug,
             cycle_number=cycle_number,
@@ -553,8 +664,8 @@ class MarketMonitor:
         )
 
         # Reset period trackers so the next cycle starts fresh
-        self.ws.reset_period_stats(self.market_info.yes_token_id)
-        self.ws.reset_period_stats(self.market_info.no_token_id)
+        self.ws.reset_period_stats(self._yes_token)
+        self.ws.reset_period_stats(self._no_token)
 
         return snapshot
 
@@ -562,11 +673,11 @@ class MarketMonitor:
     # Feed gap detection
     # ------------------------------------------------------------------
 
-    def _detect_feed_gap(self) -> bool:
-        last_msg = self.ws.last_message_time
+    def _detect_feed_gap(self, now_monotonic: float) -> bool:
+        last_msg = self.ws.last_message_monotonic
         if last_msg is None:
             return True
-        gap = _time.time() - last_msg
+        gap = now_monotonic - last_msg
         return gap > self.config.quality.feed_gap_threshold_seconds
 
     # ------------------------------------------------------------------
@@ -575,9 +686,12 @@ class MarketMonitor:
 
     async def _process_settlement(self, fail_reason: str = "settlement_reached") -> None:
         """Fail all remaining active attempts across all evaluators (batched)."""
+        # Drain buffered completions first so every row lands before the summary
+        await self._stop_flusher()
+
         now = datetime.now(timezone.utc)
         all_failed: list = []
-        for ps_id, evaluator in self._evaluators.items():
+        for _, evaluator in self._evaluators:
             failed = evaluator.process_settlement(now, fail_reason=fail_reason)
             all_failed.extend(failed)
             if failed:
@@ -601,7 +715,7 @@ class MarketMonitor:
         total_failed = ev.total_failed
         pair_rate = total_pairs / max(1, total_att)
 
-        times = self._pair_times.get(self._primary_ps_id, [])
+        times = self._pair_times.get(self._primary_ps_id, ())
         avg_ttp: Optional[float] = None
         median_ttp: Optional[float] = None
         if times:
@@ -4,17 +4,36 @@ Supports both PostgreSQL (``asyncpg``) and SQLite (``aiosqlite``) backends.
 When *db_source* looks like a ``postgres://`` URL the PostgreSQL adapter is
 used; otherwise it is treated as a local SQLite file path.
 
-Each function opens its own connection, runs an aggregate query, and
-returns the result as plain Python dicts / lists.  All functions accept
-optional *parameter_set_id* and *crypto_asset* filters.
+Each function runs an aggregate query and returns the result as plain
+Python dicts / lists.  All functions accept optional *parameter_set_id* and
+*crypto_asset* filters.  SQLite files are served from a pool of long-lived
+read-only connections and PostgreSQL DSNs from an asyncpg pool (see
+:func:`close_all`).
+:func:`run_all_metrics` runs the whole report's queries concurrently, and
+:func:`refresh_metrics_cache` keeps the persistent histogram sums current.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
+import inspect
 import logging
+import math
+import os
+import re
+import sqlite3
+import time
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import Optional
+from dataclasses import dataclass
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+import numpy as np
+import orjson
+
+from .database import ATTEMPT_BUCKET_COLUMNS
 
 logger = logging.getLogger(__name__)
 
@@ -28,15 +47,99 @@ def _is_pg(source: str) -> bool:
     return "postgres" in source.lower()
 
 
+# Report bucket columns and the CASE each one stands for.  They are
+# generated columns on SQLite only; PostgreSQL indexes the expressions
+# themselves (migrations/028), so PG report SQL spells them out.
+_BUCKET_EXPRS = dict(ATTEMPT_BUCKET_COLUMNS)
+_BUCKET_RE = re.compile(r"\b(" + "|".join(_BUCKET_EXPRS) + r")\b")
+
+
+def _inline_buckets(sql: str) -> str:
+    """Replace each bucket column name in *sql* with its CASE expression."""
+    return _BUCKET_RE.sub(lambda m: f"({_BUCKET_EXPRS[m.group(1)]})", sql)
+
+
+@functools.lru_cache(maxsize=256)
 def _q(sql: str) -> str:
-    """Convert ``?`` placeholders to ``$1, $2, …`` for PostgreSQL."""
+    """Rewrite report SQL for PostgreSQL.
+
+    Bucket columns become their CASE expressions (see ``_BUCKET_EXPRS``)
+    and ``?`` placeholders become ``$1, $2, …``.  Report SQL comes in a
+    handful of fixed texts per function, so each one is rewritten once per
+    process.
+    """
+    sql = _inline_buckets(sql)
     parts = sql.split("?")
     if len(parts) <= 1:
         return sql
-    result = parts[0]
-    for i, part in enumerate(parts[1:], 1):
-        result += f"${i}" + part
-    return result
+    return parts[0] + "".join(f"${i}{part}" for i, part in enumerate(parts[1:], 1))
+
+
+# Aggregate FILTER clauses need SQLite >= 3.30 (PostgreSQL has had them
+# since 9.4).  Against an older library the report SQL is rewritten to the
+# equivalent CASE form before it is executed.
+_SQLITE_HAS_FILTER = sqlite3.sqlite_version_info >= (3, 30, 0)
+
+_FILTER_RE = re.compile(
+    r"(\w+)\(([^()]*)\)\s+FILTER\s*\(WHERE\s+([^()]*?)\)", re.IGNORECASE
+)
+
+
+def _filter_repl(m: re.Match) -> str:
+    fn, arg, cond = m.group(1), m.group(2).strip(), m.group(3)
+    if arg == "*":
+        return f"{fn}(CASE WHEN {cond} THEN 1 END)"
+    return f"{fn}(CASE WHEN {cond} THEN {arg} END)"
+
+
+@functools.lru_cache(maxsize=256)
+def _filter_to_case(sql: str) -> str:
+    """Rewrite ``AGG(x) FILTER (WHERE cond)`` as ``AGG(CASE WHEN cond THEN x END)``."""
+    return _FILTER_RE.sub(_filter_repl, sql)
+
+
+# INDEXED BY fails outright when the index does not exist, as on files the
+# bot has not opened (and so migrated) since the report indexes were added.
+_INDEXED_BY_RE = re.compile(r"\s+INDEXED BY (\w+)", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class _SqliteSchema:
+    """What report SQL may rely on in one SQLite file, probed once per pool."""
+
+    indexes: frozenset[str] = frozenset()
+    bucket_columns: bool = False
+
+
+async def _probe_schema(db) -> _SqliteSchema:
+    """Read the index names and bucket-column presence of *db*'s file."""
+    try:
+        async with db.execute("SELECT name FROM sqlite_master WHERE type = 'index'") as cur:
+            indexes = frozenset(r[0] for r in await cur.fetchall())
+        async with db.execute("SELECT name FROM pragma_table_xinfo('Attempts')") as cur:
+            columns = {r[0] for r in await cur.fetchall()}
+    except sqlite3.Error as exc:
+        logger.debug("SQLite schema probe failed (%s); assuming an unmigrated file", exc)
+        return _SqliteSchema()
+    return _SqliteSchema(indexes, _BUCKET_EXPRS.keys() <= columns)
+
+
+@functools.lru_cache(maxsize=256)
+def _sqlite_sql(sql: str, schema: _SqliteSchema) -> str:
+    """Rewrite report SQL for an SQLite file with *schema*.
+
+    ``INDEXED BY`` hints naming a missing index are dropped, bucket columns
+    become their CASE expressions when the file lacks them, and FILTER
+    clauses are rewritten on libraries without them.
+    """
+    sql = _INDEXED_BY_RE.sub(
+        lambda m: m.group(0) if m.group(1) in schema.indexes else "", sql,
+    )
+    if not schema.bucket_columns:
+        sql = _inline_buckets(sql)
+    if not _SQLITE_HAS_FILTER:
+        sql = _filter_to_case(sql)
+    return sql
 
 
 class _PgAdapter:
@@ -55,39 +158,290 @@ class _PgAdapter:
         row = await self._conn.fetchrow(_q(sql), *params)
         return dict(row) if row else {}
 
+    async def fetch_rows(self, sql: str, params: list | None = None) -> list[tuple]:
+        params = params or []
+        return [tuple(r) for r in await self._conn.fetch(_q(sql), *params)]
+
+    async def fetch_records(self, sql: str, params: list | None = None) -> list:
+        """Rows as read-only ``asyncpg.Record`` objects (``r["col"]`` access)."""
+        params = params or []
+        return await self._conn.fetch(_q(sql), *params)
+
+    async def iter_rows(
+        self, sql: str, params: list | None = None, batch_size: int = 1000,
+    ):
+        """Yield the result of *sql* as lists of at most *batch_size* dicts."""
+        params = params or []
+        async with self._conn.transaction():    # asyncpg cursors need one
+            cur = await self._conn.cursor(_q(sql), *params)
+            while batch := await cur.fetch(batch_size):
+                yield [dict(r) for r in batch]
+
+    async def execute(self, sql: str, params: list | None = None) -> None:
+        params = params or []
+        await self._conn.execute(_q(sql), *params)
+
+    async def executemany(self, sql: str, rows: list) -> None:
+        await self._conn.executemany(_q(sql), rows)
+
+    @asynccontextmanager
+    async def transaction(self):
+        async with self._conn.transaction():
+            yield
+
 
 class _SqliteAdapter:
-    """Thin wrapper around an ``aiosqlite.Connection``."""
+    """Thin wrapper around an ``aiosqlite.Connection``.
+
+    Rows are built by a cursor ``row_factory`` (see :func:`_dict_rows`), and
+    sqlite3 calls that while fetching, on the connection's worker thread.
+    The event loop only receives the finished list, so concurrent queries
+    on other pooled connections are not held up by row materialisation.
+    Report SQL is first fitted to the file's schema (see :func:`_sqlite_sql`).
+    """
 
-    def __init__(self, db):
+    def __init__(self, db, schema: _SqliteSchema):
         self._db = db
+        self._schema = schema
 
     async def fetch_all(self, sql: str, params: list | None = None) -> list[dict]:
-        params = params or []
-        async with self._db.execute(sql, params) as cur:
-            rows = await cur.fetchall()
-            return [dict(r) for r in rows]
+        sql = _sqlite_sql(sql, self._schema)
+        async with self._db.execute(sql, params or []) as cur:
+            cur.row_factory = _dict_rows(cur.description)
+            return await cur.fetchall()
 
     async def fetch_one(self, sql: str, params: list | None = None) -> dict:
-        params = params or []
-        async with self._db.execute(sql, params) as cur:
-            row = await cur.fetchone()
-            return dict(row) if row else {}
+        sql = _sqlite_sql(sql, self._schema)
+        async with self._db.execute(sql, params or []) as cur:
+            cur.row_factory = _dict_rows(cur.description)
+            return await cur.fetchone() or {}
+
+    async def fetch_rows(self, sql: str, params: list | None = None) -> list[tuple]:
+        sql = _sqlite_sql(sql, self._schema)
+        return await self._db.execute_fetchall(sql, params or [])
+
+    async def fetch_records(self, sql: str, params: list | None = None) -> list:
+        """Rows as read-only ``sqlite3.Row`` objects (``r["col"]`` access)."""
+        sql = _sqlite_sql(sql, self._schema)
+        async with self._db.execute(sql, params or []) as cur:
+            cur.row_factory = sqlite3.Row
+            return await cur.fetchall()
+
+    async def iter_rows(
+        self, sql: str, params: list | None = None, batch_size: int = 1000,
+    ):
+        """Yield the result of *sql* as lists of at most *batch_size* dicts."""
+        sql = _sqlite_sql(sql, self._schema)
+        async with self._db.execute(sql, params or []) as cur:
+            cols = [d[0] for d in cur.description]
+            while batch := await cur.fetchmany(batch_size):
+                yield [dict(zip(cols, r)) for r in batch]
+
+    async def execute(self, sql: str, params: list | None = None) -> None:
+        async with self._db.execute(sql, params or []):
+            pass
+
+    async def executemany(self, sql: str, rows: list) -> None:
+        await self._db.executemany(sql, rows)
+
+    @asynccontextmanager
+    async def transaction(self):
+        await self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            await self._db.execute("ROLLBACK")
+            raise
+        await self._db.execute("COMMIT")
 
 
-@asynccontextmanager
-async def _connect(db_source: str):
-    """Yield a backend-agnostic adapter for *db_source*.
+def _dict_rows(description) -> Callable[[sqlite3.Cursor, tuple], dict]:
+    """Return a ``row_factory`` turning rows into dicts keyed by *description*.
 
-    For PostgreSQL connections, retries up to 3 times with exponential
-    back-off to handle transient authentication / pooler failures.
+    Column names are read from the cursor description once per query
+    rather than once per row.
     """
-    if _is_pg(db_source):
-        import asyncpg
+    cols = [d[0] for d in description]
+    return lambda _cur, row: dict(zip(cols, row))
+
+
+# Applied to every pooled SQLite read connection when it is opened.
+# journal_mode goes first on its own because it returns a row; query_only
+# goes last so the earlier PRAGMAs are still allowed to run.
+_SQLITE_PRAGMAS: dict[str, object] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -64000,          # ~64 MB page cache (negative = KiB)
+    "mmap_size": 268435456,        # 256 MB
+    "query_only": 1,
+}
+
+# WAL lets readers run side by side, so independent report queries each get
+# their own connection (and aiosqlite worker thread) up to this many.
+_READ_POOL_SIZE = max(4, os.cpu_count() or 1)
+
+# sqlite3's per-connection prepared-statement LRU.  Every query here renders
+# to one fixed text per filter combination, so on long-lived pooled
+# connections repeat calls skip the parse/plan step entirely.
+_SQLITE_CACHED_STATEMENTS = 256
+
+
+async def _apply_pragmas(db, pragmas: dict[str, object]) -> None:
+    """Run *pragmas* on an ``aiosqlite`` connection, in order."""
+    pragmas = dict(pragmas)
+    journal_mode = pragmas.pop("journal_mode", None)
+    if journal_mode is not None:
+        await db.execute(f"PRAGMA journal_mode={journal_mode}")
+    await db.executescript(
+        "".join(f"PRAGMA {k}={v};\n" for k, v in pragmas.items())
+    )
+
+
+class _ReadPool:
+    """Bounded pool of read-only ``aiosqlite`` connections to one SQLite file.
+
+    Connections are opened lazily, up to *size*, and stay open across calls
+    so the page cache survives between queries until :meth:`close`.
+    """
+
+    def __init__(self, db_path: str, size: int = _READ_POOL_SIZE):
+        self._db_path = db_path
+        self._size = size
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._conns: list = []
+        self._opening = 0
+        self._closed = False
+        # Probed on the first connection; see _SqliteSchema
+        self.schema: _SqliteSchema | None = None
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Yield an idle connection, opening a new one while under *size*."""
+        db = await self._get()
+        try:
+            yield db
+        finally:
+            self.release(db)
+
+    def release(self, db) -> None:
+        """Return *db* to the pool."""
+        self._idle.put_nowait(db)
+
+    async def _get(self):
+        if self._idle.empty() and len(self._conns) + self._opening < self._size:
+            self._opening += 1
+            try:
+                db = await self._open()
+            finally:
+                self._opening -= 1
+            if self._closed:
+                # close() ran while this connection was opening
+                await db.close()
+                _check_open()
+                raise RuntimeError(f"read pool for {self._db_path} is closed")
+            self._conns.append(db)
+            return db
+        return await self._idle.get()
+
+    async def _open(self):
+        import aiosqlite
+        db = await aiosqlite.connect(
+            self._db_path, timeout=5.0, cached_statements=_SQLITE_CACHED_STATEMENTS,
+        )
+        try:
+            await _apply_pragmas(db, _SQLITE_PRAGMAS)
+            if self.schema is None:
+                self.schema = await _probe_schema(db)
+        except BaseException:
+            await db.close()
+            raise
+        return db
+
+    async def close(self) -> None:
+        self._closed = True
+        conns, self._conns = self._conns, []
+        self._idle = asyncio.Queue()
+        for db in conns:
+            await db.close()
+
+
+_POOLS: dict[str, _ReadPool] = {}
+
+# Set by close_all().  aiosqlite worker threads are not daemons, so a pool
+# opened after shutdown would keep the process alive; refuse instead.
+_CLOSED = False
+
+
+def _check_open() -> None:
+    if _CLOSED:
+        raise RuntimeError("metrics connections are closed (close_all() already ran)")
+
+
+def _get_pool(db_path: str) -> _ReadPool:
+    """Return the process-wide read pool for *db_path*, creating it once."""
+    _check_open()
+    pool = _POOLS.get(db_path)
+    if pool is None:
+        pool = _POOLS[db_path] = _ReadPool(db_path)
+    return pool
+
+
+# PostgreSQL: one asyncpg pool per DSN, created on first use.  The lock
+# keeps concurrent first queries from racing to create duplicate pools.
+_PG_POOLS: dict = {}
+_PG_POOL_LOCK = asyncio.Lock()
+
+# asyncpg's per-connection cache of prepared statements.  Every report
+# query has fixed SQL text, so repeats skip the parse/plan round trip.
+_PG_STATEMENT_CACHE_SIZE = 100
+
+# Transaction poolers hand each statement to whichever server connection is
+# free, so prepared statements cannot be reused there.  DATABASE_URL uses
+# the transaction pooler on this port (see src/config.py).
+_PG_TRANSACTION_POOLER_PORT = 6543
+
+
+def _pg_statement_cache_size(dsn: str) -> int:
+    """Statement cache size for *dsn*: 0 behind a transaction pooler.
+
+    A pooler is assumed when POLYMARKET_PGBOUNCER is set ("true", "1" or
+    "yes") or the DSN targets ``_PG_TRANSACTION_POOLER_PORT``.
+    """
+    if os.environ.get("POLYMARKET_PGBOUNCER", "").lower() in ("true", "1", "yes"):
+        return 0
+    try:
+        port = urlsplit(dsn).port
+    except ValueError:
+        port = None
+    return 0 if port == _PG_TRANSACTION_POOLER_PORT else _PG_STATEMENT_CACHE_SIZE
+
+
+async def _get_pg_pool(dsn: str):
+    """Return the process-wide asyncpg pool for *dsn*, creating it once.
+
+    Creation retries up to 3 times with exponential back-off to handle
+    transient authentication / pooler failures.
+    """
+    _check_open()
+    pool = _PG_POOLS.get(dsn)
+    if pool is not None:
+        return pool
+    import asyncpg
+    async with _PG_POOL_LOCK:
+        _check_open()
+        pool = _PG_POOLS.get(dsn)
+        if pool is not None:
+            return pool
+        cache_size = _pg_statement_cache_size(dsn)
         last_exc: BaseException | None = None
         for attempt in range(3):
             try:
-                conn = await asyncpg.connect(db_source, statement_cache_size=0)
+                pool = await asyncpg.create_pool(
+                    dsn, min_size=1, max_size=_READ_POOL_SIZE,
+                    statement_cache_size=cache_size,
+                    max_inactive_connection_lifetime=300,
+                )
                 break
             except (asyncpg.ConnectionFailureError, OSError) as exc:
                 last_exc = exc
@@ -97,18 +451,96 @@ async def _connect(db_source: str):
                 await asyncio.sleep(wait)
         else:
             raise last_exc  # type: ignore[misc]
-        try:
+        if _CLOSED:
+            # close_all() ran while the pool was connecting
+            await pool.close()
+            _check_open()
+        logger.debug("PG metrics pool ready (statement cache size %d)", cache_size)
+        _PG_POOLS[dsn] = pool
+        return pool
+
+
+async def close_all() -> None:
+    """Close all pooled SQLite and PostgreSQL connections at report shutdown.
+
+    Final: any later attempt to borrow a pooled connection raises
+    ``RuntimeError`` rather than opening a pool nobody would close.
+    """
+    global _CLOSED
+    _CLOSED = True
+    pools = list(_POOLS.values())
+    _POOLS.clear()
+    for pool in pools:
+        await pool.close()
+    pg_pools = list(_PG_POOLS.values())
+    _PG_POOLS.clear()
+    for pg_pool in pg_pools:
+        await pg_pool.close()
+
+
+@asynccontextmanager
+async def _connect(db_source: str, *, write: bool = False):
+    """Yield a backend-agnostic adapter for *db_source*.
+
+    SQLite sources borrow a connection from the file's :class:`_ReadPool`;
+    it goes back to the pool (still open) when the block exits.  Pooled
+    connections are query-only, so ``write=True`` opens a dedicated
+    autocommit connection instead, with the same PRAGMAs bar query_only,
+    and closes it afterwards.
+
+    PostgreSQL sources likewise borrow from the DSN's asyncpg pool (see
+    :func:`_get_pg_pool`), so only the first query pays for connecting.
+    """
+    if _is_pg(db_source):
+        pool = await _get_pg_pool(db_source)
+        async with pool.acquire() as conn:
             yield _PgAdapter(conn)
-        finally:
-            await conn.close()
-    else:
+    elif write:
         import aiosqlite
-        db = await aiosqlite.connect(db_source)
-        db.row_factory = aiosqlite.Row
+        db = await aiosqlite.connect(db_source, timeout=5.0, isolation_level=None)
         try:
-            yield _SqliteAdapter(db)
+            await _apply_pragmas(
+                db, {k: v for k, v in _SQLITE_PRAGMAS.items() if k != "query_only"},
+            )
+            yield _SqliteAdapter(db, await _probe_schema(db))
         finally:
             await db.close()
+    else:
+        pool = _get_pool(db_source)
+        async with pool.acquire() as db:
+            yield _SqliteAdapter(db, pool.schema)
+
+
+async def _gather_all(*aws) -> list:
+    """Like ``asyncio.gather``, but a failure cancels and awaits the rest.
+
+    Plain ``gather`` leaves the siblings running after the first error
+    propagates, so they could still be borrowing connections while the
+    caller's ``finally`` closes the pools.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _gather_on(db_source: str, *jobs) -> list:
+    """Run independent *jobs* concurrently, each on its own pooled connection.
+
+    Each job is a callable taking an adapter and returning an awaitable, so
+    a report's queries cost one round-trip of wall time instead of one per
+    query.  Results come back in job order.  Jobs must not open connections
+    of their own: the pool may be smaller than ``len(jobs)``.
+    """
+    async def run(job):
+        async with _connect(db_source) as db:
+            return await job(db)
+
+    return await _gather_all(*(run(job) for job in jobs))
 
 
 # ---------------------------------------------------------------------------
@@ -121,7 +553,12 @@ def _where(
     date_after: Optional[str] = None,
     table_prefix: str = "a",
 ) -> tuple[str, list]:
-    """Build a WHERE clause + params from optional filters."""
+    """Build a WHERE clause + params from optional filters.
+
+    Clauses are always emitted in the same order with ``?`` placeholders, so
+    each combination of filters yields one canonical SQL text (and one
+    cached prepared statement) whatever the filter values are.
+    """
     clauses: list[str] = []
     params: list = []
     if parameter_set_id is not None:
@@ -141,10 +578,514 @@ def _safe_div(a, b, default=0.0):
     return a / b if b else default
 
 
+def _add_pair_rate(rows: list[dict], pairs: str = "pairs", total: str = "attempts") -> list[dict]:
+    """Set each row's ``pair_rate`` from its pair and attempt counts, in place.
+
+    Saves evaluating an ``AVG(CASE ...)`` per row next to the ``COUNT(*)
+    FILTER`` that already counts pairs.  Empty groups get ``None``, as AVG
+    returns for them.
+    """
+    for row in rows:
+        row["pair_rate"] = _safe_div(row[pairs], row[total], None)
+    return rows
+
+
+def _label_buckets(rows: list[dict], labels: tuple, name: str = "bucket") -> list[dict]:
+    """Replace each row's integer ``bucket_idx`` with its label, in index order.
+
+    Bucketed queries group on a small integer (cheaper to hash than a label
+    string) and leave the presentation to this helper.
+    """
+    out = []
+    for row in sorted(rows, key=lambda r: r["bucket_idx"]):
+        idx = row.pop("bucket_idx")
+        out.append({name: labels[idx], **row})
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+_METRIC_CACHE_MAX_ENTRIES = 256
+
+# PostgreSQL has no local change stamp, so its results are served for at
+# most this long; writes committed meanwhile show up on the next miss.
+_METRIC_CACHE_PG_TTL_SECONDS = 60.0
+
+# (function, source, parameter set, args, kwargs, file stamp) ->
+# (expiry on the monotonic clock, result), least recently used first
+_METRIC_CACHE: OrderedDict[tuple, tuple[float, object]] = OrderedDict()
+
+
+def _sqlite_stamp(db_path: str) -> tuple:
+    """Change stamp for a SQLite file and its WAL (where writes land first).
+
+    A missing WAL and an empty one stamp the same: opening a connection
+    creates the file and closing the last one removes it.
+    """
+    stamp = []
+    for path in (db_path, db_path + "-wal"):
+        try:
+            st = os.stat(path)
+        except OSError:
+            stamp.append(None)
+            continue
+        stamp.append((st.st_mtime_ns, st.st_size) if st.st_size else None)
+    return tuple(stamp)
+
+
+def _cached_metric(fn):
+    """Memoise a ``get_*`` query on its arguments and the SQLite file stamp.
+
+    Any write to a SQLite database changes the stamp, so stale entries are
+    never served; they simply age out of the LRU.  PostgreSQL results are
+    kept for :data:`_METRIC_CACHE_PG_TTL_SECONDS` instead.  Cached results
+    are shared between callers and must be treated as read-only.
+    """
+    params = list(inspect.signature(fn).parameters)
+    ps_pos = params.index("parameter_set_id") - 1 if "parameter_set_id" in params else None
+
+    @functools.wraps(fn)
+    async def wrapper(db_source: str, *args, **kwargs):
+        if ps_pos is None:
+            ps = None
+        else:
+            ps = kwargs.get("parameter_set_id", args[ps_pos] if len(args) > ps_pos else None)
+        pg = _is_pg(db_source)
+        key = (
+            fn.__name__, db_source, ps,
+            tuple(tuple(a) if isinstance(a, list) else a for a in args),
+            tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in kwargs.items())),
+            None if pg else _sqlite_stamp(db_source),
+        )
+        now = time.monotonic()
+        entry = _METRIC_CACHE.get(key)
+        if entry is not None and entry[0] > now:
+            _METRIC_CACHE.move_to_end(key)
+            return entry[1]
+        result = await fn(db_source, *args, **kwargs)
+        expires = now + _METRIC_CACHE_PG_TTL_SECONDS if pg else math.inf
+        _METRIC_CACHE[key] = (expires, result)
+        _METRIC_CACHE.move_to_end(key)
+        if len(_METRIC_CACHE) > _METRIC_CACHE_MAX_ENTRIES:
+            _METRIC_CACHE.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+def invalidate_metrics_cache(parameter_set_id: Optional[int] = None) -> None:
+    """Drop cached ``get_*`` results, e.g. after a backfill rewrote Attempts.
+
+    With *parameter_set_id*, only results that can include that set are
+    dropped: its own and those spanning every set.
+    """
+    if parameter_set_id is None:
+        _METRIC_CACHE.clear()
+        return
+    for key in [k for k in _METRIC_CACHE if k[2] in (None, parameter_set_id)]:
+        del _METRIC_CACHE[key]
+
+
+# ---------------------------------------------------------------------------
+# Persistent histogram cache
+# ---------------------------------------------------------------------------
+
+_TTP_LABELS = ("0-10s", "10-30s", "30-60s", "60-120s", "120-300s", "300s+")
+_MAE_LABELS = ("0 (no loss)", "1-2 pts", "3-5 pts", "6-10 pts", "10+ pts")
+_COST_LABELS = ("Cheap (<90)", "Medium (90-95)", "Expensive (>95)")
+
+_PROFIT_EXPR = """
+    CASE
+      WHEN pair_profit_points IS NOT NULL THEN pair_profit_points
+      WHEN status = 'completed_failed' THEN -COALESCE(stop_loss_threshold_points, P1_points)
+    END"""
+
+# Composite key for get_all_stats_single_pass: first leg (0 YES, 1 NO),
+# phase, reference regime, minute remaining and 3-minute window packed as
+# leg * 100000 + phase * 10000 + regime * 1000 + minute * 10 + window.
+_LEG_SIDES = ("YES", "NO")
+_BREAKDOWN_KEY = """(
+          CASE WHEN first_leg_side = 'YES' THEN 0 ELSE 1 END * 100000
+          + CASE
+              WHEN time_remaining_at_start > 600 THEN 0
+              WHEN time_remaining_at_start > 300 THEN 1
+              ELSE 2
+            END * 10000
+          + CASE
+              WHEN reference_yes_points BETWEEN 45 AND 55 THEN 0
+              WHEN reference_yes_points BETWEEN 56 AND 70 THEN 3
+              WHEN reference_yes_points BETWEEN 30 AND 44 THEN 2
+              ELSE 1
+            END * 1000
+          + time_remaining_bucket * 10
+          + CASE
+              WHEN time_remaining_at_start > 720 THEN 0
+              WHEN time_remaining_at_start > 540 THEN 1
+              WHEN time_remaining_at_start > 360 THEN 2
+              WHEN time_remaining_at_start > 180 THEN 3
+              ELSE 4
+            END
+        )"""
+
+# name -> (Attempts expression holding the bucket index, usually a bucket
+# column (see _BUCKET_EXPRS); row filter; averaged columns as (output name,
+# expression)).
+# Averages are kept as SUM/COUNT pairs so bucket rows add up across
+# refreshes, parameter sets and the live tail.  Every entry, the proximity
+# and breakdown rollups included, is read through _cached_sums and rebuilt
+# by refresh_metrics_cache under the one _WATERMARK floor, so attempts
+# dropped by retention leave all of them together.  A new cached section
+# belongs here rather than in a MetricsCache row of its own.
+_HISTOGRAMS: dict[str, tuple[str, str, tuple[tuple[str, str], ...]]] = {
+    "time_to_pair": (
+        "ttp_bucket",
+        "status = 'completed_paired'",
+        (("avg_profit", "pair_profit_points"),),
+    ),
+    "mae": (
+        "mae_bucket",
+        "max_adverse_excursion_points IS NOT NULL",
+        (("pair_rate", "CASE WHEN status='completed_paired' THEN 1.0 ELSE 0.0 END"),),
+    ),
+    "pair_cost": (
+        "cost_bucket",
+        "status = 'completed_paired'",
+        (("avg_profit", "pair_profit_points"), ("avg_ttp", "time_to_pair_seconds")),
+    ),
+    "proximity": (
+        "proximity_bucket",
+        "status = 'completed_failed' AND closest_approach_points IS NOT NULL",
+        (("avg_closest", "closest_approach_points"),),
+    ),
+    "breakdown": (
+        _BREAKDOWN_KEY,
+        "1 = 1",
+        (
+            ("pairs", "CASE WHEN status='completed_paired' THEN 1 ELSE 0 END"),
+            ("ttp", "CASE WHEN status='completed_paired' THEN time_to_pair_seconds END"),
+            ("profit", _PROFIT_EXPR),
+            ("mae", "max_adverse_excursion_points"),
+        ),
+    ),
+}
+
+# MetricsCache row holding the highest attempt_id folded in so far, with
+# value_json ``[floor]``: MIN(attempt_id) when the sums were built.
+_WATERMARK = "_watermark"
+
+# Attempts older than this are settled: their market has long closed and
+# every lower attempt_id has committed, so their buckets never change again.
+_METRICS_CACHE_SETTLE_SECONDS = 3600
+
+
+async def _attempts_floor(db) -> Optional[int]:
+    """Lowest attempt_id still in Attempts.
+
+    Retention (pg_partman drops partitions past 30 days) only ever removes
+    the oldest attempts, so a floor above the one MetricsCache was built on
+    means its sums still count attempts that no longer exist.
+    """
+    row = await db.fetch_one("SELECT MIN(attempt_id) as floor FROM Attempts")
+    return row.get("floor")
+
+
+def _watermark_floor(value_json) -> Optional[int]:
+    """The floor stored in the ``_WATERMARK`` row, or None if it has none."""
+    value = orjson.loads(value_json or "[]")
+    return value[0] if value else None
+
+
+def _histogram_sql(name: str, extra_where: str = "") -> str:
+    """Per-(parameter set, bucket) additive sums for histogram *name*."""
+    bucket, where, avgs = _HISTOGRAMS[name]
+    sums = "".join(
+        f",\n          SUM({expr}) as {col}_sum, COUNT({expr}) as {col}_n"
+        for col, expr in avgs
+    )
+    return f"""
+        SELECT
+          parameter_set_id,
+          {bucket} as bucket_idx,
+          COUNT(*) as count{sums}
+        FROM Attempts
+        WHERE {where} {extra_where}
+        GROUP BY parameter_set_id, bucket_idx
+    """
+
+
+def _histogram_sums(row: dict, avgs: tuple) -> list:
+    """Flatten one :func:`_histogram_sql` row into ``[count, sum, n, ...]``."""
+    sums = [row["count"]]
+    for col, _ in avgs:
+        total = row[f"{col}_sum"] or 0
+        sums += [total if isinstance(total, int) else float(total), row[f"{col}_n"]]
+    return sums
+
+
+def _add_sums(a: list | None, b: list) -> list:
+    return list(b) if a is None else [x + y for x, y in zip(a, b)]
+
+
+async def _cached_sums(
+    db, names: tuple[str, ...], parameter_set_id: Optional[int],
+) -> tuple[int, dict[str, dict[int, list]]]:
+    """Return the MetricsCache watermark and settled bucket sums for *names*.
+
+    Without a usable cache the watermark is 0 and no sums are returned, so
+    the caller's tail scan covers all of Attempts.  That includes a cache
+    built before retention dropped old attempts (see :func:`_attempts_floor`)
+    until :func:`refresh_metrics_cache` rebuilds it.
+    """
+    sums: dict[str, dict[int, list]] = {name: {} for name in names}
+    watermark, floor = 0, None
+    try:
+        cached = await db.fetch_records(
+            "SELECT parameter_set_id, metric_name, bucket_key, value_json, last_attempt_id"
+            f" FROM MetricsCache WHERE metric_name IN ({', '.join('?' * (len(names) + 1))})",
+            [*names, _WATERMARK],
+        )
+    except Exception as exc:  # table not created yet (older schema)
+        logger.debug("MetricsCache unavailable (%s); scanning Attempts", exc)
+        cached = []
+    for r in cached:
+        if r["metric_name"] == _WATERMARK:
+            watermark = r["last_attempt_id"]
+            floor = _watermark_floor(r["value_json"])
+        elif parameter_set_id is None or r["parameter_set_id"] == parameter_set_id:
+            buckets = sums[r["metric_name"]]
+            key = r["bucket_key"]
+            buckets[key] = _add_sums(buckets.get(key), orjson.loads(r["value_json"]))
+    if watermark and (floor is None or floor != await _attempts_floor(db)):
+        logger.debug("MetricsCache predates retention; scanning Attempts")
+        watermark = 0
+    if not watermark:
+        sums = {name: {} for name in names}
+    return watermark, sums
+
+
+def _tail_where(watermark: int, parameter_set_id: Optional[int]) -> tuple[str, list]:
+    """``AND`` clauses (and params) selecting the attempts past *watermark*."""
+    clauses, params = [], []
+    if watermark:
+        clauses.append("AND attempt_id > ?")
+        params.append(watermark)
+    if parameter_set_id:
+        clauses.append("AND parameter_set_id = ?")
+        params.append(parameter_set_id)
+    return " ".join(clauses), params
+
+
+def _histogram_rows(name: str, buckets: dict[int, list]) -> list[dict]:
+    """Turn per-bucket ``[count, sum, n, ...]`` lists into histogram rows."""
+    _, _, avgs = _HISTOGRAMS[name]
+    rows = []
+    for key, sums in buckets.items():
+        row = {"bucket_idx": key, "count": sums[0]}
+        for i, (col, _) in enumerate(avgs):
+            row[col] = _safe_div(sums[1 + 2 * i], sums[2 + 2 * i], None)
+        rows.append(row)
+    return rows
+
+
+async def _bucket_sums(db, name: str, parameter_set_id: Optional[int]) -> dict[int, list]:
+    """Per-bucket sums for *name*: MetricsCache plus a scan of the unsettled tail."""
+    _, _, avgs = _HISTOGRAMS[name]
+    watermark, cached = await _cached_sums(db, (name,), parameter_set_id)
+    buckets = cached[name]
+    where, params = _tail_where(watermark, parameter_set_id)
+    for r in await db.fetch_records(_histogram_sql(name, where), params):
+        key = r["bucket_idx"]
+        buckets[key] = _add_sums(buckets.get(key), _histogram_sums(r, avgs))
+    return buckets
+
+
+async def _histogram(db, name: str, parameter_set_id: Optional[int]) -> list[dict]:
+    """Histogram *name* from MetricsCache plus a scan of the unsettled tail."""
+    return _histogram_rows(name, await _bucket_sums(db, name, parameter_set_id))
+
+
+# Up to this many unsettled attempts, get_distributions_vectorized fetches
+# them once and bins every histogram client-side; past it, pulling the rows
+# into Python costs more than one GROUP BY per histogram.
+_VECTORIZED_MAX_ROWS = 200_000
+
+
+def _bincount_sums(data: np.ndarray, col: int, n_avgs: int) -> dict[int, list]:
+    """Per-bucket ``[count, sum, n, ...]`` from columns ``col`` onwards of *data*.
+
+    Column ``col`` is the bucket index, ``col + 1`` the histogram's row
+    filter as 0/1 and the next *n_avgs* columns the averaged expressions,
+    NaN where NULL (skipped, as SQL's SUM/COUNT skip NULLs).
+    """
+    keep = data[:, col + 1] == 1
+    idx = data[keep, col].astype(np.intp)
+    if not idx.size:
+        return {}
+    counts = np.bincount(idx)
+    parts = [counts]
+    for j in range(n_avgs):
+        values = data[keep, col + 2 + j]
+        present = ~np.isnan(values)
+        parts.append(np.bincount(idx[present], weights=values[present], minlength=counts.size))
+        parts.append(np.bincount(idx[present], minlength=counts.size))
+    table = np.column_stack(parts).tolist()
+    return {int(b): [int(table[b][0]), *table[b][1:]] for b in np.flatnonzero(counts)}
+
+
+def _histogram_rows_np(name: str, buckets: dict[int, list]) -> list[dict]:
+    """:func:`_histogram_rows` with every bucket's averages in one ``np.divide``."""
+    if not buckets:
+        return []
+    _, _, avgs = _HISTOGRAMS[name]
+    keys = list(buckets)
+    table = np.array([buckets[k] for k in keys], dtype=float)
+    sums, ns = table[:, 1::2], table[:, 2::2]
+    means = np.divide(sums, ns, out=np.full_like(sums, np.nan), where=ns != 0)
+    means = np.where(np.isnan(means), None, means).tolist()
+    rows = []
+    for key, count, row_means in zip(keys, table[:, 0].tolist(), means):
+        row = {"bucket_idx": key, "count": int(count)}
+        row.update(zip((col for col, _ in avgs), row_means))
+        rows.append(row)
+    return rows
+
+
+@_cached_metric
+async def get_distributions_vectorized(
+    db_source: str,
+    parameter_set_id: Optional[int] = None,
+) -> dict:
+    """Time-to-pair, MAE and pair-cost histograms from one fetch of the tail.
+
+    Settled buckets come from MetricsCache as in :func:`_histogram`.  The
+    unsettled attempts are read once, with each histogram's bucket column,
+    row filter and averaged expressions side by side, and binned with
+    ``np.bincount`` instead of one GROUP BY per histogram.  Tails longer
+    than ``_VECTORIZED_MAX_ROWS`` fall back to the per-histogram SQL.
+    Keys: ``time_to_pair``, ``mae``, ``pair_cost``.
+    """
+    names = ("time_to_pair", "mae", "pair_cost")
+    labels = {"time_to_pair": _TTP_LABELS, "mae": _MAE_LABELS, "pair_cost": _COST_LABELS}
+    async with _connect(db_source) as db:
+        watermark, buckets = await _cached_sums(db, names, parameter_set_id)
+        where, params = _tail_where(watermark, parameter_set_id)
+        tail = await db.fetch_one(
+            f"SELECT COUNT(*) as n FROM Attempts WHERE 1 = 1 {where}", params,
+        )
+        if tail["n"] > _VECTORIZED_MAX_ROWS:
+            rows = {name: await _histogram(db, name, parameter_set_id) for name in names}
+            return {name: _label_buckets(rows[name], labels[name]) for name in names}
+
+        select, offsets = [], {}
+        for name in names:
+            bucket, cond, avgs = _HISTOGRAMS[name]
+            offsets[name] = len(select)
+            select += [bucket, f"CASE WHEN {cond} THEN 1 ELSE 0 END"]
+            select += [expr for _, expr in avgs]
+        data = np.array(
+            await db.fetch_rows(
+                f"SELECT {', '.join(select)} FROM Attempts WHERE 1 = 1 {where}", params,
+            ),
+            dtype=float,
+        ).reshape(-1, len(select))
+
+    out = {}
+    for name in names:
+        merged = buckets[name]
+        avgs = _HISTOGRAMS[name][2]
+        for key, sums in _bincount_sums(data, offsets[name], len(avgs)).items():
+            merged[key] = _add_sums(merged.get(key), sums)
+        out[name] = _label_buckets(_histogram_rows_np(name, merged), labels[name])
+    return out
+
+
+async def refresh_metrics_cache(db_source: str) -> int:
+    """Fold newly settled attempts into MetricsCache and return the watermark.
+
+    Only attempts above the stored watermark are read (a range scan on
+    ``attempt_id``), so each refresh costs O(new attempts).  Once retention
+    has dropped attempts the sums were built on, the cache is emptied and
+    rebuilt from what is left.  Must be run against a writable database;
+    reports work without it, just slower.
+    """
+    settled_before_us = int((time.time() - _METRICS_CACHE_SETTLE_SECONDS) * 1_000_000)
+    async with _connect(db_source, write=True) as db:
+        async with db.transaction():
+            row = await db.fetch_one(
+                "SELECT last_attempt_id, value_json FROM MetricsCache WHERE metric_name = ?",
+                [_WATERMARK],
+            )
+            old = row.get("last_attempt_id") or 0
+            floor = await _attempts_floor(db)
+            if old and _watermark_floor(row.get("value_json")) != floor:
+                logger.info("Attempts below the MetricsCache floor were dropped; rebuilding")
+                await db.execute("DELETE FROM MetricsCache")
+                old = 0
+            row = await db.fetch_one(
+                "SELECT MAX(attempt_id) as w FROM Attempts"
+                " WHERE attempt_id > ? AND t1_ts_us < ?",
+                [old, settled_before_us],
+            )
+            new = row.get("w")
+            if new is None:
+                return old
+
+            existing = await db.fetch_records(
+                "SELECT parameter_set_id, metric_name, bucket_key, value_json"
+                " FROM MetricsCache WHERE metric_name != ?",
+                [_WATERMARK],
+            )
+            merged = {
+                (r["parameter_set_id"], r["metric_name"], r["bucket_key"]):
+                    orjson.loads(r["value_json"])
+                for r in existing
+            }
+            touched = set()
+            for name, (_, _, avgs) in _HISTOGRAMS.items():
+                for r in await db.fetch_records(
+                    _histogram_sql(name, "AND attempt_id > ? AND attempt_id <= ?"),
+                    [old, new],
+                ):
+                    key = (r["parameter_set_id"] or 0, name, r["bucket_idx"])
+                    merged[key] = _add_sums(merged.get(key), _histogram_sums(r, avgs))
+                    touched.add(key)
+
+            await db.executemany(
+                "INSERT INTO MetricsCache"
+                " (parameter_set_id, metric_name, bucket_key, value_json, last_attempt_id)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (parameter_set_id, metric_name, bucket_key) DO UPDATE SET"
+                " value_json = excluded.value_json,"
+                " last_attempt_id = excluded.last_attempt_id",
+                [(*key, orjson.dumps(merged[key]).decode(), new) for key in touched]
+                + [(0, _WATERMARK, 0, orjson.dumps([floor]).decode(), new)],
+            )
+    return new
+
+
 # ---------------------------------------------------------------------------
 # Core queries
 # ---------------------------------------------------------------------------
 
+# Select list shared by get_overall_stats and get_overall_stats_bulk
+_OVERALL_STATS_COLUMNS = """
+            COUNT(*) as total_attempts,
+            COUNT(*) FILTER (WHERE a.status='completed_paired') as total_pairs,
+            COUNT(*) FILTER (WHERE a.status='completed_failed') as total_failed,
+            AVG(a.time_to_pair_seconds) FILTER (WHERE a.status='completed_paired') as avg_ttp,
+            AVG(a.pair_cost_points) FILTER (WHERE a.status='completed_paired') as avg_cost,
+            AVG(a.pair_profit_points) FILTER (WHERE a.status='completed_paired') as avg_pair_profit,
+            AVG(
+              CASE
+                WHEN a.pair_profit_points IS NOT NULL THEN a.pair_profit_points
+                WHEN a.status = 'completed_failed' THEN -COALESCE(a.stop_loss_threshold_points, a.P1_points)
+              END
+            ) as avg_profit"""
+
+
+@_cached_metric
 async def get_overall_stats(
     db_source: str,
     parameter_set_id: Optional[int] = None,
@@ -153,29 +1094,69 @@ async def get_overall_stats(
 ) -> dict:
     """Total attempts, pairs, pair_rate, avg/median time_to_pair."""
     where, params = _where(parameter_set_id, crypto_asset, date_after)
-    join = "JOIN Markets m ON a.market_id = m.market_id" if crypto_asset else ""
+    if _is_pg(db_source):
+        source = "Attempts a"
+        if crypto_asset:
+            source += " JOIN Markets m ON a.market_id = m.market_id"
+    elif crypto_asset:
+        # The asset's few markets drive the join; CROSS JOIN pins that order
+        source = (
+            "Markets m INDEXED BY idx_markets_asset"
+            " CROSS JOIN Attempts a ON a.market_id = m.market_id"
+        )
+    elif parameter_set_id is not None:
+        source = "Attempts a INDEXED BY idx_attempts_metrics"
+    else:
+        source = "Attempts a"
 
     sql = f"""
-        SELECT
-            COUNT(*) as total_attempts,
-            SUM(CASE WHEN a.status='completed_paired' THEN 1 ELSE 0 END) as total_pairs,
-            SUM(CASE WHEN a.status='completed_failed' THEN 1 ELSE 0 END) as total_failed,
-            AVG(CASE WHEN a.status='completed_paired' THEN 1.0 ELSE 0.0 END) as pair_rate,
-            AVG(CASE WHEN a.status='completed_paired' THEN a.time_to_pair_seconds END) as avg_ttp,
-            AVG(CASE WHEN a.status='completed_paired' THEN a.pair_cost_points END) as avg_cost,
-            AVG(CASE WHEN a.status='completed_paired' THEN a.pair_profit_points END) as avg_pair_profit,
-            AVG(
-              CASE
-                WHEN a.pair_profit_points IS NOT NULL THEN a.pair_profit_points
-                WHEN a.status = 'completed_failed' THEN -COALESCE(a.stop_loss_threshold_points, a.P1_points)
-              END
-            ) as avg_profit
-        FROM Attempts a {join} {where}
+        SELECT {_OVERALL_STATS_COLUMNS}
+        FROM {source} {where}
+    """
+    async with _connect(db_source) as db:
+        row = await db.fetch_one(sql, params)
+    _add_pair_rate([row], "total_pairs", "total_attempts")
+    return row
+
+
+@_cached_metric
+async def get_overall_stats_bulk(
+    db_source: str,
+    parameter_set_ids: list[int],
+    crypto_asset: Optional[str] = None,
+    date_after: Optional[str] = None,
+) -> dict[int, dict]:
+    """:func:`get_overall_stats` for several parameter sets in one grouped scan.
+
+    Returns ``{parameter_set_id: stats}`` with an entry for every requested
+    id; sets without attempts get zero counts and ``None`` averages, as
+    :func:`get_overall_stats` returns for them.
+    """
+    ids = list(dict.fromkeys(parameter_set_ids))
+    if not ids:
+        return {}
+    where, params = _where(None, crypto_asset, date_after)
+    ids_clause = f"a.parameter_set_id IN ({', '.join('?' * len(ids))})"
+    where = f"{where} AND {ids_clause}" if where else f" WHERE {ids_clause}"
+    join = " JOIN Markets m ON a.market_id = m.market_id" if crypto_asset else ""
+    sql = f"""
+        SELECT a.parameter_set_id, {_OVERALL_STATS_COLUMNS}
+        FROM Attempts a{join} {where}
+        GROUP BY a.parameter_set_id
     """
     async with _connect(db_source) as db:
-        return await db.fetch_one(sql, params)
+        rows = await db.fetch_all(sql, params + ids)
 
+    found = {r.pop("parameter_set_id"): r for r in _add_pair_rate(rows, "total_pairs", "total_attempts")}
+    empty = dict.fromkeys(
+        ("total_attempts", "total_pairs", "total_failed", "avg_ttp",
+         "avg_cost", "avg_pair_profit", "avg_profit", "pair_rate"),
+    )
+    empty.update(total_attempts=0, total_pairs=0, total_failed=0)
+    return {ps: found.get(ps) or dict(empty) for ps in ids}
 
+
+@_cached_metric
 async def get_stats_by_asset(
     db_source: str,
     parameter_set_id: Optional[int] = None,
@@ -187,9 +1168,8 @@ async def get_stats_by_asset(
     sql = f"""
         SELECT m.crypto_asset,
                COUNT(*) as attempts,
-               SUM(CASE WHEN a.status='completed_paired' THEN 1 ELSE 0 END) as pairs,
-               AVG(CASE WHEN a.status='completed_paired' THEN 1.0 ELSE 0.0 END) as pair_rate,
-               AVG(CASE WHEN a.status='completed_paired' THEN a.time_to_pair_seconds END) as avg_ttp
+               COUNT(*) FILTER (WHERE a.status='completed_paired') as pairs,
+               AVG(a.time_to_pair_seconds) FILTER (WHERE a.status='completed_paired') as avg_ttp
         FROM Attempts a
         JOIN Markets m ON a.market_id = m.market_id
         {ps_clause}
@@ -197,36 +1177,118 @@ async def get_stats_by_asset(
         ORDER BY m.crypto_asset
     """
     async with _connect(db_source) as db:
-        return await db.fetch_all(sql, ps_params)
+        return _add_pair_rate(await db.fetch_all(sql, ps_params))
 
 
+@_cached_metric
 async def get_time_to_pair_distribution(
     db_source: str,
     parameter_set_id: Optional[int] = None,
 ) -> list[dict]:
     """Histogram buckets for time-to-pair."""
-    ps_clause = "AND parameter_set_id = ?" if parameter_set_id else ""
-    ps_params = [parameter_set_id] if parameter_set_id else []
+    async with _connect(db_source) as db:
+        rows = await _histogram(db, "time_to_pair", parameter_set_id)
+    return _label_buckets(rows, _TTP_LABELS)
 
-    sql = f"""
-        SELECT
-          CASE
-            WHEN time_to_pair_seconds < 10 THEN '0-10s'
-            WHEN time_to_pair_seconds < 30 THEN '10-30s'
-            WHEN time_to_pair_seconds < 60 THEN '30-60s'
-            WHEN time_to_pair_seconds < 120 THEN '60-120s'
-            WHEN time_to_pair_seconds < 300 THEN '120-300s'
-            ELSE '300s+'
-          END as bucket,
-          COUNT(*) as count,
-          AVG(pair_profit_points) as avg_profit
-        FROM Attempts
-        WHERE status = 'completed_paired' {ps_clause}
-        GROUP BY bucket
-        ORDER BY MIN(time_to_pair_seconds)
+
+# Labels for the integer bucket indexes emitted by the single-pass query,
+# in report order.
+_PHASE_LABELS = ("Early (10min+)", "Middle (5-10min)", "Late (0-5min)")
+_REGIME_LABELS = (
+    "Balanced (45-55)",
+    "Extreme (<30 or >70)",
+    "NO-favored (30-44)",
+    "YES-favored (56-70)",
+)
+_MINUTE_LABELS = tuple(f"{m} min" for m in range(15, -1, -1))
+_WINDOW_LABELS = ("00-03 min", "03-06 min", "06-09 min", "09-12 min", "12-15 min")
+
+
+@_cached_metric
+async def get_all_stats_single_pass(
+    db_source: str,
+    parameter_set_id: Optional[int] = None,
+) -> dict:
+    """First-leg, phase, regime, minute and window breakdowns.
+
+    Additive sums/counts per combined (first_leg_side, phase, regime,
+    minute, window) key come from MetricsCache plus a scan of the unsettled
+    tail (see :func:`_bucket_sums`); each breakdown is rolled up from them
+    client-side.  Keys: ``by_first_leg``, ``by_phase``, ``by_regime``,
+    ``by_time_bucket``, ``by_market_minute``.
     """
     async with _connect(db_source) as db:
-        return await db.fetch_all(sql, ps_params)
+        buckets = await _bucket_sums(db, "breakdown", parameter_set_id)
+
+    rows = []
+    for key, t in buckets.items():
+        leg, key = divmod(key, 100000)
+        phase, key = divmod(key, 10000)
+        regime, key = divmod(key, 1000)
+        minute, window = divmod(key, 10)
+        rows.append({
+            "first_leg_side": _LEG_SIDES[leg], "phase_idx": phase,
+            "regime_idx": regime, "minute_idx": minute, "window_idx": window,
+            "attempts": t[0], "pairs": t[1], "ttp_sum": t[3], "ttp_n": t[4],
+            "profit_sum": t[5], "profit_n": t[6], "mae_sum": t[7], "mae_n": t[8],
+        })
+
+    def rollup(key: str) -> dict:
+        acc: dict = {}
+        for r in rows:
+            t = acc.get(r[key])
+            if t is None:
+                t = acc[r[key]] = [0] * 8
+            t[0] += r["attempts"]
+            t[1] += r["pairs"] or 0
+            t[2] += r["ttp_sum"] or 0
+            t[3] += r["ttp_n"]
+            t[4] += r["profit_sum"] or 0
+            t[5] += r["profit_n"]
+            t[6] += r["mae_sum"] or 0
+            t[7] += r["mae_n"]
+        return acc
+
+    def stats(t: list, full: bool = True, mae: bool = True) -> dict:
+        out = {
+            "attempts": t[0],
+            "pairs": t[1],
+            "pair_rate": _safe_div(t[1], t[0], None),
+        }
+        if full:
+            out["avg_ttp"] = _safe_div(t[2], t[3], None)
+            out["avg_profit"] = _safe_div(t[4], t[5], None)
+            if mae:
+                out["avg_mae"] = _safe_div(t[6], t[7], None)
+        return out
+
+    legs = rollup("first_leg_side")
+    phases = rollup("phase_idx")
+    regimes = rollup("regime_idx")
+    minutes = rollup("minute_idx")
+    windows = rollup("window_idx")
+    return {
+        "by_first_leg": [
+            {"first_leg_side": k, **stats(legs[k])}
+            for k in sorted(legs, key=lambda k: (k is not None, k or ""))
+        ],
+        "by_phase": [
+            {"phase": _PHASE_LABELS[i], **stats(phases[i], full=False)}
+            for i in sorted(phases)
+        ],
+        "by_regime": [
+            {"regime": _REGIME_LABELS[i], **stats(regimes[i], full=False)}
+            for i in sorted(regimes)
+        ],
+        "by_time_bucket": [
+            {"bucket": _MINUTE_LABELS[i], **stats(minutes[i])}
+            for i in sorted(minutes)
+        ],
+        "by_market_minute": [
+            {"bucket": _WINDOW_LABELS[i], **stats(windows[i], mae=False)}
+            for i in sorted(windows)
+        ],
+    }
 
 
 async def get_stats_by_first_leg(
@@ -234,27 +1296,8 @@ async def get_stats_by_first_leg(
     parameter_set_id: Optional[int] = None,
 ) -> list[dict]:
     """YES-first vs NO-first breakdown with MAE and profit."""
-    ps_clause = "WHERE parameter_set_id = ?" if parameter_set_id else ""
-    ps_params = [parameter_set_id] if parameter_set_id else []
-
-    sql = f"""
-        SELECT first_leg_side,
-               COUNT(*) as attempts,
-               SUM(CASE WHEN status='completed_paired' THEN 1 ELSE 0 END) as pairs,
-               AVG(CASE WHEN status='completed_paired' THEN 1.0 ELSE 0.0 END) as pair_rate,
-               AVG(CASE WHEN status='completed_paired' THEN time_to_pair_seconds END) as avg_ttp,
-               AVG(
-                 CASE
-                   WHEN pair_profit_points IS NOT NULL THEN pair_profit_points
-                   WHEN status = 'completed_failed' THEN -COALESCE(stop_loss_threshold_points, P1_points)
-                 END
-               ) as avg_profit,
-               AVG(max_adverse_excursion_points) as avg_mae
-        FROM Attempts {ps_clause}
-        GROUP BY first_leg_side
-    """
-    async with _connect(db_source) as db:
-        return await db.fetch_all(sql, ps_params)
+    stats = await get_all_stats_single_pass(db_source, parameter_set_id)
+    return stats["by_first_leg"]
 
 
 async def get_stats_by_market_phase(
@@ -262,25 +1305,8 @@ async def get_stats_by_market_phase(
     parameter_set_id: Optional[int] = None,
 ) -> list[dict]:
     """Early (10min+), Middle (5-10min), Late (0-5min)."""
-    ps_clause = "WHERE parameter_set_id = ?" if parameter_set_id else ""
-    ps_params = [parameter_set_id] if parameter_set_id else []
-
-    sql = f"""
-        SELECT
-          CASE
-            WHEN time_remaining_at_start > 600 THEN 'Early (10min+)'
-            WHEN time_remaining_at_start > 300 THEN 'Middle (5-10min)'
-            ELSE 'Late (0-5min)'
-          END as phase,
-          COUNT(*) as attempts,
-          SUM(CASE WHEN status='completed_paired' THEN 1 ELSE 0 END) as pairs,
-          AVG(CASE WHEN status='completed_paired' THEN 1.0 ELSE 0.0 END) as pair_rate
-        FROM Attempts {ps_clause}
-        GROUP BY phase
-        ORDER BY MIN(time_remaining_at_start) DESC
-    """
-    async with _connect(db_source) as db:
-        return await db.fetch_all(sql, ps_params)
+    stats = await get_all_stats_single_pass(db_source, parameter_set_id)
+    return stats["by_phase"]
 
 
 async def get_stats_by_reference_regime(
@@ -288,25 +1314,8 @@ async def get_stats_by_reference_regime(
     parameter_set_id: Optional[int] = None,
 ) -> list[dict]:
     """Balanced (45-55), YES-favored (56-70), NO-favored (30-44), Extreme."""
-    ps_clause = "WHERE parameter_set_id = ?" if parameter_set_id else ""
-    ps_params = [parameter_set_id] if parameter_set_id else []
-
-    sql = f"""
-        SELECT
-          CASE
-            WHEN reference_yes_points BETWEEN 45 AND 55 THEN 'Balanced (45-55)'
-            WHEN reference_yes_points BETWEEN 56 AND 70 THEN 'YES-favored (56-70)'
-            WHEN reference_yes_points BETWEEN 30 AND 44 THEN 'NO-favored (30-44)'
-            ELSE 'Extreme (<30 or >70)'
-          END as regime,
-          COUNT(*) as attempts,
-          SUM(CASE WHEN status='completed_paired' THEN 1 ELSE 0 END) as pairs,
-          AVG(CASE WHEN status='completed_paired' THEN 1.0 ELSE 0.0 END) as pair_rate
-        FROM Attempts {ps_clause}
-        GROUP BY regime
-    """
-    async with _connect(db_source) as db:
-        return await db.fetch_all(sql, ps_params)
+    stats = await get_all_stats_single_pass(db_source, parameter_set_id)
+    return stats["by_regime"]
 
 
 async def get_stats_by_time_bucket(
@@ -314,48 +1323,11 @@ async def get_stats_by_time_bucket(
     parameter_set_id: Optional[int] = None,
 ) -> list[dict]:
     """Pair rate by minute remaining at entry (15 min down to 0 min)."""
-    ps_clause = "WHERE parameter_set_id = ?" if parameter_set_id else ""
-    ps_params = [parameter_set_id] if parameter_set_id else []
-
-    sql = f"""
-        SELECT
-          CASE
-            WHEN time_remaining_at_start >= 840 THEN '15 min'
-            WHEN time_remaining_at_start >= 780 THEN '14 min'
-            WHEN time_remaining_at_start >= 720 THEN '13 min'
-            WHEN time_remaining_at_start >= 660 THEN '12 min'
-            WHEN time_remaining_at_start >= 600 THEN '11 min'
-            WHEN time_remaining_at_start >= 540 THEN '10 min'
-            WHEN time_remaining_at_start >= 480 THEN '9 min'
-            WHEN time_remaining_at_start >= 420 THEN '8 min'
-            WHEN time_remaining_at_start >= 360 THEN '7 min'
-            WHEN time_remaining_at_start >= 300 THEN '6 min'
-            WHEN time_remaining_at_start >= 240 THEN '5 min'
-            WHEN time_remaining_at_start >= 180 THEN '4 min'
-            WHEN time_remaining_at_start >= 120 THEN '3 min'
-            WHEN time_remaining_at_start >= 60 THEN '2 min'
-            WHEN time_remaining_at_start >= 0 THEN '1 min'
-            ELSE '0 min'
-          END as bucket,
-          COUNT(*) as attempts,
-          SUM(CASE WHEN status='completed_paired' THEN 1 ELSE 0 END) as pairs,
-          AVG(CASE WHEN status='completed_paired' THEN 1.0 ELSE 0.0 END) as pair_rate,
-          AVG(CASE WHEN status='completed_paired' THEN time_to_pair_seconds END) as avg_ttp,
-          AVG(
-            CASE
-              WHEN pair_profit_points IS NOT NULL THEN pair_profit_points
-              WHEN status = 'completed_failed' THEN -COALESCE(stop_loss_threshold_points, P1_points)
-            END
-          ) as avg_profit,
-          AVG(max_adverse_excursion_points) as avg_mae
-        FROM Attempts {ps_clause}
-        GROUP BY bucket
-        ORDER BY MIN(time_remaining_at_start) DESC
-    """
-    async with _connect(db_source) as db:
-        return await db.fetch_all(sql, ps_params)
+    stats = await get_all_stats_single_pass(db_source, parameter_set_id)
+    return stats["by_time_bucket"]
 
 
+@_cached_metric
 async def get_mae_analysis(
     db_source: str,
     parameter_set_id: Optional[int] = None,
@@ -364,113 +1336,148 @@ async def get_mae_analysis(
     ps_clause = "AND parameter_set_id = ?" if parameter_set_id else ""
     ps_params = [parameter_set_id] if parameter_set_id else []
 
+    # One scan grouped on (outcome, MAE bucket): the per-outcome stats, the
+    # bucket distribution and the overall row are all rolled up from it
+    sql = f"""
+        SELECT
+            status,
+            mae_bucket as bucket_idx,
+            COUNT(*) as count,
+            MAX(max_adverse_excursion_points) as max_mae,
+            SUM(max_adverse_excursion_points) as mae_sum,
+            MIN(max_adverse_excursion_points) as min_mae
+        FROM Attempts
+        WHERE max_adverse_excursion_points IS NOT NULL {ps_clause}
+        GROUP BY status, bucket_idx
+        ORDER BY status, bucket_idx
+    """
     async with _connect(db_source) as db:
-        # Overall MAE stats
-        sql_overall = f"""
-            SELECT
-                COUNT(*) as total,
-                AVG(max_adverse_excursion_points) as avg_mae,
-                MAX(max_adverse_excursion_points) as max_mae,
-                MIN(max_adverse_excursion_points) as min_mae
-            FROM Attempts
-            WHERE max_adverse_excursion_points IS NOT NULL {ps_clause}
-        """
-        overall = await db.fetch_one(sql_overall, ps_params)
+        rows = await db.fetch_records(sql, ps_params)
+
+    outcomes: dict = {}
+    counts: dict = {}
+    for r in rows:
+        acc = outcomes.get(r["status"])
+        if acc is None:
+            outcomes[r["status"]] = {k: r[k] for k in ("count", "mae_sum", "max_mae", "min_mae")}
+        else:
+            acc["count"] += r["count"]
+            acc["mae_sum"] += r["mae_sum"]
+            acc["max_mae"] = max(acc["max_mae"], r["max_mae"])
+            acc["min_mae"] = min(acc["min_mae"], r["min_mae"])
+        paired = r["count"] if r["status"] == "completed_paired" else 0
+        n, p = counts.get(r["bucket_idx"], (0, 0))
+        counts[r["bucket_idx"]] = (n + r["count"], p + paired)
+
+    by_outcome = [
+        {"status": status, "count": acc["count"],
+         "avg_mae": _safe_div(acc["mae_sum"], acc["count"], None),
+         "max_mae": acc["max_mae"]}
+        for status, acc in outcomes.items()
+    ]
+    # MAE bucket distribution
+    buckets = _label_buckets(
+        [{"bucket_idx": b, "count": n, "pair_rate": _safe_div(p, n, None)}
+         for b, (n, p) in counts.items()],
+        _MAE_LABELS,
+    )
 
-        # MAE by outcome (paired vs failed)
-        sql_by_outcome = f"""
-            SELECT
-                status,
-                COUNT(*) as count,
-                AVG(max_adverse_excursion_points) as avg_mae,
-                MAX(max_adverse_excursion_points) as max_mae
-            FROM Attempts
-            WHERE max_adverse_excursion_points IS NOT NULL {ps_clause}
-            GROUP BY status
-        """
-        by_outcome = await db.fetch_all(sql_by_outcome, ps_params)
+    total = sum(acc["count"] for acc in outcomes.values())
+    overall = {
+        "total": total,
+        "avg_mae": _safe_div(sum(acc["mae_sum"] for acc in outcomes.values()), total, None),
+        "max_mae": max((acc["max_mae"] for acc in outcomes.values()), default=None),
+        "min_mae": min((acc["min_mae"] for acc in outcomes.values()), default=None),
+    }
+    return {"overall": overall, "by_outcome": by_outcome, "buckets": buckets}
 
-        # MAE bucket distribution
-        sql_buckets = f"""
-            SELECT
-              CASE
-                WHEN max_adverse_excursion_points = 0 THEN '0 (no loss)'
-                WHEN max_adverse_excursion_points <= 2 THEN '1-2 pts'
-                WHEN max_adverse_excursion_points <= 5 THEN '3-5 pts'
-                WHEN max_adverse_excursion_points <= 10 THEN '6-10 pts'
-                ELSE '10+ pts'
-              END as bucket,
-              COUNT(*) as count,
-              AVG(CASE WHEN status='completed_paired' THEN 1.0 ELSE 0.0 END) as pair_rate
-            FROM Attempts
-            WHERE max_adverse_excursion_points IS NOT NULL {ps_clause}
-            GROUP BY bucket
-            ORDER BY MIN(max_adverse_excursion_points)
-        """
-        buckets = await db.fetch_all(sql_buckets, ps_params)
 
-    return {"overall": overall, "by_outcome": by_outcome, "buckets": buckets}
+_SPREAD_LABELS = ("Tight (<=2)", "Normal (3-4)", "Wide (5-6)", "Very wide (7+)")
 
 
+@_cached_metric
 async def get_spread_analysis(
     db_source: str,
     parameter_set_id: Optional[int] = None,
 ) -> dict:
-    """Spread at entry and exit analysis."""
-    ps_clause_where = "WHERE parameter_set_id = ?" if parameter_set_id else ""
-    ps_clause_and = "AND parameter_set_id = ?" if parameter_set_id else ""
+    """Spread at entry and exit analysis.
+
+    One scan grouped on the combined entry spread bucket (NULL when either
+    side is missing) returns additive entry/exit sums per group; the entry
+    and exit summaries are rolled up from them client-side.
+    """
+    ps_clause = "WHERE parameter_set_id = ?" if parameter_set_id else ""
     ps_params = [parameter_set_id] if parameter_set_id else []
 
+    paired_exit = "status = 'completed_paired' AND yes_spread_exit_points IS NOT NULL"
+    sql = f"""
+        SELECT
+          CASE
+            WHEN yes_spread_entry_points IS NULL
+              OR no_spread_entry_points IS NULL THEN NULL
+            WHEN (yes_spread_entry_points + no_spread_entry_points) <= 2 THEN 0
+            WHEN (yes_spread_entry_points + no_spread_entry_points) <= 4 THEN 1
+            WHEN (yes_spread_entry_points + no_spread_entry_points) <= 6 THEN 2
+            ELSE 3
+          END as bucket_idx,
+          COUNT(*) as attempts,
+          COUNT(*) FILTER (WHERE status='completed_paired') as pairs,
+          AVG(time_to_pair_seconds) FILTER (WHERE status='completed_paired') as avg_ttp,
+          SUM(yes_spread_entry_points) as yes_entry_sum,
+          COUNT(yes_spread_entry_points) as yes_entry_n,
+          MAX(yes_spread_entry_points) as yes_entry_max,
+          MIN(yes_spread_entry_points) as yes_entry_min,
+          SUM(no_spread_entry_points) as no_entry_sum,
+          COUNT(no_spread_entry_points) as no_entry_n,
+          MAX(no_spread_entry_points) as no_entry_max,
+          MIN(no_spread_entry_points) as no_entry_min,
+          SUM(yes_spread_exit_points) FILTER (WHERE {paired_exit}) as yes_exit_sum,
+          COUNT(yes_spread_exit_points) FILTER (WHERE {paired_exit}) as yes_exit_n,
+          MAX(yes_spread_exit_points) FILTER (WHERE {paired_exit}) as yes_exit_max,
+          SUM(no_spread_exit_points) FILTER (WHERE {paired_exit}) as no_exit_sum,
+          COUNT(no_spread_exit_points) FILTER (WHERE {paired_exit}) as no_exit_n,
+          MAX(no_spread_exit_points) FILTER (WHERE {paired_exit}) as no_exit_max
+        FROM Attempts {ps_clause}
+        GROUP BY bucket_idx
+    """
     async with _connect(db_source) as db:
-        # Entry spreads (all attempts)
-        sql_entry = f"""
-            SELECT
-                AVG(yes_spread_entry_points) as avg_yes_spread_entry,
-                AVG(no_spread_entry_points) as avg_no_spread_entry,
-                MAX(yes_spread_entry_points) as max_yes_spread_entry,
-                MAX(no_spread_entry_points) as max_no_spread_entry,
-                MIN(yes_spread_entry_points) as min_yes_spread_entry,
-                MIN(no_spread_entry_points) as min_no_spread_entry
-            FROM Attempts
-            {ps_clause_where}
-        """
-        entry = await db.fetch_one(sql_entry, ps_params)
+        rows = _add_pair_rate(await db.fetch_all(sql, ps_params))
 
-        # Exit spreads (paired only)
-        sql_exit = f"""
-            SELECT
-                AVG(yes_spread_exit_points) as avg_yes_spread_exit,
-                AVG(no_spread_exit_points) as avg_no_spread_exit,
-                MAX(yes_spread_exit_points) as max_yes_spread_exit,
-                MAX(no_spread_exit_points) as max_no_spread_exit
-            FROM Attempts
-            WHERE status = 'completed_paired'
-              AND yes_spread_exit_points IS NOT NULL
-              {ps_clause_and}
-        """
-        exit_data = await db.fetch_one(sql_exit, ps_params)
-
-        # Spread vs pair rate
-        sql_spread_rate = f"""
-            SELECT
-              CASE
-                WHEN (yes_spread_entry_points + no_spread_entry_points) <= 2 THEN 'Tight (<=2)'
-                WHEN (yes_spread_entry_points + no_spread_entry_points) <= 4 THEN 'Normal (3-4)'
-                WHEN (yes_spread_entry_points + no_spread_entry_points) <= 6 THEN 'Wide (5-6)'
-                ELSE 'Very wide (7+)'
-              END as combined_spread_bucket,
-              COUNT(*) as attempts,
-              SUM(CASE WHEN status='completed_paired' THEN 1 ELSE 0 END) as pairs,
-              AVG(CASE WHEN status='completed_paired' THEN 1.0 ELSE 0.0 END) as pair_rate,
-              AVG(CASE WHEN status='completed_paired' THEN time_to_pair_seconds END) as avg_ttp
-            FROM Attempts
-            WHERE yes_spread_entry_points IS NOT NULL
-              AND no_spread_entry_points IS NOT NULL
-              {ps_clause_and}
-            GROUP BY combined_spread_bucket
-            ORDER BY MIN(yes_spread_entry_points + no_spread_entry_points)
-        """
-        by_spread = await db.fetch_all(sql_spread_rate, ps_params)
+    def avg_of(col: str):
+        return _safe_div(
+            sum(r[f"{col}_sum"] or 0 for r in rows),
+            sum(r[f"{col}_n"] for r in rows),
+            None,
+        )
+
+    def max_of(col: str):
+        return max((r[col] for r in rows if r[col] is not None), default=None)
+
+    def min_of(col: str):
+        return min((r[col] for r in rows if r[col] is not None), default=None)
+
+    entry = {
+        "avg_yes_spread_entry": avg_of("yes_entry"),
+        "avg_no_spread_entry": avg_of("no_entry"),
+        "max_yes_spread_entry": max_of("yes_entry_max"),
+        "max_no_spread_entry": max_of("no_entry_max"),
+        "min_yes_spread_entry": min_of("yes_entry_min"),
+        "min_no_spread_entry": min_of("no_entry_min"),
+    }
+    exit_data = {
+        "avg_yes_spread_exit": avg_of("yes_exit"),
+        "avg_no_spread_exit": avg_of("no_exit"),
+        "max_yes_spread_exit": max_of("yes_exit_max"),
+        "max_no_spread_exit": max_of("no_exit_max"),
+    }
+    by_spread = _label_buckets(
+        [
+            {k: r[k] for k in ("bucket_idx", "attempts", "pairs", "pair_rate", "avg_ttp")}
+            for r in rows if r["bucket_idx"] is not None
+        ],
+        _SPREAD_LABELS,
+        name="combined_spread_bucket",
+    )
 
     return {"entry": entry, "exit": exit_data, "by_combined_spread": by_spread}
 
@@ -480,85 +1487,90 @@ async def get_stats_by_market_minute(
     parameter_set_id: Optional[int] = None,
 ) -> list[dict]:
     """Pair rate by position within the 15-min window (5 x 3-min buckets)."""
-    ps_clause = "WHERE parameter_set_id = ?" if parameter_set_id else ""
-    ps_params = [parameter_set_id] if parameter_set_id else []
-
-    sql = f"""
-        SELECT
-          CASE
-            WHEN time_remaining_at_start > 720 THEN '00-03 min'
-            WHEN time_remaining_at_start > 540 THEN '03-06 min'
-            WHEN time_remaining_at_start > 360 THEN '06-09 min'
-            WHEN time_remaining_at_start > 180 THEN '09-12 min'
-            ELSE                                    '12-15 min'
-          END as bucket,
-          COUNT(*) as attempts,
-          SUM(CASE WHEN status='completed_paired' THEN 1 ELSE 0 END) as pairs,
-          AVG(CASE WHEN status='completed_paired' THEN 1.0 ELSE 0.0 END) as pair_rate,
-          AVG(CASE WHEN status='completed_paired' THEN time_to_pair_seconds END) as avg_ttp,
-          AVG(
-            CASE
-              WHEN pair_profit_points IS NOT NULL THEN pair_profit_points
-              WHEN status = 'completed_failed' THEN -COALESCE(stop_loss_threshold_points, P1_points)
-            END
-          ) as avg_profit
-        FROM Attempts {ps_clause}
-        GROUP BY bucket
-        ORDER BY MIN(time_remaining_at_start) DESC
-    """
-    async with _connect(db_source) as db:
-        return await db.fetch_all(sql, ps_params)
+    stats = await get_all_stats_single_pass(db_source, parameter_set_id)
+    return stats["by_market_minute"]
 
 
+@_cached_metric
 async def get_cross_market_consistency(
     db_source: str,
     parameter_set_id: Optional[int] = None,
-) -> list[dict]:
-    """Per-market pair_rate, sorted for variance/consistency analysis."""
+    limit: int = 5,
+) -> dict:
+    """Spread of per-market pair_rate, plus the *limit* best and worst markets.
+
+    Markets with fewer than two attempts are skipped.  The mean, population
+    standard deviation and range are aggregated in SQL from power sums, so
+    only one summary row and at most ``2 * limit`` market rows come back.
+    Keys: ``markets``, ``avg_pair_rate``, ``stddev_pair_rate``,
+    ``min_pair_rate``, ``max_pair_rate``, ``top`` and ``bottom`` (both
+    ordered by pair_rate descending).
+    """
     ps_clause = "WHERE parameter_set_id = ?" if parameter_set_id else ""
     ps_params = [parameter_set_id] if parameter_set_id else []
 
-    sql = f"""
-        SELECT market_id,
-               COUNT(*) as attempts,
-               SUM(CASE WHEN status='completed_paired' THEN 1 ELSE 0 END) as pairs,
-               AVG(CASE WHEN status='completed_paired' THEN 1.0 ELSE 0.0 END) as pair_rate
-        FROM Attempts {ps_clause}
-        GROUP BY market_id
-        HAVING COUNT(*) >= 2
-        ORDER BY pair_rate DESC
+    per_market = f"""
+        WITH per_market AS (
+            SELECT market_id,
+                   COUNT(*) as attempts,
+                   COUNT(*) FILTER (WHERE status='completed_paired') as pairs,
+                   COUNT(*) FILTER (WHERE status='completed_paired') * 1.0 / COUNT(*) as pair_rate
+            FROM Attempts {ps_clause}
+            GROUP BY market_id
+            HAVING COUNT(*) >= 2
+        )
     """
-    async with _connect(db_source) as db:
-        return await db.fetch_all(sql, ps_params)
+    sql_summary = per_market + """
+        SELECT COUNT(*) as markets,
+               AVG(pair_rate) as avg_pair_rate,
+               AVG(pair_rate * pair_rate) as avg_sq_pair_rate,
+               MIN(pair_rate) as min_pair_rate,
+               MAX(pair_rate) as max_pair_rate
+        FROM per_market
+    """
+    sql_outliers = per_market + """
+        SELECT * FROM (
+            SELECT market_id, attempts, pairs, pair_rate,
+                   ROW_NUMBER() OVER (ORDER BY pair_rate DESC, market_id) as rn_top,
+                   ROW_NUMBER() OVER (ORDER BY pair_rate ASC, market_id DESC) as rn_bottom
+            FROM per_market
+        ) ranked
+        WHERE rn_top <= ? OR rn_bottom <= ?
+        ORDER BY rn_top
+    """
+    summary, outliers = await _gather_on(
+        db_source,
+        lambda db: db.fetch_one(sql_summary, ps_params),
+        lambda db: db.fetch_all(sql_outliers, ps_params + [limit, limit]),
+    )
+
+    avg = summary.get("avg_pair_rate")
+    avg_sq = summary.pop("avg_sq_pair_rate", None)
+    summary["stddev_pair_rate"] = (
+        max(float(avg_sq) - float(avg) ** 2, 0.0) ** 0.5 if avg is not None else None
+    )
+    top, bottom = [], []
+    for r in outliers:
+        rn_top, rn_bottom = r.pop("rn_top"), r.pop("rn_bottom")
+        if rn_top <= limit:
+            top.append(r)
+        if rn_bottom <= limit:
+            bottom.append(r)
+    return {**summary, "top": top, "bottom": bottom}
 
 
+@_cached_metric
 async def get_pair_cost_distribution(
     db_source: str,
     parameter_set_id: Optional[int] = None,
 ) -> list[dict]:
     """Cheap (<90), Medium (90-95), Expensive (>95)."""
-    ps_clause = "AND parameter_set_id = ?" if parameter_set_id else ""
-    ps_params = [parameter_set_id] if parameter_set_id else []
-
-    sql = f"""
-        SELECT
-          CASE
-            WHEN pair_cost_points < 90 THEN 'Cheap (<90)'
-            WHEN pair_cost_points <= 95 THEN 'Medium (90-95)'
-            ELSE 'Expensive (>95)'
-          END as bucket,
-          COUNT(*) as count,
-          AVG(pair_profit_points) as avg_profit,
-          AVG(time_to_pair_seconds) as avg_ttp
-        FROM Attempts
-        WHERE status = 'completed_paired' {ps_clause}
-        GROUP BY bucket
-        ORDER BY MIN(pair_cost_points)
-    """
     async with _connect(db_source) as db:
-        return await db.fetch_all(sql, ps_params)
+        rows = await _histogram(db, "pair_cost", parameter_set_id)
+    return _label_buckets(rows, _COST_LABELS)
 
 
+@_cached_metric
 async def get_failure_analysis(
     db_source: str,
     parameter_set_id: Optional[int] = None,
@@ -567,31 +1579,34 @@ async def get_failure_analysis(
     ps_clause = "AND parameter_set_id = ?" if parameter_set_id else ""
     ps_params = [parameter_set_id] if parameter_set_id else []
 
+    # Totals are rolled up from the per-reason rows rather than rescanned
+    sql = f"""
+        SELECT
+            fail_reason,
+            COUNT(*) as count,
+            AVG(closest_approach_points) as avg_closest_approach,
+            AVG(pair_profit_points) as avg_loss,
+            AVG(time_to_pair_seconds) as avg_time_active,
+            SUM(closest_approach_points) as closest_sum,
+            COUNT(closest_approach_points) as closest_n
+        FROM Attempts
+        WHERE status = 'completed_failed' {ps_clause}
+        GROUP BY fail_reason
+    """
     async with _connect(db_source) as db:
-        sql = f"""
-            SELECT
-                fail_reason,
-                COUNT(*) as count,
-                AVG(closest_approach_points) as avg_closest_approach,
-                AVG(pair_profit_points) as avg_loss,
-                AVG(time_to_pair_seconds) as avg_time_active
-            FROM Attempts
-            WHERE status = 'completed_failed' {ps_clause}
-            GROUP BY fail_reason
-        """
         by_reason = await db.fetch_all(sql, ps_params)
 
-        sql2 = f"""
-            SELECT COUNT(*) as total_failed,
-                   AVG(closest_approach_points) as avg_closest
-            FROM Attempts
-            WHERE status = 'completed_failed' {ps_clause}
-        """
-        totals = await db.fetch_one(sql2, ps_params)
+    closest_sum = sum(r.pop("closest_sum") or 0 for r in by_reason)
+    closest_n = sum(r.pop("closest_n") for r in by_reason)
+    totals = {
+        "total_failed": sum(r["count"] for r in by_reason),
+        "avg_closest": _safe_div(closest_sum, closest_n, None),
+    }
 
     return {"by_reason": by_reason, **totals}
 
 
+@_cached_metric
 async def get_profitability_projection(
     db_source: str,
     parameter_set_id: Optional[int] = None,
@@ -603,11 +1618,27 @@ async def get_profitability_projection(
     Uses formulas from PROJECT_SPEC §13.4:
       breakeven = L / (profit_avg + L)
       EV = R × profit_avg - (1 - R) × L
+
+    Counts, average pair profit and the distinct-market count come from a
+    single aggregate query; everything else is derived in Python.
     """
-    stats = await get_overall_stats(db_source, parameter_set_id)
-    total_att = stats.get("total_attempts", 0) or 0
-    total_pairs = stats.get("total_pairs", 0) or 0
-    avg_pair_profit = stats.get("avg_pair_profit") or 0
+    ps_clause = "WHERE parameter_set_id = ?" if parameter_set_id else ""
+    ps_params = [parameter_set_id] if parameter_set_id else []
+
+    sql = f"""
+        SELECT
+            COUNT(*) as total_attempts,
+            COUNT(*) FILTER (WHERE status='completed_paired') as total_pairs,
+            AVG(pair_profit_points) FILTER (WHERE status='completed_paired') as avg_pair_profit,
+            COUNT(DISTINCT market_id) as num_markets
+        FROM Attempts {ps_clause}
+    """
+    async with _connect(db_source) as db:
+        (stats,) = await db.fetch_records(sql, ps_params)
+
+    total_att = stats["total_attempts"] or 0
+    total_pairs = stats["total_pairs"] or 0
+    avg_pair_profit = stats["avg_pair_profit"] or 0
 
     R = _safe_div(total_pairs, total_att)
     L = exit_loss_points
@@ -619,16 +1650,7 @@ async def get_profitability_projection(
     # Markets per day: each asset has 4 markets/hour × 24h = 96
     markets_per_day = num_assets * 96
 
-    ps_clause = "WHERE parameter_set_id = ?" if parameter_set_id else ""
-    ps_params = [parameter_set_id] if parameter_set_id else []
-
-    async with _connect(db_source) as db:
-        row = await db.fetch_one(
-            f"SELECT COUNT(DISTINCT market_id) as n FROM Attempts {ps_clause}",
-            ps_params,
-        )
-        num_markets = row.get("n", 1) or 1
-
+    num_markets = stats["num_markets"] or 1
     avg_att_per_market = _safe_div(total_att, max(1, num_markets))
     attempts_per_day = markets_per_day * avg_att_per_market
     daily_ev = attempts_per_day * ev_per_attempt
@@ -650,29 +1672,45 @@ async def get_profitability_projection(
     }
 
 
+@_cached_metric
 async def get_parameter_comparison(db_source: str) -> list[dict]:
-    """Compare parameter sets grouped by delta, S0, and stop loss threshold."""
-    sql = """
+    """Compare parameter sets grouped by delta, S0, and stop loss threshold.
+
+    Attempts are aggregated per parameter set first, into additive sums
+    and counts, so only that small result is joined to ParameterSets and
+    re-grouped.  A parameter set without attempts still contributes one
+    unpaired row to pair_rate, as the row-level LEFT JOIN did.
+    """
+    sql = f"""
+        WITH agg AS (
+            SELECT
+                parameter_set_id,
+                COUNT(*) as attempts,
+                COUNT(*) FILTER (WHERE status='completed_paired') as pairs,
+                COUNT(*) FILTER (WHERE fail_reason='stop_loss') as stopped,
+                SUM(time_to_pair_seconds) FILTER (WHERE status='completed_paired') as ttp_sum,
+                COUNT(time_to_pair_seconds) FILTER (WHERE status='completed_paired') as ttp_n,
+                SUM({_PROFIT_EXPR}) as profit_sum,
+                COUNT({_PROFIT_EXPR}) as profit_n,
+                (SUM(CASE WHEN status='completed_paired' THEN pair_profit_points ELSE 0 END)
+                 + SUM(CASE WHEN status != 'completed_paired' AND pair_profit_points IS NOT NULL THEN pair_profit_points ELSE 0 END)
+                 - SUM(CASE WHEN status != 'completed_paired' AND pair_profit_points IS NULL THEN COALESCE(stop_loss_threshold_points, P1_points) ELSE 0 END)) as total_pnl
+            FROM Attempts
+            GROUP BY parameter_set_id
+        )
         SELECT
             p.S0_points  AS "S0_points",
             p.delta_points,
             p.stop_loss_threshold_points,
-            COUNT(a.attempt_id) as attempts,
-            SUM(CASE WHEN a.status='completed_paired' THEN 1 ELSE 0 END) as pairs,
-            SUM(CASE WHEN a.fail_reason='stop_loss' THEN 1 ELSE 0 END) as stopped,
-            AVG(CASE WHEN a.status='completed_paired' THEN 1.0 ELSE 0.0 END) as pair_rate,
-            AVG(CASE WHEN a.status='completed_paired' THEN a.time_to_pair_seconds END) as avg_ttp,
-            AVG(
-              CASE
-                WHEN a.pair_profit_points IS NOT NULL THEN a.pair_profit_points
-                WHEN a.status = 'completed_failed' THEN -COALESCE(a.stop_loss_threshold_points, a.P1_points)
-              END
-            ) as avg_profit,
-            (SUM(CASE WHEN a.status='completed_paired' THEN a.pair_profit_points ELSE 0 END)
-             + SUM(CASE WHEN a.status != 'completed_paired' AND a.pair_profit_points IS NOT NULL THEN a.pair_profit_points ELSE 0 END)
-             - SUM(CASE WHEN a.status != 'completed_paired' AND a.pair_profit_points IS NULL THEN COALESCE(a.stop_loss_threshold_points, a.P1_points) ELSE 0 END)) as total_pnl
+            COALESCE(SUM(agg.attempts), 0) as attempts,
+            COALESCE(SUM(agg.pairs), 0) as pairs,
+            COALESCE(SUM(agg.stopped), 0) as stopped,
+            SUM(COALESCE(agg.pairs, 0)) * 1.0 / SUM(COALESCE(agg.attempts, 1)) as pair_rate,
+            SUM(agg.ttp_sum) * 1.0 / NULLIF(SUM(agg.ttp_n), 0) as avg_ttp,
+            SUM(agg.profit_sum) * 1.0 / NULLIF(SUM(agg.profit_n), 0) as avg_profit,
+            COALESCE(SUM(agg.total_pnl), 0) as total_pnl
         FROM ParameterSets p
-        LEFT JOIN Attempts a ON p.parameter_set_id = a.parameter_set_id
+        LEFT JOIN agg ON agg.parameter_set_id = p.parameter_set_id
         GROUP BY p.S0_points, p.delta_points, p.stop_loss_threshold_points
         ORDER BY p.delta_points ASC, COALESCE(p.stop_loss_threshold_points, 0) ASC
     """
@@ -680,46 +1718,30 @@ async def get_parameter_comparison(db_source: str) -> list[dict]:
         return await db.fetch_all(sql)
 
 
+_PROXIMITY_LABELS = ("Within 1pt", "Within 2pt", "Within 5pt", "Within 10pt", "10pt+")
+
+
+@_cached_metric
 async def get_near_miss_analysis(
     db_source: str,
     parameter_set_id: Optional[int] = None,
 ) -> dict:
     """For failed attempts: distribution of closest approach to trigger."""
-    ps_clause = "AND parameter_set_id = ?" if parameter_set_id else ""
-    ps_params = [parameter_set_id] if parameter_set_id else []
-
+    # Frustration rate (% within 2 points) and the totals are rolled up
+    # from the bucket sums: buckets 0 and 1 are exactly "<= 2 points"
     async with _connect(db_source) as db:
-        sql = f"""
-            SELECT
-              CASE
-                WHEN closest_approach_points <= 1 THEN 'Within 1pt'
-                WHEN closest_approach_points <= 2 THEN 'Within 2pt'
-                WHEN closest_approach_points <= 5 THEN 'Within 5pt'
-                WHEN closest_approach_points <= 10 THEN 'Within 10pt'
-                ELSE '10pt+'
-              END as proximity,
-              COUNT(*) as count
-            FROM Attempts
-            WHERE status = 'completed_failed'
-              AND closest_approach_points IS NOT NULL
-              {ps_clause}
-            GROUP BY proximity
-            ORDER BY MIN(closest_approach_points)
-        """
-        buckets = await db.fetch_all(sql, ps_params)
-
-        # Frustration rate: % within 2 points
-        sql2 = f"""
-            SELECT
-                COUNT(*) as total,
-                SUM(CASE WHEN closest_approach_points <= 2 THEN 1 ELSE 0 END) as near_misses,
-                AVG(closest_approach_points) as avg_closest
-            FROM Attempts
-            WHERE status = 'completed_failed'
-              AND closest_approach_points IS NOT NULL
-              {ps_clause}
-        """
-        totals = await db.fetch_one(sql2, ps_params)
+        sums = await _bucket_sums(db, "proximity", parameter_set_id)
+
+    total = sum(t[0] for t in sums.values())
+    totals = {
+        "total": total,
+        "near_misses": sum(t[0] for b, t in sums.items() if b <= 1),
+        "avg_closest": _safe_div(sum(t[1] for t in sums.values()), total, None),
+    }
+    buckets = _label_buckets(
+        [{"bucket_idx": b, "count": t[0]} for b, t in sums.items()],
+        _PROXIMITY_LABELS, name="proximity",
+    )
 
     frustration_rate = _safe_div(
         totals.get("near_misses", 0), totals.get("total", 0)
@@ -732,6 +1754,7 @@ async def get_near_miss_analysis(
     }
 
 
+@_cached_metric
 async def get_stop_loss_analysis(
     db_source: str,
     parameter_set_id: Optional[int] = None,
@@ -745,41 +1768,94 @@ async def get_stop_loss_analysis(
     ps_clause = "AND a.parameter_set_id = ?" if parameter_set_id else ""
     ps_params = [parameter_set_id] if parameter_set_id else []
 
-    async with _connect(db_source) as db:
-        # Overall stop loss summary
-        sql_overall = f"""
-            SELECT
-                COUNT(*) as total_stopped,
-                AVG(time_to_pair_seconds) as avg_time_to_stop,
-                AVG(pair_profit_points) as avg_loss_per_stop,
-                SUM(pair_profit_points) as total_stop_loss_pnl
-            FROM Attempts a
-            WHERE a.fail_reason = 'stop_loss' {ps_clause}
-        """
-        overall = await db.fetch_one(sql_overall, ps_params)
-
-        # Per threshold × delta breakdown
-        sql_breakdown = f"""
-            SELECT
-                a.delta_points,
-                a.stop_loss_threshold_points as threshold,
-                COUNT(*) as total_attempts,
-                SUM(CASE WHEN a.status = 'completed_paired' THEN 1 ELSE 0 END) as paired,
-                SUM(CASE WHEN a.fail_reason = 'stop_loss' THEN 1 ELSE 0 END) as stopped_out,
-                SUM(CASE WHEN a.fail_reason = 'settlement_reached'
-                              OR a.fail_reason = 'bot_shutdown' THEN 1 ELSE 0 END) as settlement_failed,
-                AVG(CASE WHEN a.status = 'completed_paired' THEN 1.0 ELSE 0.0 END) as pair_rate,
-                AVG(CASE WHEN a.status = 'completed_paired'
-                    THEN a.pair_profit_points END) as avg_pair_profit,
-                AVG(CASE WHEN a.fail_reason = 'stop_loss'
-                    THEN a.pair_profit_points END) as avg_stop_loss,
-                SUM(CASE WHEN a.pair_profit_points IS NOT NULL
-                    THEN a.pair_profit_points ELSE 0 END) as total_pnl
-            FROM Attempts a
-            WHERE a.stop_loss_threshold_points IS NOT NULL {ps_clause}
-            GROUP BY a.delta_points, a.stop_loss_threshold_points
-            ORDER BY a.delta_points ASC, a.stop_loss_threshold_points ASC
-        """
-        breakdown = await db.fetch_all(sql_breakdown, ps_params)
+    # Overall stop loss summary
+    sql_overall = f"""
+        SELECT
+            COUNT(*) as total_stopped,
+            AVG(time_to_pair_seconds) as avg_time_to_stop,
+            AVG(pair_profit_points) as avg_loss_per_stop,
+            SUM(pair_profit_points) as total_stop_loss_pnl
+        FROM Attempts a
+        WHERE a.fail_reason = 'stop_loss' {ps_clause}
+    """
+
+    # Per threshold × delta breakdown
+    sql_breakdown = f"""
+        SELECT
+            a.delta_points,
+            a.stop_loss_threshold_points as threshold,
+            COUNT(*) as total_attempts,
+            COUNT(*) FILTER (WHERE a.status = 'completed_paired') as paired,
+            COUNT(*) FILTER (WHERE a.fail_reason = 'stop_loss') as stopped_out,
+            COUNT(*) FILTER (WHERE a.fail_reason = 'settlement_reached'
+                                OR a.fail_reason = 'bot_shutdown') as settlement_failed,
+            AVG(a.pair_profit_points)
+                FILTER (WHERE a.status = 'completed_paired') as avg_pair_profit,
+            AVG(a.pair_profit_points)
+                FILTER (WHERE a.fail_reason = 'stop_loss') as avg_stop_loss,
+            SUM(CASE WHEN a.pair_profit_points IS NOT NULL
+                THEN a.pair_profit_points ELSE 0 END) as total_pnl
+        FROM Attempts a
+        WHERE a.stop_loss_threshold_points IS NOT NULL {ps_clause}
+        GROUP BY a.delta_points, a.stop_loss_threshold_points
+        ORDER BY a.delta_points ASC, a.stop_loss_threshold_points ASC
+    """
+    overall, breakdown = await _gather_on(
+        db_source,
+        lambda db: db.fetch_one(sql_overall, ps_params),
+        lambda db: db.fetch_all(sql_breakdown, ps_params),
+    )
+    _add_pair_rate(breakdown, "paired", "total_attempts")
 
     return {"overall": overall, "breakdown": breakdown}
+
+
+# ---------------------------------------------------------------------------
+# Report driver
+# ---------------------------------------------------------------------------
+
+async def run_all_metrics(
+    db_source: str,
+    parameter_set_id: Optional[int] = None,
+    crypto_asset: Optional[str] = None,
+    date_after: Optional[str] = None,
+) -> dict:
+    """Run every report query concurrently and return the results by section.
+
+    The queries are independent, so they are gathered rather than awaited
+    one by one; at most ``_READ_POOL_SIZE`` run at once on either backend.
+    If one section fails the others are cancelled before the error
+    propagates, so none is left running when the caller closes the pools.
+    """
+    limit = asyncio.Semaphore(_READ_POOL_SIZE)
+
+    async def bounded(coro):
+        try:
+            async with limit:
+                return await coro
+        finally:
+            # Cancelled while queued on the semaphore: *coro* never started
+            coro.close()
+
+    sections = {
+        "overall": get_overall_stats(db_source, parameter_set_id, crypto_asset, date_after),
+        "by_asset": get_stats_by_asset(db_source, parameter_set_id),
+        "distributions": get_distributions_vectorized(db_source, parameter_set_id),
+        "breakdowns": get_all_stats_single_pass(db_source, parameter_set_id),
+        "mae": get_mae_analysis(db_source, parameter_set_id),
+        "spread": get_spread_analysis(db_source, parameter_set_id),
+        "failures": get_failure_analysis(db_source, parameter_set_id),
+        "stop_loss": get_stop_loss_analysis(db_source, parameter_set_id),
+        "near_miss": get_near_miss_analysis(db_source, parameter_set_id),
+        "consistency": get_cross_market_consistency(db_source, parameter_set_id),
+        "parameter_comparison": get_parameter_comparison(db_source),
+        "projection": get_profitability_projection(db_source, parameter_set_id),
+    }
+    gathered = await _gather_all(*(bounded(c) for c in sections.values()))
+    results = dict(zip(sections, gathered))
+    # The single-pass breakdowns fan out into their own report sections
+    results.update(results.pop("breakdowns"))
+    distributions = results.pop("distributions")
+    results["ttp_distribution"] = distributions["time_to_pair"]
+    results["pair_cost"] = distributions["pair_cost"]
+    return results
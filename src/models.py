@@ -3,7 +3,7 @@
 All price fields use integer points (1 point = $0.01).
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Optional
@@ -106,7 +106,7 @@ class MarketInfo:
     open_interest: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Snapshot:
     """Orderbook snapshot captured at a measurement cycle."""
     market_id: str
@@ -133,9 +133,12 @@ class Snapshot:
     no_period_low_bid_points: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Attempt:
-    """A single measurement attempt tracking one potential hedged pair."""
+    """A single measurement attempt tracking one potential hedged pair.
+
+    Slotted: the DB layer reads ~20 fields per row on every batch write.
+    """
     attempt_id: int
     market_id: str
     parameter_set_id: int
@@ -188,20 +191,50 @@ class Attempt:
     stop_loss_threshold_points: Optional[int] = None  # denormalized from param set
     stop_loss_price_points: Optional[int] = None       # P1 - threshold; runtime-only, not persisted
 
+    # --- Cached enum value (first_leg_side never changes after creation) ---
+    first_leg_side_value: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.first_leg_side_value = self.first_leg_side.value
 
-@dataclass
-class LifecycleRecord:
-    """Per-cycle tracking row for an active attempt.
+
+@dataclass(slots=True)
+class LifecycleBatch:
+    """Per-cycle tracking rows for active attempts, stored column-wise.
 
     Written to the ``AttemptLifecycle`` table when
     ``enable_lifecycle_tracking`` is on.  High-volume — disabled by default.
+    Every row in a batch belongs to the same cycle, so ``cycle_number`` and
+    ``timestamp`` are held once rather than per row.
     """
-    attempt_id: int
     cycle_number: int
     timestamp: datetime
-    opposite_ask_points: Optional[int]
-    distance_to_trigger: Optional[int]
-    closest_approach_so_far: Optional[int]
+    attempt_ids: list[int] = field(default_factory=list)
+    opposite_ask_points: list[Optional[int]] = field(default_factory=list)
+    distances_to_trigger: list[Optional[int]] = field(default_factory=list)
+    closest_approaches: list[Optional[int]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.attempt_ids)
+
+    def append(
+        self,
+        attempt_id: int,
+        opposite_ask_points: Optional[int],
+        distance_to_trigger: Optional[int],
+        closest_approach_so_far: Optional[int],
+    ) -> None:
+        self.attempt_ids.append(attempt_id)
+        self.opposite_ask_points.append(opposite_ask_points)
+        self.distances_to_trigger.append(distance_to_trigger)
+        self.closest_approaches.append(closest_approach_so_far)
+
+    def extend(self, other: "LifecycleBatch") -> None:
+        """Append *other*'s rows (same cycle) to this batch."""
+        self.attempt_ids.extend(other.attempt_ids)
+        self.opposite_ask_points.extend(other.opposite_ask_points)
+        self.distances_to_trigger.extend(other.distances_to_trigger)
+        self.closest_approaches.extend(other.closest_approaches)
 
 
 @dataclass
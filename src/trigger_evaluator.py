@@ -19,7 +19,7 @@ from typing import Optional
 from .models import (
     Attempt,
     AttemptStatus,
-    LifecycleRecord,
+    LifecycleBatch,
     MarketInfo,
     ParameterSet,
     Side,
@@ -45,7 +45,7 @@ class CycleResult:
     skip_reason: str = ""
     anomaly: bool = False
     anomaly_detail: str = ""
-    lifecycle_records: list[LifecycleRecord] = field(default_factory=list)
+    lifecycle: Optional[LifecycleBatch] = None
 
 
 # ---------------------------------------------------------------------------
@@ -495,6 +495,7 @@ class TriggerEvaluator:
 
         # Lifecycle records (only for pre-existing attempts with DB IDs)
         if self.enable_lifecycle:
+            lifecycle = result.lifecycle = LifecycleBatch(cycle_number, cycle_time)
             for attempt in self.active_attempts:
                 if id(attempt) in pre_existing_ids:
                     opp_ask = (
@@ -507,16 +508,10 @@ class TriggerEvaluator:
                         if opp_ask is not None
                         else None
                     )
-                    result.lifecycle_records.append(LifecycleRecord(
-                        attempt_id=attempt.attempt_id,
-                        cycle_number=cycle_number,
-                        timestamp=cycle_time,
-                        opposite_ask_points=opp_ask,
-                        distance_to_trigger=dist,
-                        closest_approach_so_far=self._closest_approach.get(
-                            id(attempt)
-                        ),
-                    ))
+                    lifecycle.append(
+                        attempt.attempt_id, opp_ask, dist,
+                        self._closest_approach.get(id(attempt)),
+                    )
 
         # Track concurrency peak
         self.max_concurrent = max(self.max_concurrent, len(self.active_attempts))
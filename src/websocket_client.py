@@ -8,7 +8,6 @@ exponential backoff.
 import asyncio
 import json
 import logging
-import time
 from datetime import datetime, timezone
 from typing import Callable, Optional
 
@@ -48,7 +47,10 @@ class WebSocketClient:
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
         self._connected = asyncio.Event()
         self._running = False
-        self._last_message_time: Optional[float] = None
+        self._last_message_monotonic: Optional[float] = None
+
+        # Pending "book has bid+ask" events per asset_id (see book_ready_event)
+        self._book_ready: dict[str, asyncio.Event] = {}
 
         # Background tasks
         self._listen_task: Optional[asyncio.Task] = None
@@ -62,14 +64,30 @@ class WebSocketClient:
         return self._connected.is_set()
 
     @property
-    def last_message_time(self) -> Optional[float]:
-        """Epoch timestamp of the last received WS message."""
-        return self._last_message_time
+    def last_message_monotonic(self) -> Optional[float]:
+        """Event-loop clock (``loop.time()``) of the last received WS message."""
+        return self._last_message_monotonic
 
     def get_orderbook(self, asset_id: str) -> Optional[TokenOrderbook]:
         """Return the current orderbook for a token, or None."""
         return self._orderbooks.get(asset_id)
 
+    def book_ready_event(self, asset_id: str) -> asyncio.Event:
+        """Return an event that is set once the token has both a bid and an ask.
+
+        Already set if the book is populated when called.  Lets callers
+        await initial data instead of polling ``get_orderbook``.
+        """
+        event = self._book_ready.get(asset_id)
+        if event is None:
+            event = asyncio.Event()
+            ob = self._orderbooks.get(asset_id)
+            if ob and ob.best_bid is not None and ob.best_ask is not None:
+                event.set()
+            else:
+                self._book_ready[asset_id] = event
+        return event
+
     def reset_period_stats(self, asset_id: str) -> None:
         """Reset period-extreme trackers to current values.
 
@@ -126,6 +144,7 @@ class WebSocketClient:
         for aid in asset_ids:
             self._subscribed_ids.discard(aid)
             self._orderbooks.pop(aid, None)
+            self._book_ready.pop(aid, None)
 
         if self._ws and self._connected.is_set():
             msg = json.dumps({"assets_ids": asset_ids, "operation": "unsubscribe"})
@@ -187,10 +206,11 @@ class WebSocketClient:
                     self._connected.set()
 
                     # Listen for messages until disconnect
+                    loop_time = asyncio.get_running_loop().time
                     async for raw_msg in ws:
                         if not self._running:
                             break
-                        self._last_message_time = time.time()
+                        self._last_message_monotonic = loop_time()
                         self._handle_raw_message(raw_msg)
 
             except ConnectionClosed as e:
@@ -251,6 +271,12 @@ class WebSocketClient:
         else:
             logger.debug("Unknown WS event type: %s", event_type)
 
+        # Only tokens someone is waiting on pay for this check
+        ready = self._book_ready.get(asset_id)
+        if ready is not None and ob.best_bid is not None and ob.best_ask is not None:
+            del self._book_ready[asset_id]
+            ready.set()
+
     # --- Event handlers ---
 
     def _handle_book_event(self, ob: TokenOrderbook, event: dict) -> None: